@@ -176,7 +176,7 @@ class BaseEngine(ABC):
             # 检查是否从 LinkGateway 调用
             if "LinkGateway" in filename or "gateway.py" in filename:
                 # 进一步检查是否从合法方法调用
-                if func_name in ["forward_request", "send_request", "proxy_request", "send_async_request"]:
+                if func_name in ["forward_request", "send_request", "proxy_request", "send_async_request", "call"]:
                     return True
         
         # 如果允许直接调用（用于测试），返回 True
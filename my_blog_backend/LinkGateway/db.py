@@ -1,11 +1,13 @@
 import os
 from sqlalchemy import Column, String, Integer, Boolean, Text, DateTime, Enum
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, select, update, bindparam
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.session import Session
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from datetime import datetime
 from enum import Enum as PyEnum
+from .logs import get_logger
 
 # 创建基本模型类
 Base = declarative_base()
@@ -63,6 +65,7 @@ class DatabaseManager:
         self.db_path = db_path
         self.engine = None
         self.SessionLocal = None
+        self.logger = get_logger("DatabaseManager")
         
         # 初始化数据库
         self._init_db()
@@ -174,6 +177,39 @@ class DatabaseManager:
             self.logger.error(f"更新服务失败: {str(e)}")
             return False
     
+    def bulk_upsert_services(self, services: list) -> bool:
+        """
+        批量新增或更新服务注册信息，全部写入在同一个事务中完成
+        字段相同的记录合并为一条 INSERT ... ON CONFLICT(service_id) DO UPDATE 语句批量执行，
+        只更新记录中提供的字段，与 update_service 一致
+        
+        Args:
+            services: 服务信息字典列表
+            
+        Returns:
+            bool: 写入成功返回True，失败返回False
+        """
+        if not services:
+            return True
+        
+        groups = {}
+        for service_info in services:
+            groups.setdefault(tuple(service_info), []).append(service_info)
+        
+        now = datetime.now()
+        try:
+            with self.engine.begin() as conn:
+                for keys, rows in groups.items():
+                    stmt = sqlite_insert(ServiceRegistry)
+                    update_columns = {key: stmt.excluded[key] for key in keys if key != "service_id"}
+                    update_columns["updated_at"] = now
+                    stmt = stmt.on_conflict_do_update(index_elements=["service_id"], set_=update_columns)
+                    conn.execute(stmt, rows)
+            return True
+        except Exception as e:
+            self.logger.error(f"批量写入服务失败: {str(e)}")
+            return False
+    
     def get_service(self, service_id: str) -> ServiceRegistry:
         """
         获取服务注册信息
@@ -223,6 +259,33 @@ class DatabaseManager:
             self.logger.error(f"列出服务失败: {str(e)}")
             return []
     
+    def list_services_raw(self) -> list:
+        """
+        以元组形式列出所有服务注册信息，只查询加载注册表所需的列，不创建ORM对象
+        
+        Returns:
+            list: (service_id, service_name, service_type, version, status, reason, description,
+                database_config, api_config, business_path, engine_type) 元组列表，枚举列为枚举对象
+        """
+        try:
+            with self.engine.connect() as conn:
+                return conn.execute(select(
+                    ServiceRegistry.service_id,
+                    ServiceRegistry.service_name,
+                    ServiceRegistry.service_type,
+                    ServiceRegistry.version,
+                    ServiceRegistry.status,
+                    ServiceRegistry.reason,
+                    ServiceRegistry.description,
+                    ServiceRegistry.database_config,
+                    ServiceRegistry.api_config,
+                    ServiceRegistry.business_path,
+                    ServiceRegistry.engine_type
+                )).all()
+        except Exception as e:
+            self.logger.error(f"列出服务失败: {str(e)}")
+            return []
+    
     def delete_service(self, service_id: str) -> bool:
         """
         删除服务注册信息
@@ -278,6 +341,42 @@ class DatabaseManager:
             self.logger.error(f"更新服务状态失败: {str(e)}")
             return False
     
+    def bulk_update_status(self, updates: list) -> bool:
+        """
+        批量更新服务状态，全部更新在同一个事务中以一条 UPDATE 语句批量执行
+        与 update_service_status 一致，只更新已存在的服务
+        
+        Args:
+            updates: (服务ID, 服务状态, 状态变更原因) 元组列表
+            
+        Returns:
+            bool: 更新成功返回True，失败返回False
+        """
+        if not updates:
+            return True
+        
+        table = ServiceRegistry.__table__
+        stmt = (
+            update(table)
+            .where(table.c.service_id == bindparam("b_service_id"))
+            .values(
+                status=bindparam("b_status", type_=table.c.status.type),
+                reason=bindparam("b_reason"),
+                last_check_at=datetime.now()
+            )
+        )
+        rows = [
+            {"b_service_id": service_id, "b_status": status, "b_reason": reason}
+            for service_id, status, reason in updates
+        ]
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(stmt, rows)
+            return True
+        except Exception as e:
+            self.logger.error(f"批量更新服务状态失败: {str(e)}")
+            return False
+    
     def service_exists(self, service_id: str) -> bool:
         """
         检查服务是否已存在
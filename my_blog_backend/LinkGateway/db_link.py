@@ -419,6 +419,17 @@ class DatabaseLinkManager:
             self.logger.error(f"断开所有数据库连接失败: {str(e)}")
             return False
     
+    def reset_after_fork(self) -> None:
+        """
+        在 fork 出的子进程中丢弃继承自父进程的连接池与会话，之后按需重新建立连接
+        不关闭继承的连接，避免影响父进程或其他子进程正在使用的连接
+        """
+        for connection in self.connections.values():
+            engine = connection.get("engine")
+            if engine:
+                engine.dispose(close=False)
+        self.sessions.clear()
+    
     def init_database(self, service_id: str, models: List[Any]) -> bool:
         """
         初始化数据库，创建所有表
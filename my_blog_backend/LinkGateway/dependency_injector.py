@@ -1,6 +1,23 @@
+from dataclasses import dataclass
 from typing import Dict, Any, Optional
 
 
+@dataclass(slots=True, frozen=True)
+class CoreBundle:
+    """
+    核心组件集合，供插件等组件一次性获取全部核心组件
+    """
+    registry: Any
+    api_mapper: Any
+    service_proxy: Any
+    plugin_manager: Any
+    inner_comm: Any
+    outer_comm: Any
+    db_link: Any
+    auth_manager: Any
+    path_manager: Any
+    logger: Any
+
 class DependencyInjector:
     """
     依赖注入器
@@ -15,6 +32,8 @@ class DependencyInjector:
             gateway: LinkGateway 实例
         """
         self._services: Dict[str, Any] = {}
+        # 核心组件集合缓存，首次获取时创建，注册服务后失效
+        self._core_bundle: Optional[CoreBundle] = None
         
         # 注册核心组件
         self._register_service('gateway', gateway)
@@ -38,6 +57,7 @@ class DependencyInjector:
             instance: 服务实例
         """
         self._services[name] = instance
+        self._core_bundle = None
     
     def register(self, name: str, instance: Any) -> None:
         """
@@ -151,6 +171,31 @@ class DependencyInjector:
         """
         return self.get('logger')
     
+    def get_core_bundle(self) -> CoreBundle:
+        """
+        获取核心组件集合，结果会被缓存直到有服务重新注册
+        
+        Returns:
+            CoreBundle: 核心组件集合
+        """
+        bundle = self._core_bundle
+        if bundle is None:
+            services = self._services
+            bundle = CoreBundle(
+                registry=services.get('registry'),
+                api_mapper=services.get('api_mapper'),
+                service_proxy=services.get('service_proxy'),
+                plugin_manager=services.get('plugin_manager'),
+                inner_comm=services.get('inner_comm'),
+                outer_comm=services.get('outer_comm'),
+                db_link=services.get('db_link'),
+                auth_manager=services.get('auth_manager'),
+                path_manager=services.get('path_manager'),
+                logger=services.get('logger'),
+            )
+            self._core_bundle = bundle
+        return bundle
+    
     def list_services(self) -> Dict[str, Any]:
         """
         列出所有已注册的服务
@@ -1,26 +1,42 @@
 import os
 import sys
+import json
 import uuid
+import asyncio
+import socket
+import time
+import signal
 import logging
 from typing import Dict, Any, List, Optional
-from fastapi import FastAPI, Request, Response
+import uvicorn
+from fastapi import FastAPI, Request, Response, HTTPException
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.routing import APIRoute
 from .registry import ServiceRegistry
 from .db_link import DatabaseLinkManager
 from .api_mapper import APIMapper
 from .inner_comm import InnerCommunicator
 from .outer_comm import OuterCommunicator
 from .auth import AuthManager
-from .logs import get_logger
+from .logs import get_logger, global_log_manager, UvicornLogHandler
 from .path_manager import PathManager
 from .service_proxy import ServiceProxy
 from .dependency_injector import DependencyInjector
+from .protocol import BatchItem
+from .plugin import PluginManager
 
 class LinkGateway:
     """
     LinkGateway核心类，作为整个通信核心的枢纽，协调各个组件的工作
     """
     
+    # 单次批量调用允许的最大调用数量
+    BATCH_MAX_ITEMS = 64
+    # 预加载模式下，WORKER_RESTART_WINDOW 秒内工作进程意外退出超过 WORKER_RESTART_LIMIT 次时停止服务
+    WORKER_RESTART_LIMIT = 5
+    WORKER_RESTART_WINDOW = 60.0
+    
     def __init__(self, base_path: str, debug: bool = False):
         """
         初始化LinkGateway
@@ -34,6 +50,8 @@ class LinkGateway:
         
         # 初始化路径管理器，用于获取日志路径
         self.path_manager = PathManager(base_path)
+        # 一次性创建网关的数据与日志目录
+        self.path_manager.warmup()
         
         # 配置日志，设置日志文件路径
         log_path = self.path_manager.get_linkgateway_log_path()
@@ -42,6 +60,11 @@ class LinkGateway:
         # 生成实例ID，用于标识当前LinkGateway实例
         self.instance_id = str(uuid.uuid4())[:8]
         
+        # 服务列表的预序列化JSON，注册中心的服务版本号变化后重建
+        self._services_json: Optional[bytes] = None
+        self._service_json_by_id: Dict[str, bytes] = {}
+        self._services_json_version: Optional[int] = None
+        
         try:
             self.logger.log_progress("正在初始化核心组件", service_id="LinkGateway", request_id=self.instance_id)
             
@@ -54,7 +77,6 @@ class LinkGateway:
             
             self.service_proxy = ServiceProxy(self.registry)
             
-            from .plugin import PluginManager
             self.plugin_manager = PluginManager(self)
             
             self.dependency_injector = DependencyInjector(self)
@@ -131,17 +153,19 @@ class LinkGateway:
         
         @self.app.get("/services")
         async def list_services():
-            return self.registry.list_services()
+            self._ensure_services_json()
+            return Response(content=self._services_json, media_type="application/json")
         
         @self.app.get("/services/{service_id}")
         async def get_service(service_id: str):
-            service = self.registry.get_service(service_id)
-            if not service:
+            self._ensure_services_json()
+            service_json = self._service_json_by_id.get(service_id)
+            if service_json is None:
                 return {
                     "error": "Service not found",
                     "service_id": service_id
                 }
-            return service
+            return Response(content=service_json, media_type="application/json")
         
         @self.app.get("/services/{service_id}/health")
         async def check_service_health_endpoint(service_id: str):
@@ -160,6 +184,7 @@ class LinkGateway:
             重新加载所有服务
             """
             result = self.registry.reload_services()
+            self._rebuild_services_json()
             return {
                 "status": "ok",
                 "result": result
@@ -197,6 +222,7 @@ class LinkGateway:
                             "/services/reload",
                             "/apis",
                             "/routes",
+                            "/batch",
                             "/interaction-rule"
                         ]
                     },
@@ -215,7 +241,6 @@ class LinkGateway:
         
         @self.app.get("/routes")
         async def list_routes():
-            from fastapi.routing import APIRoute
             routes = []
             for route in self.app.routes:
                 if isinstance(route, APIRoute):
@@ -226,6 +251,24 @@ class LinkGateway:
                     })
             return routes
         
+        @self.app.post("/batch")
+        async def batch(requests: List[BatchItem]):
+            """
+            批量调用引擎，多个调用并发执行，按请求顺序返回结果
+            每个调用与代理接口一样经过 action 与引擎健康检查，单个调用失败不影响其他调用
+            """
+            if len(requests) > self.BATCH_MAX_ITEMS:
+                raise HTTPException(
+                    status_code=413,
+                    detail={"error": f"Batch size {len(requests)} exceeds limit {self.BATCH_MAX_ITEMS}"}
+                )
+            tasks = [self._call_engine_async(r.engine_id, r.action, r.data) for r in requests]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            return [
+                self._batch_error(result, item) if isinstance(result, Exception) else result
+                for item, result in zip(requests, results)
+            ]
+        
         @self.app.get("/interaction-rule")
         async def get_interaction_rule():
             """
@@ -240,6 +283,44 @@ class LinkGateway:
                 ]
             }
     
+    async def _call_engine_async(self, engine_id: str, action: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        在线程池中经服务代理调用引擎，避免同步的引擎处理阻塞事件循环
+        
+        Args:
+            engine_id: 引擎ID
+            action: 请求动作
+            data: 请求数据
+            
+        Returns:
+            Dict[str, Any]: 处理结果，与代理接口的返回结构一致
+            
+        Raises:
+            HTTPException: action为空、引擎不存在或不健康时抛出
+        """
+        return await asyncio.to_thread(self.service_proxy.call_engine, engine_id, action, data)
+    
+    @staticmethod
+    def _batch_error(error: Exception, item: BatchItem) -> Dict[str, Any]:
+        """
+        将批量调用中单个调用的异常转换为错误结果
+        
+        Args:
+            error: 异常对象
+            item: 对应的调用
+            
+        Returns:
+            Dict[str, Any]: 错误结果
+        """
+        result = {"status": "error", "engine_id": item.engine_id, "action": item.action}
+        if isinstance(error, HTTPException):
+            result["status_code"] = error.status_code
+            detail = error.detail
+            result["error"] = detail.get("error", str(detail)) if isinstance(detail, dict) else str(detail)
+        else:
+            result["error"] = str(error)
+        return result
+    
     def start(self, host: str = "0.0.0.0", port: int = 8000) -> None:
         """
         启动LinkGateway
@@ -260,6 +341,8 @@ class LinkGateway:
             
             self.logger.log_progress("加载插件", service_id="LinkGateway", request_id=request_id)
             plugin_result = self.plugin_manager.load_plugins()
+            # 安装了 watchdog 时监听插件目录，插件文件变化后自动热重载
+            self.plugin_manager.start_watching()
             
             self.logger.log_progress("发现服务", service_id="LinkGateway", request_id=request_id)
             service_result = self.discover_services()
@@ -267,9 +350,6 @@ class LinkGateway:
             self.logger.log_progress("映射API", service_id="LinkGateway", request_id=request_id)
             api_result = self.map_apis()
             
-            import uvicorn
-            from .logs import UvicornLogHandler
-            
             self.logger.log("INFO", f"启动FastAPI服务在{host}:{port}", True, service_id="LinkGateway", request_id=request_id)
             
             # 配置 uvicorn 使用我们的日志处理器（在 uvicorn.run 之前配置）
@@ -285,14 +365,24 @@ class LinkGateway:
             uvicorn_access_logger.propagate = False
             uvicorn_access_logger.addHandler(UvicornLogHandler(self.logger))
             
-            uvicorn.run(
-                self.app, 
-                host=host, 
+            # 非调试模式下关闭访问日志与彩色输出，减少每个请求的日志格式化开销
+            # 事件循环与 HTTP 实现交给 uvicorn 自动选择：已安装 uvloop/httptools 时使用它们，否则回退到 asyncio/h11
+            uvicorn_options = dict(
+                host=host,
                 port=port,
                 log_level="info",
-                access_log=True,
-                use_colors=True
+                access_log=self.debug,
+                use_colors=self.debug,
+                loop="auto",
+                http="auto"
             )
+            
+            # LINKGATEWAY_ZYGOTE=1 时由当前进程 fork 出多个工作进程，共享已加载的插件与服务
+            if os.environ.get("LINKGATEWAY_ZYGOTE") == "1" and hasattr(os, "fork"):
+                workers = int(os.environ.get("LINKGATEWAY_WORKERS") or os.cpu_count() or 1)
+                self._serve_forked_workers(uvicorn.Config(self.app, **uvicorn_options), workers, request_id)
+            else:
+                uvicorn.run(self.app, **uvicorn_options)
         except Exception as e:
             self.logger.error(f"LinkGateway启动失败: {str(e)}", service_id="LinkGateway", request_id=request_id)
             # 尝试优雅关闭
@@ -302,6 +392,124 @@ class LinkGateway:
                 pass
             raise
     
+    def _serve_forked_workers(self, config: uvicorn.Config, workers: int, request_id: str) -> None:
+        """
+        预先加载插件与服务后 fork 出多个工作进程，共同监听同一个套接字
+        模块与插件对象以写时复制方式共享，启动开销只在父进程中付出一次
+        父进程只负责管理工作进程：收到 SIGTERM/SIGINT 时转发给工作进程并等待其退出，
+        工作进程意外退出时重新 fork，短时间内退出过于频繁则停止全部工作进程
+        
+        Args:
+            config: uvicorn 配置
+            workers: 工作进程数量
+            request_id: 请求ID
+        """
+        sock = config.bind_socket()
+        self.logger.info(f"以预加载模式启动 {workers} 个工作进程", service_id="LinkGateway", request_id=request_id)
+        
+        # 插件目录监听线程不能跨 fork 继承，在父进程中停止，由每个工作进程各自重新启动
+        watching = self.plugin_manager.watcher.is_running
+        if watching:
+            self.plugin_manager.stop_watching()
+        
+        children = set()
+        shutting_down = False
+        
+        def spawn_worker() -> None:
+            # fork 前停止日志监听线程并写出缓冲中的日志（同时取消 CSV 日志的定时刷新线程）
+            global_log_manager.before_fork()
+            pid = os.fork()
+            if pid == 0:
+                # 子进程：恢复默认信号处理并重建不能跨进程共享的资源后运行服务，
+                # 结束时直接退出，不执行父进程的清理逻辑
+                exit_code = 0
+                try:
+                    for signum in (signal.SIGTERM, signal.SIGINT):
+                        signal.signal(signum, signal.SIG_DFL)
+                    global_log_manager.after_fork(in_child=True)
+                    self._reset_after_fork()
+                    if watching:
+                        self.plugin_manager.start_watching()
+                    uvicorn.Server(config).run(sockets=[sock])
+                except BaseException:
+                    exit_code = 1
+                finally:
+                    global_log_manager.stop_queue_listener()
+                    os._exit(exit_code)
+            children.add(pid)
+            global_log_manager.after_fork(in_child=False)
+        
+        def forward_signal(signum, frame) -> None:
+            # 统一转发 SIGTERM：终端 Ctrl+C 时工作进程已直接收到 SIGINT，再转发 SIGINT 会使 uvicorn 强制退出
+            nonlocal shutting_down
+            shutting_down = True
+            for pid in list(children):
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+        
+        for _ in range(workers):
+            spawn_worker()
+        
+        previous_handlers = {
+            signum: signal.signal(signum, forward_signal) for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+        restart_times: List[float] = []
+        try:
+            while children:
+                try:
+                    pid, status = os.wait()
+                except ChildProcessError:
+                    break
+                if pid not in children:
+                    continue
+                children.discard(pid)
+                if shutting_down:
+                    continue
+                
+                now = time.monotonic()
+                restart_times = [t for t in restart_times if now - t < self.WORKER_RESTART_WINDOW]
+                exit_code = os.waitstatus_to_exitcode(status)
+                if len(restart_times) >= self.WORKER_RESTART_LIMIT:
+                    self.logger.error(
+                        f"工作进程 {pid} 退出（退出码 {exit_code}），重启过于频繁，停止所有工作进程",
+                        service_id="LinkGateway", request_id=request_id
+                    )
+                    forward_signal(signal.SIGTERM, None)
+                    continue
+                
+                self.logger.warning(
+                    f"工作进程 {pid} 意外退出（退出码 {exit_code}），重新启动",
+                    service_id="LinkGateway", request_id=request_id
+                )
+                restart_times.append(now)
+                spawn_worker()
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+            # 父进程被中断时通知仍在运行的工作进程退出，并回收它们，避免留下僵尸进程
+            for pid in children:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+            for pid in children:
+                try:
+                    os.waitpid(pid, 0)
+                except ChildProcessError:
+                    pass
+            sock.close()
+    
+    def _reset_after_fork(self) -> None:
+        """
+        在工作进程中重建继承自父进程的数据库连接池，避免多个进程共用同一连接
+        """
+        self.db_link.reset_after_fork()
+        db_manager = getattr(self.registry, "db_manager", None)
+        if db_manager is not None and db_manager.engine is not None:
+            db_manager.engine.dispose(close=False)
+    
     def _check_port_available(self, host: str, port: int) -> bool:
         """
         检查端口是否可用
@@ -313,7 +521,6 @@ class LinkGateway:
         Returns:
             bool: 端口可用返回True，否则返回False
         """
-        import socket
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
                 s.settimeout(1)
@@ -343,6 +550,7 @@ class LinkGateway:
             self._extract_discovery_summary(result)
             self._create_business_db_connections(result, request_id)
             self._register_engines_to_inner_comm(result, request_id)
+            self._rebuild_services_json()
             
             total_services = result.get("total_services", 0)
             self.logger.info(f"服务发现流程完成，共发现 {total_services} 个服务", service_id="LinkGateway", request_id=request_id)
@@ -351,6 +559,46 @@ class LinkGateway:
             self.logger.log("ERROR", f"服务发现: {str(e)}", False, service_id="LinkGateway", request_id=request_id)
             return self._get_default_discovery_result()
     
+    def _ensure_services_json(self) -> None:
+        """
+        注册中心的服务在上次序列化后发生过变化（注册、注销、健康状态更新等）时重建预序列化JSON
+        """
+        if self._services_json is None or self._services_json_version != self.registry.services_version:
+            self._rebuild_services_json()
+    
+    def _rebuild_services_json(self) -> None:
+        """
+        重建服务列表的预序列化JSON，使/services与/services/{service_id}无需每次请求重新序列化
+        """
+        # 先读取版本号再序列化，序列化期间发生的变化会在下次请求时再次触发重建
+        version = self.registry.services_version
+        self._services_json = self._encode_json(self.registry.list_services())
+        self._service_json_by_id = {
+            service_id: self._encode_json(service)
+            for service_id, service in tuple(self.registry.services.items())
+            if service
+        }
+        self._services_json_version = version
+    
+    @staticmethod
+    def _encode_json(content: Any) -> bytes:
+        """
+        按FastAPI JSONResponse的方式序列化内容
+        
+        Args:
+            content: 待序列化的内容
+            
+        Returns:
+            bytes: JSON字节串
+        """
+        return json.dumps(
+            jsonable_encoder(content),
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":")
+        ).encode("utf-8")
+    
     def _validate_discovery_result(self, result: Any, request_id: str) -> bool:
         """
         验证发现结果格式
@@ -442,7 +690,8 @@ class LinkGateway:
         """
         self.logger.debug("正在将引擎注册到 InnerCommunicator...", service_id="LinkGateway", request_id=request_id)
         
-        for engine_id, engine in self.registry.engines.items():
+        # 遍历快照，注册引擎期间注册表被修改也不影响遍历
+        for engine_id, engine in tuple(self.registry.engines.items()):
             try:
                 engine._allow_direct_call = True
                 self.inner_comm.register_engine(engine_id, engine)
@@ -553,6 +802,7 @@ class LinkGateway:
         
         # 关闭所有插件
         self.logger.info("正在关闭插件...", service_id="LinkGateway", request_id=request_id)
+        self.plugin_manager.stop_watching()
         self.plugin_manager.shutdown_plugins()
         
         # 断开所有数据库连接
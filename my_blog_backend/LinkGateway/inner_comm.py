@@ -1,5 +1,6 @@
-from typing import Dict, Any, Optional, List
-from .protocol import Request, Response
+from collections import deque
+from typing import Dict, Any, Optional, List, Tuple
+from .protocol import Request, new_request_id, _utcnow
 
 class InnerCommunicator:
     """
@@ -11,7 +12,72 @@ class InnerCommunicator:
         初始化内环通信器
         """
         self.engine_registry: Dict[str, Any] = {}
+        # 引擎注册表快照，注册/注销时重建，读路径遍历快照避免并发修改字典
+        self._engine_snapshot: Tuple[Tuple[str, Any], ...] = ()
         self.message_queue: List[Dict[str, Any]] = []
+        # 内部请求对象池，复用模型实例以省去pydantic校验开销
+        # 仅用于引擎间的可信数据，不用于对外API
+        self._request_pool: deque = deque(maxlen=64)
+    
+    def _acquire_request(self, service_id: str, action: str, data: Dict[str, Any]) -> Request:
+        """
+        从对象池获取请求对象，池为空时跳过校验直接构建
+        
+        Args:
+            service_id: 目标服务ID
+            action: 请求动作
+            data: 请求数据
+            
+        Returns:
+            Request: 请求对象
+        """
+        fields = {
+            "request_id": new_request_id(),
+            "service_id": service_id,
+            "timestamp": _utcnow(),
+            "action": action,
+            "data": data,
+            "auth": None
+        }
+        try:
+            request = self._request_pool.pop()
+        except IndexError:
+            return Request.model_construct(**fields)
+        request.__dict__.update(fields)
+        return request
+    
+    def _release_request(self, request: Request) -> None:
+        """
+        将请求对象归还对象池
+        
+        Args:
+            request: 请求对象
+        """
+        # 清空全部字段，池中对象不保留上一次请求的数据
+        request.__dict__.update(request_id=None, service_id=None, timestamp=None, action=None, data={}, auth=None)
+        self._request_pool.append(request)
+    
+    def _build_response_dict(self, request_id: str, code: int, data: Any = None, error: Optional[str] = None) -> Dict[str, Any]:
+        """
+        直接构建响应字典，无需构建Response模型
+        
+        Args:
+            request_id: 请求ID
+            code: 响应码，200表示成功
+            data: 响应数据
+            error: 错误信息
+            
+        Returns:
+            Dict[str, Any]: 与Response.success/failure(...).model_dump()结构一致的响应字典
+        """
+        return {
+            "request_id": request_id,
+            "timestamp": _utcnow(),
+            "status": "success" if code == 200 else "error",
+            "code": code,
+            "data": data or {},
+            "error": error
+        }
     
     def register_engine(self, engine_id: str, engine: Any) -> bool:
         """
@@ -25,6 +91,7 @@ class InnerCommunicator:
             bool: 注册成功返回True，失败返回False
         """
         self.engine_registry[engine_id] = engine
+        self._engine_snapshot = tuple(self.engine_registry.items())
         return True
     
     def unregister_engine(self, engine_id: str) -> bool:
@@ -37,10 +104,36 @@ class InnerCommunicator:
         Returns:
             bool: 注销成功返回True，失败返回False
         """
-        if engine_id in self.engine_registry:
+        try:
             del self.engine_registry[engine_id]
-            return True
-        return False
+        except KeyError:
+            return False
+        self._engine_snapshot = tuple(self.engine_registry.items())
+        return True
+    
+    def call(self, target_engine_id: str, action: str, data: Dict[str, Any] = None) -> Any:
+        """
+        直接调用目标引擎（内部快速路径）
+        
+        不构建 Request/Response 模型，直接返回引擎的处理结果，
+        供 LinkGateway 内部只关心负载数据的调用方使用
+        
+        Args:
+            target_engine_id: 目标引擎ID
+            action: 请求动作
+            data: 请求数据
+            
+        Returns:
+            Any: 引擎handle_request的原始返回值
+            
+        Raises:
+            ValueError: 目标引擎未注册
+        """
+        engine = self.engine_registry.get(target_engine_id)
+        if engine is None:
+            raise ValueError(f"Engine {target_engine_id} not found")
+        
+        return engine.handle_request(action, data or {})
     
     def send_request(self, target_engine_id: str, action: str, data: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
         """
@@ -54,19 +147,13 @@ class InnerCommunicator:
         Returns:
             Optional[Dict[str, Any]]: 请求结果，未找到目标引擎返回None
         """
-        # 检查目标引擎是否存在
-        if target_engine_id not in self.engine_registry:
+        # 获取目标引擎，不存在时返回None
+        engine = self.engine_registry.get(target_engine_id)
+        if engine is None:
             return None
         
-        # 获取目标引擎
-        engine = self.engine_registry[target_engine_id]
-        
-        # 构建请求
-        request = Request(
-            service_id=target_engine_id,
-            action=action,
-            data=data or {}
-        )
+        # 请求只用于生成请求ID，无需构建Request模型
+        request_id = new_request_id()
         
         # 发送请求并获取响应
         try:
@@ -74,21 +161,9 @@ class InnerCommunicator:
             response_data = engine.handle_request(action, data or {})
             
             # 构建响应
-            response = Response.success(
-                request_id=request.request_id,
-                data=response_data
-            )
-            
-            return response.dict()
+            return self._build_response_dict(request_id, 200, response_data)
         except Exception as e:
-            # 构建错误响应
-            response = Response.error(
-                request_id=request.request_id,
-                code=500,
-                error=str(e)
-            )
-            
-            return response.dict()
+            return self._build_response_dict(request_id, 500, error=str(e))
     
     def send_async_request(self, target_engine_id: str, action: str, data: Dict[str, Any] = None) -> str:
         """
@@ -102,12 +177,8 @@ class InnerCommunicator:
         Returns:
             str: 请求ID
         """
-        # 构建请求
-        request = Request(
-            service_id=target_engine_id,
-            action=action,
-            data=data or {}
-        )
+        # 构建请求，处理完成后归还对象池
+        request = self._acquire_request(target_engine_id, action, data or {})
         
         # 将请求加入消息队列
         self.message_queue.append({
@@ -126,14 +197,17 @@ class InnerCommunicator:
         """
         results = []
         
-        for message in self.message_queue:
+        # 先换出当前队列再处理，处理期间新加入的消息留待下一轮，不会被清空丢失
+        messages, self.message_queue = self.message_queue, []
+        
+        for message in messages:
             request = message["request"]
             target_engine_id = request.service_id
             
             result = self._process_single_message(request, target_engine_id)
             results.append(result)
+            self._release_request(request)
         
-        self.message_queue.clear()
         return results
     
     def _process_single_message(self, request: Any, target_engine_id: str) -> Dict[str, Any]:
@@ -147,42 +221,27 @@ class InnerCommunicator:
         Returns:
             Dict[str, Any]: 处理结果
         """
-        # 检查目标引擎是否存在
-        if target_engine_id not in self.engine_registry:
-            response = Response.error(
-                request_id=request.request_id,
-                code=404,
-                error=f"Engine {target_engine_id} not found"
-            )
+        # 获取目标引擎，不存在时返回错误
+        engine = self.engine_registry.get(target_engine_id)
+        if engine is None:
             return {
                 "request_id": request.request_id,
                 "status": "error",
-                "response": response.dict()
+                "response": self._build_response_dict(request.request_id, 404, error=f"Engine {target_engine_id} not found")
             }
         
-        engine = self.engine_registry[target_engine_id]
-        
         try:
             response_data = engine.handle_request(request.action, request.data)
-            response = Response.success(
-                request_id=request.request_id,
-                data=response_data
-            )
             return {
                 "request_id": request.request_id,
                 "status": "success",
-                "response": response.dict()
+                "response": self._build_response_dict(request.request_id, 200, response_data)
             }
         except Exception as e:
-            response = Response.error(
-                request_id=request.request_id,
-                code=500,
-                error=str(e)
-            )
             return {
                 "request_id": request.request_id,
                 "status": "error",
-                "response": response.dict()
+                "response": self._build_response_dict(request.request_id, 500, error=str(e))
             }
     
     def broadcast(self, action: str, data: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -199,7 +258,7 @@ class InnerCommunicator:
         results = {}
         
         # 向每个注册的引擎发送请求
-        for engine_id, engine in self.engine_registry.items():
+        for engine_id, engine in self._engine_snapshot:
             try:
                 # 调用引擎的handle_request方法
                 response_data = engine.handle_request(action, data or {})
@@ -235,4 +294,4 @@ class InnerCommunicator:
         Returns:
             List[str]: 引擎ID列表
         """
-        return list(self.engine_registry.keys())
+        return [engine_id for engine_id, _ in self._engine_snapshot]
@@ -1,18 +1,22 @@
+import io
 import os
 import sys
+import queue
+import time
+import threading
+import atexit
 import logging
-import csv
-from logging.handlers import TimedRotatingFileHandler
-import datetime
-import uuid
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 
-try:
-    from colorama import init
-    init()
-except ImportError:
-    pass
+# 只有 Windows 控制台需要 colorama 转换 ANSI 颜色码，其他平台不导入
+if sys.platform == "win32":
+    try:
+        from colorama import init
+        init()
+    except ImportError:
+        pass
 
 # 日志级别枚举
 class LogLevel(Enum):
@@ -22,6 +26,35 @@ class LogLevel(Enum):
     ERROR = "ERROR"
     CRITICAL = "CRITICAL"
 
+# 日志级别名称到 logging 常量的映射
+_LEVEL_MAP = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL
+}
+
+# 标准日志级别常量集合
+_LEVEL_NOS = frozenset(_LEVEL_MAP.values())
+
+# 状态字段的固定取值，直接合并到日志记录上，避免每次构造新字典
+_STATUS_SUCCESS = {'status': '成功'}
+_STATUS_FAILURE = {'status': '失败'}
+
+# 控制台消息截断长度，及截断后保留的字符数（预留"..."）
+_TRUNC_LEN = 100
+_TRUNC_LEN_M3 = _TRUNC_LEN - 3
+
+def _short_id() -> str:
+    """
+    生成8位十六进制的短请求ID，仅用于日志关联，无需UUID对象
+    
+    Returns:
+        str: 短请求ID
+    """
+    return os.urandom(4).hex()
+
 # 日志颜色配置
 class LogColor:
     RESET = "\033[0m"
@@ -43,12 +76,22 @@ class LogColor:
     }
 
 
+# 统一的 CSV 日志文件路径：<项目根目录>/log/logs.csv
+_CSV_LOG_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "log", "logs.csv")
+
+
 class CSVLogHandler(logging.Handler):
     """
     CSV 格式的日志处理器，将日志以表格形式存储
     统一存储到 log/logs.csv
+    日志行先写入内存缓冲区，超过 FLUSH_SIZE 或 FLUSH_INTERVAL 秒后一次性写入文件
     """
     
+    # 缓冲区达到该大小（字符数）时立即写入文件
+    FLUSH_SIZE = 64 * 1024
+    # 缓冲区中的日志最长等待时间（秒）
+    FLUSH_INTERVAL = 1.0
+    
     def __init__(self, filename: str, encoding: str = "utf-8"):
         """
         初始化 CSV 日志处理器
@@ -57,15 +100,27 @@ class CSVLogHandler(logging.Handler):
             filename: CSV 文件路径
             encoding: 文件编码
         """
+        # csv 模块只有启用 CSV 日志时才需要，延迟到创建处理器时导入
+        import csv
         super().__init__()
         self.filename = filename
         self.encoding = encoding
         self._ensure_file_exists()
+        # 持久化文件句柄，避免每条日志都重新打开/关闭文件
+        self._fh = open(self.filename, 'a', encoding=self.encoding, newline='', buffering=8192)
+        # 内存缓冲区，批量写入文件
+        self._buf = io.StringIO()
+        self._buf_writer = csv.writer(self._buf)
+        self._flush_timer: Optional[threading.Timer] = None
+        # 时间戳精确到秒，缓存上一秒的格式化结果
+        self._last_sec = -1
+        self._last_str = ""
     
     def _ensure_file_exists(self):
         """
         确保 CSV 文件存在并写入表头
         """
+        import csv
         if not os.path.exists(self.filename):
             # 确保目录存在
             log_dir = os.path.dirname(self.filename)
@@ -87,55 +142,228 @@ class CSVLogHandler(logging.Handler):
         """
         try:
             # 提取日志信息
-            timestamp = datetime.datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S')
+            sec = int(record.created)
+            if sec != self._last_sec:
+                self._last_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+                self._last_sec = sec
+            timestamp = self._last_str
             levelname = record.levelname
             service_id = getattr(record, 'service_id', 'unknown')
-            request_id = getattr(record, 'request_id', str(uuid.uuid4())[:8])
+            request_id = getattr(record, 'request_id', None)
+            if request_id is None:
+                request_id = _short_id()
             name = record.name
             message = record.getMessage()
             
-            # 写入 CSV 文件，保留完整消息
-            with open(self.filename, 'a', encoding=self.encoding, newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([timestamp, levelname, service_id, request_id, name, message])
+            # 写入缓冲区，保留完整消息（handle() 已持有 self.lock，写入线程安全）
+            self._buf_writer.writerow([timestamp, levelname, service_id, request_id, name, message])
+            if self._buf.tell() > self.FLUSH_SIZE:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
         except Exception:
             self.handleError(record)
+    
+    def flush(self):
+        """
+        将缓冲区中的日志一次性写入 CSV 文件
+        进程退出时由 logging.shutdown 调用，确保剩余日志落盘
+        """
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            data = self._buf.getvalue()
+            if data and not self._fh.closed:
+                self._buf.seek(0)
+                self._buf.truncate()
+                self._fh.write(data)
+                self._fh.flush()
+        finally:
+            self.release()
+    
+    def close(self):
+        """
+        写入剩余日志并关闭 CSV 文件句柄
+        """
+        self.acquire()
+        try:
+            self.flush()
+            if self._fh is not None and not self._fh.closed:
+                self._fh.close()
+        finally:
+            self.release()
+        super().close()
 
 
-class Logger:
+# 所有 Logger 共用的 CSV 日志处理器，首次使用时创建
+_CSV_HANDLER: Optional[CSVLogHandler] = None
+
+
+def _get_csv_handler() -> CSVLogHandler:
     """
-    日志工具类，实现彩色日志输出和日志滚动功能
-    控制台输出智能截断，文件和CSV输出保留完整信息
+    获取共用的 CSV 日志处理器
+    
+    Returns:
+        CSVLogHandler: CSV 日志处理器
+    """
+    global _CSV_HANDLER
+    if _CSV_HANDLER is None:
+        _CSV_HANDLER = CSVLogHandler(filename=_CSV_LOG_FILE, encoding="utf-8")
+        # CSV 仅记录警告及以上级别的日志
+        _CSV_HANDLER.setLevel(logging.WARNING)
+    return _CSV_HANDLER
+
+
+class BatchedRotatingFileHandler(TimedRotatingFileHandler):
+    """
+    按时间滚动的文件处理器，写入后不立即刷新
+    由 QueueDispatchHandler 在日志队列清空时统一刷新，一批日志只触发一次写入系统调用
     """
     
-    # 存储已初始化的logger名称，避免重复创建处理器
-    initialized_loggers = set()
+    # 标记该处理器需要由分发处理器批量刷新
+    deferred_flush = True
     
-    # 控制台日志最大长度
-    CONSOLE_MAX_LENGTH = 100
+    def flush(self):
+        """
+        单条日志写入后不刷新，关闭或滚动文件时由流自身刷新
+        """
     
-    @staticmethod
-    def _truncate_message(message: str, max_length: int = None) -> str:
+    def flush_batch(self):
+        """
+        将缓冲区中的日志写入文件
+        """
+        super().flush()
+
+
+class LeveledRotatingHandler(logging.Handler):
+    """
+    分级别的滚动文件处理器，按日志级别将记录写入三个文件之一
+    DEBUG/INFO 写入 .debug_info，WARNING 写入 .warning，ERROR/CRITICAL 写入 .error
+    每条记录只经过一次处理器加锁与一次文件写入，无需过滤器
+    """
+    
+    # 标记该处理器需要由分发处理器批量刷新
+    deferred_flush = True
+    
+    def __init__(self, base_log_file: str, formatter: logging.Formatter, encoding: str = "utf-8"):
         """
-        智能截断日志消息，保留关键信息
+        初始化分级别的滚动文件处理器
         
         Args:
-            message: 原始消息
-            max_length: 最大长度，默认使用类定义的CONSOLE_MAX_LENGTH
-            
-        Returns:
-            str: 截断后的消息
+            base_log_file: 基础日志文件路径
+            formatter: 日志格式化器
+            encoding: 文件编码
+        """
+        super().__init__(logging.DEBUG)
+        # 各级别文件的滚动周期与保留数量
+        self.debug_info_handler = BatchedRotatingFileHandler(
+            filename=f"{base_log_file}.debug_info", when="H", interval=1, backupCount=24, encoding=encoding, delay=True
+        )
+        self.warning_handler = BatchedRotatingFileHandler(
+            filename=f"{base_log_file}.warning", when="D", interval=1, backupCount=3, encoding=encoding, delay=True
+        )
+        self.error_handler = BatchedRotatingFileHandler(
+            filename=f"{base_log_file}.error", when="D", interval=1, backupCount=14, encoding=encoding, delay=True
+        )
+        self._file_handlers = (self.debug_info_handler, self.warning_handler, self.error_handler)
+        for handler in self._file_handlers:
+            handler.setFormatter(formatter)
+    
+    def emit(self, record: logging.LogRecord):
+        """
+        按日志级别选择目标文件并写入，滚动检查只针对目标文件
+        
+        Args:
+            record: 日志记录对象
+        """
+        levelno = record.levelno
+        if levelno >= logging.ERROR:
+            self.error_handler.emit(record)
+        elif levelno >= logging.WARNING:
+            self.warning_handler.emit(record)
+        else:
+            self.debug_info_handler.emit(record)
+    
+    def flush_batch(self):
+        """
+        将各级别文件缓冲区中的日志写入文件
+        """
+        for handler in self._file_handlers:
+            handler.flush_batch()
+    
+    def close(self):
+        """
+        关闭各级别的日志文件
+        """
+        for handler in self._file_handlers:
+            handler.close()
+        super().close()
+
+
+class QueueDispatchHandler(logging.Handler):
+    """
+    队列分发处理器，运行在 QueueListener 的后台线程中
+    按日志记录的 logger 名称将其分发给对应 Logger 的实际处理器
+    """
+    
+    def __init__(self, handlers_by_name: Dict[str, list], log_queue: Optional[queue.Queue] = None):
         """
-        if max_length is None:
-            max_length = Logger.CONSOLE_MAX_LENGTH
+        初始化队列分发处理器
         
-        if len(message) <= max_length:
-            return message
+        Args:
+            handlers_by_name: logger名称到实际处理器列表的映射
+            log_queue: 日志队列，队列清空时批量刷新延迟刷新的处理器
+        """
+        super().__init__()
+        self.handlers_by_name = handlers_by_name
+        self.log_queue = log_queue
+        self._pending_flush = set()
+    
+    def handle(self, record: logging.LogRecord) -> bool:
+        """
+        将日志记录分发给对应 logger 的实际处理器，遵循各处理器的级别
         
-        # 智能截断：优先保留ID、状态等关键信息
-        # 尝试保留最后的部分（通常是关键信息）
-        truncated = message[:max_length - 3] + "..."
-        return truncated
+        Args:
+            record: 日志记录对象
+        """
+        pending = self._pending_flush
+        for handler in self.handlers_by_name.get(record.name, ()):
+            if record.levelno >= handler.level and handler.handle(record) and getattr(handler, 'deferred_flush', False):
+                pending.add(handler)
+        
+        # 队列中没有待处理的日志时，统一刷新本批写入过的处理器
+        if pending and (self.log_queue is None or self.log_queue.empty()):
+            for handler in pending:
+                handler.flush_batch()
+            pending.clear()
+        return True
+    
+    def emit(self, record: logging.LogRecord):
+        """
+        发送日志记录
+        
+        Args:
+            record: 日志记录对象
+        """
+        self.handle(record)
+
+
+class Logger:
+    """
+    日志工具类，实现彩色日志输出和日志滚动功能
+    控制台输出智能截断，文件和CSV输出保留完整信息
+    """
+    
+    # 存储已初始化的logger名称，避免重复创建处理器
+    initialized_loggers = set()
+    
+    # 控制台日志最大长度
+    CONSOLE_MAX_LENGTH = _TRUNC_LEN
     
     def __init__(self, name: str = "LinkGateway", log_file: Optional[str] = None, log_type: str = "linkgateway"):
         """
@@ -170,11 +398,14 @@ class Logger:
             for handler in self.logger.handlers[:]:
                 self.logger.removeHandler(handler)
             
+            # 实际处理器由后台 QueueListener 线程执行，调用方只需将记录放入队列
+            self._handlers = []
+            
             # 配置控制台处理器，明确指定输出到stdout并强制刷新
             console_handler = logging.StreamHandler(stream=sys.stdout)
             console_handler.setLevel(logging.INFO)
             console_handler.setFormatter(self._get_console_formatter())
-            self.logger.addHandler(console_handler)
+            self._handlers.append(console_handler)
             
             # 配置文件处理器（如果指定了日志文件）
             if log_file:
@@ -186,6 +417,8 @@ class Logger:
                 # 为不同级别配置不同的日志处理器
                 self._configure_file_handlers(log_file)
             
+            self.logger.addHandler(global_log_manager.get_queue_handler(name, self._handlers))
+            
             # 标记为已初始化
             Logger.initialized_loggers.add(name)
     
@@ -209,29 +442,38 @@ class Logger:
                 self.name_width = 20
                 self.desc_width = 50
                 self.status_width = 10
+                # 级别集合固定，预先生成带颜色的级别前缀与状态标签
+                self._level_prefix = {
+                    level: f"{color}{level.ljust(self.level_width)}:{LogColor.RESET}"
+                    for level, color in LogColor.LEVEL_COLORS.items()
+                }
+                self._success = f"[{LogColor.GREEN}成功{LogColor.RESET}]"
+                self._failure = f"[{LogColor.RED}失败{LogColor.RESET}]"
             
             def format(self, record):
                 levelname = record.levelname
-                name = record.name
-                message = record.getMessage()
-                
-                level_color = LogColor.LEVEL_COLORS.get(levelname, LogColor.WHITE)
-                
-                level_display = f"{levelname.ljust(self.level_width)}:"
-                colored_level = f"{level_color}{level_display}{LogColor.RESET}"
-                
-                name_display = f"{name.ljust(self.name_width)}"
+                level_prefix = self._level_prefix.get(levelname)
+                if level_prefix is None:
+                    # 未知级别使用白色，生成后缓存，后续同名级别直接命中
+                    level_prefix = f"{LogColor.WHITE}{levelname.ljust(self.level_width)}:{LogColor.RESET}"
+                    self._level_prefix[levelname] = level_prefix
                 
                 status = getattr(record, 'status', None)
-                if status:
-                    status_color = LogColor.GREEN if status == '成功' else LogColor.RED
-                    status_display = f"[{status_color}{status}{LogColor.RESET}]"
-                else:
+                if not status:
                     status_display = ""
+                elif status == '成功':
+                    status_display = self._success
+                elif status == '失败':
+                    status_display = self._failure
+                else:
+                    status_display = f"[{LogColor.RED}{status}{LogColor.RESET}]"
                 
-                formatted_message = f"{colored_level}{name_display} | {message.ljust(self.desc_width)} {status_display}"
+                # 控制台超长消息截断，多行的启动树保持完整
+                message = record.getMessage()
+                if len(message) > _TRUNC_LEN and "\n" not in message:
+                    message = message[:_TRUNC_LEN_M3] + "..."
                 
-                return formatted_message
+                return f"{level_prefix}{record.name:<20} | {message:<50} {status_display}"
         
         return StructuredFormatter()
     
@@ -243,120 +485,68 @@ class Logger:
             logging.Formatter: 文件日志格式化器
         """
         class EnhancedFormatter(logging.Formatter):
+            def __init__(self):
+                # 格式字符串只在创建时解析一次
+                super().__init__(
+                    "%(asctime)s [%(levelname)s:] [%(service_id)s] [%(request_id)s] %(name)s | %(message)s",
+                    datefmt="%Y-%m-%d %H:%M:%S"
+                )
+            
             def format(self, record):
                 # 确保record有request_id属性
                 if not hasattr(record, 'request_id'):
-                    record.request_id = str(uuid.uuid4())[:8]
+                    record.request_id = _short_id()
                 
                 # 确保record有service_id属性
                 if not hasattr(record, 'service_id'):
                     record.service_id = 'unknown'
                 
-                # 格式化日志
-                log_format = "%(asctime)s [%(levelname)s:] [%(service_id)s] [%(request_id)s] %(name)s | %(message)s"
-                formatter = logging.Formatter(log_format, datefmt="%Y-%m-%d %H:%M:%S")
-                return formatter.format(record)
+                return super().format(record)
         
         return EnhancedFormatter()
     
     def _configure_file_handlers(self, base_log_file: str) -> None:
         """
         为不同级别配置不同的日志处理器
-        CSV文件统一存储到 log/logs.csv
+        CSV文件统一存储到 log/logs.csv，需设置 MYBLOG_CSV_LOG=1 启用
         
         Args:
             base_log_file: 基础日志文件路径
         """
         try:
-            self._add_debug_info_handler(base_log_file)
-            self._add_warning_handler(base_log_file)
-            self._add_error_critical_handler(base_log_file)
+            self._add_leveled_file_handler(base_log_file)
             self._add_csv_handler()
         except Exception as e:
             print(f"Warning: Failed to initialize file log handlers: {str(e)}")
     
-    def _add_debug_info_handler(self, base_log_file: str) -> None:
+    def _add_leveled_file_handler(self, base_log_file: str) -> None:
         """
-        添加DEBUG和INFO级别处理器
+        添加分级别的滚动文件处理器
         
         Args:
             base_log_file: 基础日志文件路径
         """
-        debug_info_handler = TimedRotatingFileHandler(
-            filename=f"{base_log_file}.debug_info",
-            when="H",
-            interval=1,
-            backupCount=24,
-            encoding="utf-8",
-            delay=True
-        )
-        debug_info_handler.setLevel(logging.DEBUG)
-        debug_info_handler.setFormatter(self._get_file_formatter())
-        debug_info_handler.addFilter(lambda record: record.levelno in (logging.DEBUG, logging.INFO))
-        self.logger.addHandler(debug_info_handler)
-    
-    def _add_warning_handler(self, base_log_file: str) -> None:
-        """
-        添加WARNING级别处理器
-        
-        Args:
-            base_log_file: 基础日志文件路径
-        """
-        warning_handler = TimedRotatingFileHandler(
-            filename=f"{base_log_file}.warning",
-            when="D",
-            interval=1,
-            backupCount=3,
-            encoding="utf-8",
-            delay=True
-        )
-        warning_handler.setLevel(logging.WARNING)
-        warning_handler.setFormatter(self._get_file_formatter())
-        warning_handler.addFilter(lambda record: record.levelno == logging.WARNING)
-        self.logger.addHandler(warning_handler)
-    
-    def _add_error_critical_handler(self, base_log_file: str) -> None:
-        """
-        添加ERROR和CRITICAL级别处理器
-        
-        Args:
-            base_log_file: 基础日志文件路径
-        """
-        error_critical_handler = TimedRotatingFileHandler(
-            filename=f"{base_log_file}.error",
-            when="D",
-            interval=1,
-            backupCount=14,
-            encoding="utf-8",
-            delay=True
-        )
-        error_critical_handler.setLevel(logging.ERROR)
-        error_critical_handler.setFormatter(self._get_file_formatter())
-        error_critical_handler.addFilter(lambda record: record.levelno in (logging.ERROR, logging.CRITICAL))
-        self.logger.addHandler(error_critical_handler)
+        self._handlers.append(LeveledRotatingHandler(base_log_file, self._get_file_formatter()))
     
     def _add_csv_handler(self) -> None:
         """
-        添加CSV文件处理器
+        添加CSV文件处理器，所有 Logger 共用同一个处理器实例
+        仅在环境变量 MYBLOG_CSV_LOG=1 时启用
         """
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        csv_log_file = os.path.join(project_root, "log", "logs.csv")
-        csv_handler = CSVLogHandler(
-            filename=csv_log_file,
-            encoding="utf-8"
-        )
-        csv_handler.setLevel(logging.DEBUG)
-        self.logger.addHandler(csv_handler)
+        if os.environ.get("MYBLOG_CSV_LOG") != "1":
+            return
+        self._handlers.append(_get_csv_handler())
     
-    def debug(self, message: str, **kwargs) -> None:
+    def debug(self, message: str, *args, **kwargs) -> None:
         """
         输出调试级别的日志
         
         Args:
-            message: 日志消息
+            message: 日志消息，可包含 % 格式占位符
+            *args: 格式化参数，仅在该级别启用时才格式化消息
             **kwargs: 额外的日志参数
         """
-        self._log(LogLevel.DEBUG.value, message, **kwargs)
+        self._log_int(logging.DEBUG, message, *args, **kwargs)
     
     def info(self, message: str, **kwargs) -> None:
         """
@@ -366,7 +556,7 @@ class Logger:
             message: 日志消息
             **kwargs: 额外的日志参数
         """
-        self._log(LogLevel.INFO.value, message, **kwargs)
+        self._log_int(logging.INFO, message, **kwargs)
     
     def warning(self, message: str, **kwargs) -> None:
         """
@@ -376,7 +566,7 @@ class Logger:
             message: 日志消息
             **kwargs: 额外的日志参数
         """
-        self._log(LogLevel.WARNING.value, message, **kwargs)
+        self._log_int(logging.WARNING, message, **kwargs)
     
     def error(self, message: str, **kwargs) -> None:
         """
@@ -386,7 +576,7 @@ class Logger:
             message: 日志消息
             **kwargs: 额外的日志参数
         """
-        self._log(LogLevel.ERROR.value, message, **kwargs)
+        self._log_int(logging.ERROR, message, **kwargs)
     
     def critical(self, message: str, **kwargs) -> None:
         """
@@ -396,7 +586,7 @@ class Logger:
             message: 日志消息
             **kwargs: 额外的日志参数
         """
-        self._log(LogLevel.CRITICAL.value, message, **kwargs)
+        self._log_int(logging.CRITICAL, message, **kwargs)
     
     def _log(self, level: str, message: str, **kwargs) -> None:
         """
@@ -407,7 +597,28 @@ class Logger:
             message: 日志消息
             **kwargs: 额外的日志参数，包括request_id、service_id和status（布尔值）
         """
-        request_id = kwargs.pop('request_id', str(uuid.uuid4())[:8])
+        self._log_int(_LEVEL_MAP[level], message, **kwargs)
+    
+    def _log_int(self, level_no: int, message: str, *args, **kwargs) -> None:
+        """
+        按 logging 级别常量输出日志，跳过级别名称的查表
+        
+        Args:
+            level_no: logging 级别常量
+            message: 日志消息，可包含 % 格式占位符
+            *args: 格式化参数，级别被屏蔽时不格式化
+            **kwargs: 额外的日志参数，包括request_id、service_id和status（布尔值）
+        """
+        # 级别被屏蔽或处于结构化输出模式时直接返回，不格式化消息，也不生成请求ID与额外信息
+        if self.is_structured_output_enabled or not self.logger.isEnabledFor(level_no):
+            return
+        
+        if args:
+            message = message % args
+        
+        request_id = kwargs.pop('request_id', None)
+        if request_id is None:
+            request_id = _short_id()
         service_id = kwargs.pop('service_id', self.log_type)
         status = kwargs.pop('status', None)
         
@@ -415,40 +626,30 @@ class Logger:
             extra_info = " ".join([f"{k}={v}" for k, v in kwargs.items()])
             message = f"{message} {extra_info}"
         
-        level_map = {
-            "DEBUG": logging.DEBUG,
-            "INFO": logging.INFO,
-            "WARNING": logging.WARNING,
-            "ERROR": logging.ERROR,
-            "CRITICAL": logging.CRITICAL
-        }
-        
-        extra = {
-            'request_id': request_id,
-            'service_id': service_id
-        }
-        
+        # 直接构造日志记录并设置属性，跳过调用栈查找与extra字典的逐键冲突检查
+        logger = self.logger
+        record = logger.makeRecord(logger.name, level_no, "(unknown file)", 0, message, None, None)
+        record.request_id = request_id
+        record.service_id = service_id
         if status is True:
-            extra['status'] = '成功'
+            record.__dict__.update(_STATUS_SUCCESS)
         elif status is False:
-            extra['status'] = '失败'
-        
-        if self.is_structured_output_enabled:
-            return
+            record.__dict__.update(_STATUS_FAILURE)
         
-        self.logger.log(level_map[level], message, extra=extra)
+        logger.handle(record)
     
-    def log(self, level: str, message: str, status: bool = None, **kwargs) -> None:
+    def log(self, level: Union[str, int], message: str, status: bool = None, **kwargs) -> None:
         """
         统一的日志输出方法
         
         Args:
-            level: 日志级别（INFO、ERROR、DEBUG、WARNING、CRITICAL）
+            level: 日志级别（INFO、ERROR、DEBUG、WARNING、CRITICAL），也可直接传入 logging 级别常量
             message: 日志消息
             status: 状态（True=成功，False=失败，None=无状态）
             **kwargs: 额外的日志参数
         """
-        self._log(level, message, status=status, **kwargs)
+        level_no = level if isinstance(level, int) else _LEVEL_MAP[level]
+        self._log_int(level_no, message, status=status, **kwargs)
     
     def log_success(self, message: str, **kwargs) -> None:
         """
@@ -458,7 +659,7 @@ class Logger:
             message: 日志消息
             **kwargs: 额外的日志参数
         """
-        self.log("INFO", message, True, **kwargs)
+        self._log_int(logging.INFO, message, status=True, **kwargs)
     
     def log_failure(self, message: str, **kwargs) -> None:
         """
@@ -468,7 +669,7 @@ class Logger:
             message: 日志消息
             **kwargs: 额外的日志参数
         """
-        self.log("ERROR", message, False, **kwargs)
+        self._log_int(logging.ERROR, message, status=False, **kwargs)
     
     def log_progress(self, message: str, **kwargs) -> None:
         """
@@ -478,7 +679,7 @@ class Logger:
             message: 日志消息
             **kwargs: 额外的日志参数
         """
-        self.log("INFO", message, None, **kwargs)
+        self._log_int(logging.INFO, message, status=None, **kwargs)
     
     def enable_structured_output(self) -> None:
         """
@@ -597,53 +798,72 @@ class Logger:
         if not self.is_structured_output_enabled:
             return
         
-        self.log("INFO", "初始化核心组件", True)
+        # 标题单独输出并带状态，树状明细拼接为一条多行日志，只经过一次处理器链
+        request_id = _short_id()
+        self.logger.log(logging.INFO, "初始化核心组件", extra={
+            'request_id': request_id,
+            'service_id': self.log_type,
+            'status': '成功'
+        })
+        
+        lines = []
+        plugins = self.collected_logs['plugins']
+        services = self.collected_logs['services']
+        apis = self.collected_logs['apis']
         
-        if self.collected_logs['plugins']['success'] or self.collected_logs['plugins']['failed']:
-            self.log("INFO", "├─ 插件管理器", True)
+        if plugins['success'] or plugins['failed']:
+            lines.append("├─ 插件管理器")
             
-            if self.collected_logs['plugins']['success']:
-                self.log("INFO", f"│   └─ 加载插件 ({len(self.collected_logs['plugins']['success'])}/{len(self.collected_logs['plugins']['success']) + len(self.collected_logs['plugins']['failed'])})", True)
-                
-                for i, plugin in enumerate(self.collected_logs['plugins']['success']):
-                    prefix = "│       ├─ " if i < len(self.collected_logs['plugins']['success']) - 1 else "│       └─ "
-                    self.log("INFO", f"{prefix}{plugin}", True)
-                
-                for i, plugin in enumerate(self.collected_logs['plugins']['failed']):
-                    prefix = "│       ├─ " if i < len(self.collected_logs['plugins']['failed']) - 1 else "│       └─ "
-                    self.log("ERROR", f"{prefix}{plugin}", False)
+            if plugins['success']:
+                lines.append(f"│   └─ 加载插件 ({len(plugins['success'])}/{len(plugins['success']) + len(plugins['failed'])})")
+                lines.extend(self._tree_lines(plugins['success']))
+                lines.extend(self._tree_lines(plugins['failed'], " [失败]"))
         
-        if self.collected_logs['services']['success'] or self.collected_logs['services']['failed']:
-            self.log("INFO", "├─ 服务发现", True)
+        if services['success'] or services['failed']:
+            lines.append("├─ 服务发现")
             
-            if self.collected_logs['services']['success']:
-                self.log("INFO", f"│   └─ 业务服务 ({len(self.collected_logs['services']['success'])}/{len(self.collected_logs['services']['success']) + len(self.collected_logs['services']['failed'])})", True)
-                
-                for i, service in enumerate(self.collected_logs['services']['success']):
-                    prefix = "│       ├─ " if i < len(self.collected_logs['services']['success']) - 1 else "│       └─ "
-                    self.log("INFO", f"{prefix}{service}", True)
-                
-                for i, service in enumerate(self.collected_logs['services']['failed']):
-                    prefix = "│       ├─ " if i < len(self.collected_logs['services']['failed']) - 1 else "│       └─ "
-                    self.log("ERROR", f"{prefix}{service}", False)
+            if services['success']:
+                lines.append(f"│   └─ 业务服务 ({len(services['success'])}/{len(services['success']) + len(services['failed'])})")
+                lines.extend(self._tree_lines(services['success']))
+                lines.extend(self._tree_lines(services['failed'], " [失败]"))
         
-        if self.collected_logs['apis']['success'] or self.collected_logs['apis']['failed']:
-            self.log("INFO", "└─ API映射", True)
+        if apis['success'] or apis['failed']:
+            lines.append("└─ API映射")
             
-            if self.collected_logs['apis']['success']:
-                self.log("INFO", f"│   └─ ({len(self.collected_logs['apis']['success'])})", True)
+            if apis['success']:
+                lines.append(f"│   └─ ({len(apis['success'])})")
         
         if self.collected_logs['warnings']:
-            self.log("INFO", "└─ 警告汇总 ({len(self.collected_logs['warnings'])})", None)
-            
-            for warning in self.collected_logs['warnings']:
-                self.log("WARNING", warning, None)
+            lines.append(f"└─ 警告汇总 ({len(self.collected_logs['warnings'])})")
+            lines.extend(self.collected_logs['warnings'])
         
         if self.collected_logs['errors']:
-            self.log("INFO", "└─ 错误汇总 ({len(self.collected_logs['errors'])})", None)
+            lines.append(f"└─ 错误汇总 ({len(self.collected_logs['errors'])})")
+            lines.extend(self.collected_logs['errors'])
+        
+        if lines:
+            self.logger.log(logging.INFO, "\n".join(lines), extra={
+                'request_id': request_id,
+                'service_id': self.log_type
+            })
+    
+    @staticmethod
+    def _tree_lines(items: list, suffix: str = "") -> list:
+        """
+        生成树状图中一组子节点的行
+        
+        Args:
+            items: 子节点名称列表
+            suffix: 追加在每行末尾的标记
             
-            for error in self.collected_logs['errors']:
-                self.log("ERROR", error, False)
+        Returns:
+            list: 带树状前缀的行列表
+        """
+        last = len(items) - 1
+        return [
+            f"{'│       ├─ ' if i < last else '│       └─ '}{item}{suffix}"
+            for i, item in enumerate(items)
+        ]
     
     def set_level(self, level: str) -> None:
         """
@@ -652,14 +872,7 @@ class Logger:
         Args:
             level: 日志级别（英文）
         """
-        level_map = {
-            "DEBUG": logging.DEBUG,
-            "INFO": logging.INFO,
-            "WARNING": logging.WARNING,
-            "ERROR": logging.ERROR,
-            "CRITICAL": logging.CRITICAL
-        }
-        self.logger.setLevel(level_map[level])
+        self.logger.setLevel(_LEVEL_MAP[level])
     
     def get_logger(self) -> logging.Logger:
         """
@@ -694,20 +907,10 @@ class UvicornLogHandler(logging.Handler):
             record: 日志记录对象
         """
         try:
-            message = record.getMessage()
-            levelname = record.levelname
-            
-            # 映射到我们的日志方法
-            if levelname == "DEBUG":
-                self.target_logger.debug(f"[uvicorn] {message}")
-            elif levelname == "INFO":
-                self.target_logger.info(f"[uvicorn] {message}")
-            elif levelname == "WARNING":
-                self.target_logger.warning(f"[uvicorn] {message}")
-            elif levelname == "ERROR":
-                self.target_logger.error(f"[uvicorn] {message}")
-            elif levelname == "CRITICAL":
-                self.target_logger.critical(f"[uvicorn] {message}")
+            # 直接按级别常量转发，只处理标准的五个级别
+            levelno = record.levelno
+            if levelno in _LEVEL_NOS:
+                self.target_logger._log_int(levelno, f"[uvicorn] {record.getMessage()}")
         except Exception:
             self.handleError(record)
 
@@ -721,6 +924,80 @@ class LogManager:
         self.loggers: Dict[str, Logger] = {}
         self.default_log_file: Optional[str] = None
         self.default_log_type: str = "linkgateway"
+        # 所有 Logger 共用一个日志队列与后台监听线程
+        self.log_queue: Optional[queue.Queue] = None
+        self.queue_listener: Optional[QueueListener] = None
+        self.queued_handlers: Dict[str, list] = {}
+        atexit.register(self.stop_queue_listener)
+    
+    def get_queue_handler(self, name: str, handlers: list) -> QueueHandler:
+        """
+        登记 logger 的实际处理器，并返回写入共享日志队列的 QueueHandler
+        首次调用时启动后台监听线程
+        
+        Args:
+            name: 日志名称
+            handlers: 实际处理器列表
+            
+        Returns:
+            QueueHandler: 队列处理器
+        """
+        self.queued_handlers[name] = handlers
+        if self.queue_listener is None:
+            self.log_queue = queue.Queue(-1)
+            self.queue_listener = QueueListener(self.log_queue, QueueDispatchHandler(self.queued_handlers, self.log_queue))
+            self.queue_listener.start()
+        return QueueHandler(self.log_queue)
+    
+    def stop_queue_listener(self) -> None:
+        """
+        停止后台监听线程，处理完队列中剩余的日志记录
+        """
+        if self.queue_listener is not None:
+            self.queue_listener.stop()
+            self.queue_listener = None
+            self.log_queue = None
+            self._flush_handlers()
+    
+    def _flush_handlers(self) -> None:
+        """
+        写出所有处理器缓冲中的日志，包括等待批量刷新的处理器
+        """
+        for handlers in self.queued_handlers.values():
+            for handler in handlers:
+                # 退出阶段控制台等流可能已被关闭，与 logging.shutdown 一样忽略此类错误
+                try:
+                    getattr(handler, "flush_batch", handler.flush)()
+                except (OSError, ValueError):
+                    pass
+    
+    def before_fork(self) -> None:
+        """
+        fork 前停止后台监听线程并写出所有缓冲中的日志，子进程不会继承未写出的日志或持锁的线程
+        CSV 处理器写出缓冲时会取消定时刷新线程，fork 后下一条日志写入时再重新创建
+        """
+        if self.queue_listener is not None:
+            self.queue_listener.stop()
+            self.queue_listener = None
+        self._flush_handlers()
+    
+    def after_fork(self, in_child: bool) -> None:
+        """
+        fork 后重新启动后台监听线程；子进程关闭继承的日志文件，下次写入时重新打开
+        
+        Args:
+            in_child: 是否在子进程中调用
+        """
+        if in_child:
+            for handlers in self.queued_handlers.values():
+                for handler in handlers:
+                    for file_handler in getattr(handler, "_file_handlers", (handler,)):
+                        if isinstance(file_handler, logging.FileHandler) and file_handler.stream is not None:
+                            file_handler.stream.close()
+                            file_handler.stream = None
+        if self.log_queue is not None and self.queue_listener is None:
+            self.queue_listener = QueueListener(self.log_queue, QueueDispatchHandler(self.queued_handlers, self.log_queue))
+            self.queue_listener.start()
     
     def get_logger(self, name: str, log_file: Optional[str] = None, log_type: str = "linkgateway") -> Logger:
         """
@@ -765,6 +1042,9 @@ class LogManager:
         """
         清理所有日志实例
         """
+        # 停止后台日志线程
+        self.stop_queue_listener()
+        self.queued_handlers.clear()
         # 清理已初始化的logger标记
         Logger.initialized_loggers.clear()
         # 清理日志实例
@@ -1,7 +1,16 @@
+import json
+import asyncio
 import httpx
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from .protocol import Request, Response
 
+# HTTP/2 依赖可选的 h2 包，未安装时退回 HTTP/1.1 连接池
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 class OuterCommunicator:
     """
     外环通信类，负责与网络引擎及外部系统的通信
@@ -11,7 +20,13 @@ class OuterCommunicator:
         """
         初始化外环通信器
         """
-        self.client = httpx.AsyncClient(timeout=30)
+        # 所有请求共用一个客户端，连接池按引擎扇出的并发量设置
+        self.client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(30.0, connect=2.0),
+            limits=httpx.Limits(max_connections=256, max_keepalive_connections=64, keepalive_expiry=30.0),
+            headers={"Content-Type": "application/json"}
+        )
         self.network_engines: Dict[str, Dict[str, Any]] = {}
     
     def register_network_engine(self, engine_id: str, engine_info: Dict[str, Any]) -> bool:
@@ -43,9 +58,9 @@ class OuterCommunicator:
             return True
         return False
     
-    async def send_request(self, target_engine_id: str, action: str, data: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+    def _build_request(self, target_engine_id: str, action: str, data: Dict[str, Any] = None) -> Optional[tuple]:
         """
-        发送请求到网络引擎
+        解析目标引擎地址并构建请求
         
         Args:
             target_engine_id: 目标引擎ID
@@ -53,56 +68,136 @@ class OuterCommunicator:
             data: 请求数据
             
         Returns:
-            Optional[Dict[str, Any]]: 请求结果，未找到目标引擎返回None
+            Optional[tuple]: (请求URL, 请求对象)，未找到目标引擎或地址返回None
         """
         # 检查目标引擎是否存在
-        if target_engine_id not in self.network_engines:
+        engine_info = self.network_engines.get(target_engine_id)
+        if engine_info is None:
             return None
         
-        # 获取目标引擎信息
-        engine_info = self.network_engines[target_engine_id]
         base_url = engine_info.get("base_url")
-        
         if not base_url:
             return None
         
-        # 构建请求URL
-        url = f"{base_url}/api/{action}"
-        
-        # 构建请求数据
         request = Request(
             service_id=target_engine_id,
             action=action,
             data=data or {}
         )
+        return f"{base_url}/api/{action}", request
+    
+    @staticmethod
+    def _decode_json(response: httpx.Response) -> Any:
+        """
+        直接从响应字节解析JSON，无响应体（如204）时返回空字典
+        
+        Args:
+            response: HTTP响应
+            
+        Returns:
+            Any: 解析后的数据
+        """
+        content = response.content
+        return json.loads(content) if content else {}
+    
+    @classmethod
+    def _map_response(cls, request: Request, response: httpx.Response) -> Dict[str, Any]:
+        """
+        将HTTP响应转换为请求结果
+        
+        Args:
+            request: 已发送的请求对象
+            response: HTTP响应
+            
+        Returns:
+            Dict[str, Any]: 请求结果，非2xx状态码时为错误响应
+        """
+        # 检查响应状态码
+        if 200 <= response.status_code < 300:
+            return cls._decode_json(response)
+        # 构建错误响应
+        return Response.failure(
+            request.request_id,
+            response.status_code,
+            f"HTTP error {response.status_code}: {response.text}"
+        ).model_dump()
+    
+    @staticmethod
+    def _map_request_error(request: Request, error: httpx.RequestError) -> Dict[str, Any]:
+        """
+        将请求异常转换为错误响应
+        
+        Args:
+            request: 已发送的请求对象
+            error: 请求异常
+            
+        Returns:
+            Dict[str, Any]: 错误响应
+        """
+        return Response.failure(
+            request.request_id,
+            500,
+            f"Request error: {str(error)}"
+        ).model_dump()
+    
+    async def send_request(self, target_engine_id: str, action: str, data: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+        """
+        发送请求到网络引擎
+        
+        Args:
+            target_engine_id: 目标引擎ID
+            action: 请求动作
+            data: 请求数据
+            
+        Returns:
+            Optional[Dict[str, Any]]: 请求结果，未找到目标引擎返回None
+        """
+        prepared = self._build_request(target_engine_id, action, data)
+        if prepared is None:
+            return None
+        url, request = prepared
         
         # 发送HTTP请求
         try:
-            response = await self.client.post(
-                url,
-                json=request.dict(),
-                headers={
-                    "Content-Type": "application/json"
-                }
-            )
+            response = await self.client.post(url, content=request.model_dump_json())
+        except httpx.RequestError as e:
+            return self._map_request_error(request, e)
+        return self._map_response(request, response)
+    
+    async def send_requests_batch(self, calls: List[Tuple[str, str, Dict[str, Any]]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        并发发送多个请求到网络引擎
+        
+        Args:
+            calls: 请求列表，每项为(目标引擎ID, 请求动作, 请求数据)
             
-            # 检查响应状态码
-            if response.status_code == 200:
-                return response.json()
+        Returns:
+            List[Optional[Dict[str, Any]]]: 与calls顺序一致的请求结果，未找到目标引擎的项为None
+        """
+        prepared = [self._build_request(engine_id, action, data) for engine_id, action, data in calls]
+        sent = [item for item in prepared if item is not None]
+        
+        # 所有请求同时发出，总耗时取决于最慢的一个
+        responses = await asyncio.gather(
+            *[self.client.post(url, content=request.model_dump_json()) for url, request in sent],
+            return_exceptions=True
+        )
+        
+        results: List[Optional[Dict[str, Any]]] = []
+        response_iter = iter(responses)
+        for item in prepared:
+            if item is None:
+                results.append(None)
+                continue
+            request = item[1]
+            response = next(response_iter)
+            if isinstance(response, httpx.RequestError):
+                results.append(self._map_request_error(request, response))
+            elif isinstance(response, BaseException):
+                raise response
             else:
-                # 构建错误响应
-                return Response.error(
-                    request_id=request.request_id,
-                    code=response.status_code,
-                    error=f"HTTP error {response.status_code}: {response.text}"
-                ).dict()
-        except httpx.RequestError as e:
-            # 构建错误响应
-            return Response.error(
-                request_id=request.request_id,
-                code=500,
-                error=f"Request error: {str(e)}"
-            ).dict()
+                results.append(self._map_response(request, response))
+        return results
     
     async def send_webhook(self, url: str, data: Dict[str, Any] = None) -> bool:
         """
@@ -118,13 +213,10 @@ class OuterCommunicator:
         try:
             response = await self.client.post(
                 url,
-                json=data or {},
-                headers={
-                    "Content-Type": "application/json"
-                }
+                json=data or {}
             )
             
-            return response.status_code == 200
+            return 200 <= response.status_code < 300
         except httpx.RequestError:
             return False
     
@@ -145,8 +237,8 @@ class OuterCommunicator:
                 params=params or {}
             )
             
-            if response.status_code == 200:
-                return response.json()
+            if 200 <= response.status_code < 300:
+                return self._decode_json(response)
             else:
                 return None
         except httpx.RequestError:
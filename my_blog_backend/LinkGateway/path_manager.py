@@ -1,5 +1,65 @@
 import os
 import json
+import time
+import threading
+# 纯字符串运算的路径函数绑定为模块级名称，省去每次调用的 os.path 属性查找
+from os.path import (
+    join as _join, isabs as _isabs, normpath as _normpath, split as _split,
+    basename as _basename, dirname as _dirname, relpath as _relpath, abspath as _abspath
+)
+import types
+import functools
+from typing import Iterable, Mapping
+from .logs import get_logger
+
+# 优先使用 orjson 解析与序列化 JSON，未安装时退回标准库
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _cached_path(func):
+    """
+    按参数缓存路径获取方法的结果，缓存存放在实例的 _path_cache 中
+    
+    Args:
+        func: 路径获取方法
+        
+    Returns:
+        包装后的方法
+    """
+    name = func.__name__
+    
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = (name, args, tuple(kwargs.items())) if kwargs else (name, args)
+        path = self._path_cache.get(key)
+        if path is None:
+            path = func(self, *args, **kwargs)
+            self._path_cache[key] = path
+        return path
+    
+    return wrapper
+
+
+# JSON文件不存在时返回的共享只读空映射，避免每次创建新字典
+_EMPTY_JSON: Mapping = types.MappingProxyType({})
+
+# POSIX 系统的绝对路径只以 / 开头，可用首字符判断
+_POSIX = os.name == "posix"
+
+# 不存在的JSON文件被缓存后，经过多少秒重新检查一次文件是否出现
+_MISSING_RECHECK_SECONDS = 1.0
+
 
 class PathManager:
     """
@@ -14,11 +74,93 @@ class PathManager:
             base_path: 项目根目录路径
         """
         self.base_path = base_path
-        self.data_dir = os.path.join(base_path, "data")
+        self.data_dir = _join(base_path, "data")
+        self.logger = get_logger("PathManager")
+        # 各类数据、日志与配置的上级目录只拼接一次
+        self._services_root = _join(self.data_dir, "services")
+        self._engines_root = _join(self.data_dir, "engine")
+        self._lg_root = _join(self.data_dir, "linkgateway")
+        self._log_root = _join(base_path, "log")
+        self._log_engines_root = _join(self._log_root, "engines")
+        self._log_services_root = _join(self._log_root, "services")
+        self._log_lg_root = _join(self._log_root, "linkgateway")
+        self._cfg_services_root = _join(base_path, "services")
+        self._cfg_engines_root = _join(base_path, "engines")
+        # 规范化的绝对路径只计算一次，路径校验时不再调用 abspath
+        self._abs_base_path = _abspath(base_path)
+        self._abs_data_dir = _normpath(_abspath(self.data_dir)) + os.sep
+        # 以下缓存可被多个线程同时使用，不加锁：单次 dict/set 读写在 CPython 中是原子的，
+        # 未命中时重复计算的结果相同，直接覆盖写入即可
+        # 本进程内已确保存在的目录，命中后不再访问文件系统
+        self._ensured_dirs: set = set()
+        # 路径结果缓存，键为(方法名, 参数)或(资源根目录, 子目录名称)
+        self._path_cache: dict = {}
+        # JSON文件解析结果缓存：路径 -> (修改时间, 文件大小, 内容)
+        # 文件不存在时为 (None, 下次检查的单调时钟时间, None)
+        self._json_cache: dict = {}
         
         # 确保数据根目录存在
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir, exist_ok=True)
+        self._ensure_dir(self.data_dir)
+    
+    def _ensure_dir(self, path: str) -> None:
+        """
+        确保目录存在，每个目录在本进程内只创建/检查一次
+        
+        Args:
+            path: 目录路径
+        """
+        if path in self._ensured_dirs:
+            return
+        # 目录通常已存在或只缺最后一级，先尝试一次 mkdir，父目录缺失时再逐级创建
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            os.makedirs(path, exist_ok=True)
+        self._ensured_dirs.add(path)
+    
+    def _resource_dir(self, root: str, name: str) -> str:
+        """
+        获取某类资源根目录下的子目录并确保其存在，各类数据与日志目录共用同一缓存
+        
+        Args:
+            root: 资源根目录
+            name: 子目录名称（服务ID或引擎名称）
+            
+        Returns:
+            str: 子目录路径
+        """
+        key = (root, name)
+        path = self._path_cache.get(key)
+        if path is None:
+            path = _join(root, name)
+            self._ensure_dir(path)
+            self._path_cache[key] = path
+        return path
+    
+    def ensure_dirs(self, paths: Iterable[str]) -> None:
+        """
+        批量确保目录存在，按路径长度排序以先创建父目录，子目录只需一次 mkdir
+        
+        Args:
+            paths: 目录路径列表
+        """
+        for path in sorted(set(paths), key=len):
+            self._ensure_dir(path)
+    
+    def warmup(self, service_ids: Iterable[str] = (), engine_names: Iterable[str] = ()) -> None:
+        """
+        启动时预先创建数据与日志目录，之后的路径获取不再访问文件系统
+        
+        Args:
+            service_ids: 需要数据目录的服务ID列表
+            engine_names: 需要数据目录的引擎名称列表
+        """
+        paths = [self._lg_root, self._log_root, self._log_lg_root]
+        paths.extend(_join(self._services_root, service_id) for service_id in service_ids)
+        paths.extend(_join(self._engines_root, engine_name) for engine_name in engine_names)
+        self.ensure_dirs(paths)
     
     def get_data_dir(self) -> str:
         """
@@ -40,10 +182,7 @@ class PathManager:
             str: 服务数据文件夹路径
         """
         # 服务数据存放在data/services目录下
-        service_dir = os.path.join(self.data_dir, "services", service_id)
-        if not os.path.exists(service_dir):
-            os.makedirs(service_dir, exist_ok=True)
-        return service_dir
+        return self._resource_dir(self._services_root, service_id)
     
     def get_engine_data_dir(self, engine_name: str) -> str:
         """
@@ -56,11 +195,9 @@ class PathManager:
             str: 引擎数据文件夹路径
         """
         # 引擎数据存放在data/engine目录下
-        engine_dir = os.path.join(self.data_dir, "engine", engine_name)
-        if not os.path.exists(engine_dir):
-            os.makedirs(engine_dir, exist_ok=True)
-        return engine_dir
+        return self._resource_dir(self._engines_root, engine_name)
     
+    @_cached_path
     def get_service_db_path(self, service_id: str, db_name: str = None) -> str:
         """
         获取服务数据库文件路径
@@ -75,8 +212,9 @@ class PathManager:
         if db_name is None:
             db_name = service_id
         service_dir = self.get_service_data_dir(service_id)
-        return os.path.join(service_dir, f"{db_name}.db")
+        return _join(service_dir, f"{db_name}.db")
     
+    @_cached_path
     def get_engine_db_path(self, engine_name: str, db_name: str = None) -> str:
         """
         获取引擎数据库文件路径
@@ -91,8 +229,9 @@ class PathManager:
         if db_name is None:
             db_name = engine_name
         engine_dir = self.get_engine_data_dir(engine_name)
-        return os.path.join(engine_dir, f"{db_name}.db")
+        return _join(engine_dir, f"{db_name}.db")
     
+    @_cached_path
     def get_linkgateway_db_path(self, db_name: str = "linkgateway") -> str:
         """
         获取LinkGateway核心数据库文件路径
@@ -104,11 +243,10 @@ class PathManager:
             str: LinkGateway核心数据库文件路径
         """
         # LinkGateway使用自己独立的数据库文件夹
-        lg_dir = os.path.join(self.data_dir, "linkgateway")
-        if not os.path.exists(lg_dir):
-            os.makedirs(lg_dir, exist_ok=True)
-        return os.path.join(lg_dir, f"{db_name}.db")
+        self._ensure_dir(self._lg_root)
+        return _join(self._lg_root, f"{db_name}.db")
     
+    @_cached_path
     def get_service_file_path(self, service_id: str, file_name: str) -> str:
         """
         获取服务的文件路径
@@ -121,8 +259,9 @@ class PathManager:
             str: 服务文件路径
         """
         service_dir = self.get_service_data_dir(service_id)
-        return os.path.join(service_dir, file_name)
+        return _join(service_dir, file_name)
     
+    @_cached_path
     def get_engine_file_path(self, engine_name: str, file_name: str) -> str:
         """
         获取引擎的文件路径
@@ -135,7 +274,7 @@ class PathManager:
             str: 引擎文件路径
         """
         engine_dir = self.get_engine_data_dir(engine_name)
-        return os.path.join(engine_dir, file_name)
+        return _join(engine_dir, file_name)
     
     def get_file_path(self, relative_path: str) -> str:
         """
@@ -147,9 +286,12 @@ class PathManager:
         Returns:
             str: 绝对路径
         """
-        if os.path.isabs(relative_path):
+        # POSIX 下以 / 开头即为绝对路径，无需调用 isabs
+        if _POSIX and relative_path[:1] == "/":
+            return relative_path
+        if _isabs(relative_path):
             return relative_path
-        return os.path.join(self.base_path, relative_path)
+        return _join(self.base_path, relative_path)
     
     def validate_path(self, path: str) -> bool:
         """
@@ -161,10 +303,12 @@ class PathManager:
         Returns:
             bool: 路径有效返回True，无效返回False
         """
-        # 获取绝对路径
-        abs_path = os.path.abspath(path)
-        # 检查路径是否在数据目录范围内
-        return abs_path.startswith(os.path.abspath(self.data_dir))
+        # 相对路径按项目根目录解析，规范化后与预先计算的数据目录前缀比较
+        if not _isabs(path):
+            path = _join(self._abs_base_path, path)
+        path = _normpath(path)
+        # 前缀带路径分隔符，避免 data_evil 之类的同前缀目录被误判
+        return path == self._abs_data_dir[:-1] or path.startswith(self._abs_data_dir)
     
     def clean_path(self, path: str) -> str:
         """
@@ -177,22 +321,24 @@ class PathManager:
             str: 清理后的路径
         """
         # 如果是相对路径，直接拼接数据目录
-        if not os.path.isabs(path):
-            return os.path.join(self.data_dir, path)
+        if not _isabs(path):
+            return _join(self.data_dir, path)
         
-        # 如果是绝对路径且在数据目录范围内，直接返回
-        if path.startswith(self.data_dir):
-            return path
+        # 如果是绝对路径且规范化后在数据目录范围内，直接返回规范化路径
+        norm_path = _normpath(path)
+        if norm_path == self._abs_data_dir[:-1] or norm_path.startswith(self._abs_data_dir):
+            return norm_path
         
         # 绝对路径但不在数据目录范围内，转换为相对路径
-        rel_path = os.path.relpath(path, self.data_dir)
+        rel_path = _relpath(path, self.data_dir)
         
         # 如果是上一级目录，直接使用文件名
         if rel_path.startswith(".."):
-            return os.path.join(self.data_dir, os.path.basename(path))
+            return _join(self.data_dir, _basename(path))
         
-        return os.path.join(self.data_dir, rel_path)
+        return _join(self.data_dir, rel_path)
     
+    @_cached_path
     def get_service_config_path(self, service_id: str, config_name: str = "service.json") -> str:
         """
         获取服务配置文件路径
@@ -204,8 +350,9 @@ class PathManager:
         Returns:
             str: 服务配置文件路径
         """
-        return os.path.join(self.base_path, "services", service_id, config_name)
+        return _join(self._cfg_services_root, service_id, config_name)
     
+    @_cached_path
     def get_engine_config_path(self, engine_name: str, config_name: str = "engine.json") -> str:
         """
         获取引擎配置文件路径
@@ -217,7 +364,7 @@ class PathManager:
         Returns:
             str: 引擎配置文件路径
         """
-        return os.path.join(self.base_path, "engines", f"{engine_name}.json")
+        return _join(self._cfg_engines_root, f"{engine_name}.json")
     
     def get_service_json_path(self, service_path: str) -> str:
         """
@@ -229,7 +376,7 @@ class PathManager:
         Returns:
             str: service.json文件路径
         """
-        return os.path.join(service_path, "service.json")
+        return _join(service_path, "service.json")
     
     def get_engine_json_path(self, engine_path: str) -> str:
         """
@@ -241,24 +388,49 @@ class PathManager:
         Returns:
             str: engine.json文件路径
         """
-        # 如果是文件路径，获取其所在目录
-        if os.path.isfile(engine_path):
-            engine_dir = os.path.dirname(engine_path)
-            engine_name = os.path.splitext(os.path.basename(engine_path))[0]
-        else:
+        # 路径只解析一次，得到所在目录与最后一级名称
+        parent_dir, base_name = _split(engine_path)
+        
+        # 一次读取目录项代替多次 isfile/exists 探测；路径是文件时改为读取其所在目录
+        try:
+            names = self._list_dir_names(engine_path)
             engine_dir = engine_path
-            engine_name = os.path.basename(engine_path)
+            engine_name = base_name
+        except NotADirectoryError:
+            engine_dir = parent_dir
+            # 去掉扩展名，以点开头的文件名视为没有扩展名
+            dot_idx = base_name.rfind(".")
+            engine_name = base_name[:dot_idx] if dot_idx > 0 else base_name
+            names = self._list_dir_names(engine_dir)
         
         # 检查引擎目录下是否有engine.json文件
-        engine_json_path = os.path.join(engine_dir, "engine.json")
-        if os.path.exists(engine_json_path):
-            return engine_json_path
+        if "engine.json" in names:
+            return _join(engine_dir, "engine.json")
         
         # 检查引擎文件同级目录下是否有同名的json文件
-        engine_json_path = os.path.join(engine_dir, f"{engine_name}.json")
-        return engine_json_path
+        return _join(engine_dir, f"{engine_name}.json")
+    
+    @staticmethod
+    def _list_dir_names(dir_path: str) -> set:
+        """
+        读取目录下的所有条目名称
+        
+        Args:
+            dir_path: 目录路径
+            
+        Returns:
+            set: 条目名称集合，目录不存在时为空集合
+            
+        Raises:
+            NotADirectoryError: 路径是文件而不是目录
+        """
+        try:
+            with os.scandir(dir_path or ".") as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return set()
     
-    def load_json_file(self, file_path: str) -> dict:
+    def load_json_file(self, file_path: str) -> Mapping:
         """
         加载JSON文件
         
@@ -266,13 +438,35 @@ class PathManager:
             file_path: JSON文件路径
             
         Returns:
-            dict: JSON文件内容
+            Mapping: JSON文件内容，文件未变化时返回缓存的同一对象，调用方不应修改；
+                文件不存在时返回只读的空映射，需要修改时请先 dict(...) 复制
         """
-        if not os.path.exists(file_path):
-            return {}
+        entry = self._json_cache.get(file_path)
+        # 已知不存在的文件在检查间隔内直接返回，间隔过后重新探测，以发现外部新建的文件
+        if entry is not None and entry[0] is None and time.monotonic() < entry[1]:
+            return _EMPTY_JSON
+        
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            self._json_cache[file_path] = (None, time.monotonic() + _MISSING_RECHECK_SECONDS, None)
+            return _EMPTY_JSON
+        
+        # 修改时间与大小均未变化时直接返回上次解析的结果
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
         
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            data = _json_loads(f.read())
+        self._json_cache[file_path] = (st.st_mtime_ns, st.st_size, data)
+        return data
+    
+    def forget_missing_json_files(self) -> None:
+        """
+        清除“文件不存在”的缓存记录，下次加载时重新检查文件，服务重新发现前调用
+        """
+        for file_path in [path for path, entry in self._json_cache.items() if entry[0] is None]:
+            self._json_cache.pop(file_path, None)
     
     def save_json_file(self, file_path: str, data: dict) -> bool:
         """
@@ -287,15 +481,27 @@ class PathManager:
         """
         try:
             # 确保父目录存在
-            parent_dir = os.path.dirname(file_path)
-            if not os.path.exists(parent_dir):
-                os.makedirs(parent_dir, exist_ok=True)
+            parent_dir = _dirname(file_path)
+            self._ensure_dir(parent_dir)
             
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            payload = _json_dumps(data)
+            # 先写入同目录下的临时文件再原子替换，避免写入中断导致文件损坏
+            # 临时文件名带上进程与线程标识，多个线程同时保存同一文件时互不覆盖
+            tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp_path, file_path)
+                # 替换完成后再使缓存失效，读取方不会在此之后拿到旧内容
+                self._json_cache.pop(file_path, None)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
             return True
-        except Exception as e:
-            print(f"Failed to save JSON file: {str(e)}")
+        except (OSError, TypeError, ValueError) as e:
+            # 只处理文件读写与序列化错误，其他异常照常抛出
+            self.logger.error(f"保存JSON文件失败: {file_path}，错误: {str(e)}")
             return False
     
     def get_log_root_dir(self) -> str:
@@ -305,11 +511,10 @@ class PathManager:
         Returns:
             str: 日志根目录路径
         """
-        log_dir = os.path.join(self.base_path, "log")
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir, exist_ok=True)
-        return log_dir
+        self._ensure_dir(self._log_root)
+        return self._log_root
     
+    @_cached_path
     def get_linkgateway_log_path(self, log_name: str = "linkgateway") -> str:
         """
         获取LinkGateway日志文件路径
@@ -320,11 +525,10 @@ class PathManager:
         Returns:
             str: LinkGateway日志文件路径
         """
-        lg_log_dir = os.path.join(self.get_log_root_dir(), "linkgateway")
-        if not os.path.exists(lg_log_dir):
-            os.makedirs(lg_log_dir, exist_ok=True)
-        return os.path.join(lg_log_dir, log_name)
+        self._ensure_dir(self._log_lg_root)
+        return _join(self._log_lg_root, log_name)
     
+    @_cached_path
     def get_engine_log_path(self, engine_name: str, log_name: str = None) -> str:
         """
         获取引擎日志文件路径
@@ -338,11 +542,9 @@ class PathManager:
         """
         if log_name is None:
             log_name = engine_name
-        engine_log_dir = os.path.join(self.get_log_root_dir(), "engines", engine_name)
-        if not os.path.exists(engine_log_dir):
-            os.makedirs(engine_log_dir, exist_ok=True)
-        return os.path.join(engine_log_dir, log_name)
+        return _join(self._resource_dir(self._log_engines_root, engine_name), log_name)
     
+    @_cached_path
     def get_service_log_path(self, service_name: str, log_name: str = None) -> str:
         """
         获取服务日志文件路径
@@ -356,7 +558,4 @@ class PathManager:
         """
         if log_name is None:
             log_name = service_name
-        service_log_dir = os.path.join(self.get_log_root_dir(), "services", service_name)
-        if not os.path.exists(service_log_dir):
-            os.makedirs(service_log_dir, exist_ok=True)
-        return os.path.join(service_log_dir, log_name)
+        return _join(self._resource_dir(self._log_services_root, service_name), log_name)
@@ -1,20 +1,65 @@
-from typing import Dict, Any, Callable, List, Optional
+from dataclasses import dataclass
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, Tuple, Type
 import os
+import sys
+import time
+import heapq
+import queue
+import threading
 import importlib.util
-from .logs import get_logger
+
+# 插件目录监听依赖可选的 watchdog 包，未安装时只能通过 hot_reload_plugins 轮询
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    _WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    _WATCHDOG_AVAILABLE = False
+
+# 插件状态常量，状态比较与赋值直接使用模块级名称
+STATUS_INITIALIZED = sys.intern("initialized")
+STATUS_RUNNING = sys.intern("running")
+STATUS_STOPPED = sys.intern("stopped")
+STATUS_ERROR = sys.intern("error")
+
+# 插件管理器会分发的钩子方法名称
+_HOOK_NAMES = (
+    "on_service_reloaded",
+    "on_api_mapped",
+    "on_request_incoming",
+    "on_service_calling_engine",
+    "on_engine_responding",
+    "on_route_matching",
+    "on_response_outgoing",
+)
 
 
 class Plugin:
     """
     插件基类，所有插件都需要继承这个类
+    插件模块应在顶层声明 PLUGIN_CLASS = 插件类，加载时直接取用；
+    未声明时退回扫描模块中的第一个 Plugin 子类
+    基类属性存放在 __slots__ 中；子类未声明 __slots__ 时仍可自由添加属性，
+    声明 __slots__ 的子类可完全去掉实例字典
     """
     
-    # 插件状态枚举
+    # 插件状态枚举，保留以兼容通过 Plugin.Status 访问状态的插件
     class Status:
-        INITIALIZED = "initialized"
-        RUNNING = "running"
-        STOPPED = "stopped"
-        ERROR = "error"
+        INITIALIZED = STATUS_INITIALIZED
+        RUNNING = STATUS_RUNNING
+        STOPPED = STATUS_STOPPED
+        ERROR = STATUS_ERROR
+    
+    # 按需从依赖注入器获取的核心组件，首次访问时解析并缓存到实例上
+    _LAZY_COMPONENT_NAMES = (
+        "registry", "api_mapper", "service_proxy", "plugin_manager", "inner_comm",
+        "outer_comm", "db_link", "auth_manager", "path_manager",
+    )
+    _LAZY_COMPONENTS = frozenset(_LAZY_COMPONENT_NAMES)
+    
+    __slots__ = ("gateway", "status", "dependencies", "logger", "_dependencies_verified") + _LAZY_COMPONENT_NAMES
     
     def __init__(self, gateway):
         """
@@ -24,22 +69,33 @@ class Plugin:
             gateway: LinkGateway实例
         """
         self.gateway = gateway
-        self.logger = get_logger(f"Plugin.{self.__class__.__name__}", gateway.path_manager.get_linkgateway_log_path())
-        self.status = self.Status.INITIALIZED
+        self.status = STATUS_INITIALIZED
         self.dependencies = []  # 插件依赖列表
-        
-        # 提供核心组件的便捷访问
-        self.registry = gateway.dependency_injector.get_registry()
-        self.api_mapper = gateway.dependency_injector.get_api_mapper()
-        self.service_proxy = gateway.dependency_injector.get_service_proxy()
-        self.plugin_manager = gateway.dependency_injector.get_plugin_manager()
-        self.inner_comm = gateway.dependency_injector.get_inner_comm()
-        self.outer_comm = gateway.dependency_injector.get_outer_comm()
-        self.db_link = gateway.dependency_injector.get_db_link()
-        self.auth_manager = gateway.dependency_injector.get_auth_manager()
-        self.path_manager = gateway.dependency_injector.get_path_manager()
+        # 插件管理器已确认全部依赖先于本插件初始化成功时置为True，初始化时跳过依赖检查
+        self._dependencies_verified = False
+        # 所有插件共用依赖注入器中的网关日志实例，不再为每个插件单独创建日志文件
         self.logger = gateway.dependency_injector.get_logger()
     
+    def __getattr__(self, name: str) -> Any:
+        """
+        按需获取核心组件（registry、db_link等），只在对应槽位尚未赋值时调用
+        
+        Args:
+            name: 属性名称
+            
+        Returns:
+            Any: 核心组件实例
+            
+        Raises:
+            AttributeError: 属性不是核心组件
+        """
+        if name not in Plugin._LAZY_COMPONENTS:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = getattr(self.gateway.dependency_injector.get_core_bundle(), name)
+        # 写入槽位，之后的访问不再经过 __getattr__
+        setattr(self, name, value)
+        return value
+    
     def initialize(self) -> bool:
         """
         初始化插件
@@ -50,13 +106,13 @@ class Plugin:
         try:
             self.logger.log("DEBUG", f"初始化插件: {self.__class__.__name__}", None)
             if not self._check_dependencies():
-                self.status = self.Status.ERROR
+                self.status = STATUS_ERROR
                 return False
-            self.status = self.Status.RUNNING
+            self.status = STATUS_RUNNING
             return True
         except Exception as e:
             self.logger.log("ERROR", f"初始化插件时发生错误: {str(e)}", False)
-            self.status = self.Status.ERROR
+            self.status = STATUS_ERROR
             return False
     
     def shutdown(self) -> bool:
@@ -68,7 +124,9 @@ class Plugin:
         """
         try:
             self.logger.debug(f"关闭插件: {self.__class__.__name__}")
-            self.status = self.Status.STOPPED
+            self.status = STATUS_STOPPED
+            # 再次初始化时依赖可能已不存在，需要重新检查
+            self._dependencies_verified = False
             return True
         except Exception as e:
             self.logger.error(f"关闭插件时发生错误: {str(e)}")
@@ -99,7 +157,7 @@ class Plugin:
         Returns:
             bool: 依赖检查通过返回True，否则返回False
         """
-        if not self.dependencies:
+        if self._dependencies_verified or not self.dependencies:
             return True
         
         plugin_manager = self.gateway.plugin_manager
@@ -108,7 +166,7 @@ class Plugin:
                 self.logger.error(f"插件依赖缺失: {dep_name}")
                 return False
             dep_plugin = plugin_manager.plugins[dep_name]
-            if dep_plugin.get_status() != self.Status.RUNNING:
+            if dep_plugin.get_status() != STATUS_RUNNING:
                 self.logger.error(f"插件依赖未运行: {dep_name}")
                 return False
         return True
@@ -211,11 +269,179 @@ class Plugin:
         pass
 
 
+@dataclass(slots=True)
+class PluginInfo:
+    """
+    插件注册信息
+    """
+    plugin_name: str
+    status: str
+    path: str
+
+
+class PluginWatcher(FileSystemEventHandler):
+    """
+    插件目录监听器，基于文件系统事件触发插件热重载
+    事件先进入队列，同一文件在去抖窗口内没有新事件后才交给插件管理器处理
+    """
+    
+    # 去抖窗口（秒），编辑器以移动+删除+新建方式保存时会连续产生多个事件
+    DEBOUNCE_INTERVAL = 0.15
+    
+    def __init__(self, plugin_manager: "PluginManager"):
+        """
+        初始化插件目录监听器
+        
+        Args:
+            plugin_manager: 插件管理器实例
+        """
+        super().__init__()
+        self.plugin_manager = plugin_manager
+        self.events: queue.Queue = queue.Queue()
+        self._observer = None
+        self._worker: Optional[threading.Thread] = None
+        self._running = False
+    
+    @property
+    def is_running(self) -> bool:
+        """
+        是否正在监听插件目录
+        
+        Returns:
+            bool: 正在监听返回True
+        """
+        return self._running
+    
+    def start(self) -> bool:
+        """
+        开始监听插件目录
+        
+        Returns:
+            bool: 启动成功返回True，watchdog不可用时返回False
+        """
+        if not _WATCHDOG_AVAILABLE:
+            return False
+        if self._running:
+            return True
+        
+        self._running = True
+        self._worker = threading.Thread(target=self._process_events, name="PluginWatcher", daemon=True)
+        self._worker.start()
+        self._observer = Observer()
+        self._observer.schedule(self, self.plugin_manager.plugins_dir, recursive=True)
+        self._observer.start()
+        return True
+    
+    def stop(self) -> None:
+        """
+        停止监听插件目录
+        """
+        if not self._running:
+            return
+        self._running = False
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        # 放入空事件唤醒处理线程
+        self.events.put(None)
+        self._worker.join()
+        self._worker = None
+    
+    def on_created(self, event) -> None:
+        """
+        文件创建事件
+        
+        Args:
+            event: 文件系统事件
+        """
+        self._enqueue(event, event.src_path, "modified")
+    
+    def on_modified(self, event) -> None:
+        """
+        文件修改事件
+        
+        Args:
+            event: 文件系统事件
+        """
+        self._enqueue(event, event.src_path, "modified")
+    
+    def on_deleted(self, event) -> None:
+        """
+        文件删除事件
+        
+        Args:
+            event: 文件系统事件
+        """
+        self._enqueue(event, event.src_path, "deleted")
+    
+    def on_moved(self, event) -> None:
+        """
+        文件移动事件，编辑器通过重命名保存文件时也会触发
+        
+        Args:
+            event: 文件系统事件
+        """
+        self._enqueue(event, event.src_path, "deleted")
+        self._enqueue(event, event.dest_path, "modified")
+    
+    def _enqueue(self, event, path: str, kind: str) -> None:
+        """
+        将插件文件的变更放入事件队列
+        
+        Args:
+            event: 文件系统事件
+            path: 文件路径
+            kind: 变更类型，modified或deleted
+        """
+        if not event.is_directory and PluginManager._is_plugin_file(path):
+            self.events.put((path, kind))
+    
+    def _process_events(self) -> None:
+        """
+        事件处理线程：按文件去抖（后沿触发），文件静默一个去抖窗口后才交给插件管理器
+        """
+        # 待处理的文件：路径 -> (最后一次变更类型, 到期时间)
+        pending: Dict[str, Tuple[str, float]] = {}
+        while self._running:
+            timeout = None
+            if pending:
+                timeout = max(0.0, min(deadline for _, deadline in pending.values()) - time.monotonic())
+            try:
+                item = self.events.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            
+            if item is not None:
+                # 每个新事件都重新计时，一次保存产生的多个事件只触发一次重载
+                path, kind = item
+                pending[path] = (kind, time.monotonic() + self.DEBOUNCE_INTERVAL)
+            
+            now = time.monotonic()
+            due = [path for path, (_, deadline) in pending.items() if deadline <= now]
+            for path in due:
+                kind, _ = pending.pop(path)
+                # 本线程是监听的唯一工作线程，单个文件处理失败不能让它退出
+                try:
+                    self.plugin_manager.apply_file_change(path, kind)
+                except Exception as e:
+                    self.plugin_manager.logger.error(f"处理插件文件变更时发生错误，文件: {path}，错误: {str(e)}")
+
+
 class PluginManager:
     """
     插件管理器，负责加载和管理所有插件
     """
     
+    # 插件文件数量达到该值时并行导入，以及并行导入的最大线程数
+    PARALLEL_IMPORT_MIN = 4
+    IMPORT_WORKERS = 8
+    
+    __slots__ = (
+        "gateway", "plugins", "logger", "plugins_dir", "plugin_mod_times", "plugin_files",
+        "_class_cache", "_hooks", "watcher", "registered_plugins", "_lock",
+    )
+    
     def __init__(self, gateway):
         """
         初始化插件管理器
@@ -225,16 +451,29 @@ class PluginManager:
         """
         self.gateway = gateway
         self.plugins: Dict[str, Plugin] = {}
-        self.logger = get_logger("PluginManager", gateway.path_manager.get_linkgateway_log_path())
+        # 插件管理器先于依赖注入器创建，直接使用依赖注入器所注册的网关日志实例
+        self.logger = gateway.logger
         
         # 定义插件目录
         self.plugins_dir = os.path.join(gateway.base_path, "plugins")
         
-        # 插件文件修改时间记录
-        self.plugin_mod_times = {}
+        # 插件文件修改时间记录（整数纳秒，避免浮点比较误差）
+        self.plugin_mod_times: Dict[str, int] = {}
+        # 插件文件到插件名称的映射，用于处理文件删除
+        self.plugin_files: Dict[str, str] = {}
+        # 插件类缓存：文件路径 -> (修改时间ns, 文件大小, 插件类)，文件未变化时不再重新执行模块
+        self._class_cache: Dict[str, Tuple[int, int, Type[Plugin]]] = {}
+        
+        # 各钩子的订阅插件列表，只包含重写了该钩子的插件，插件增删后整体重建
+        self._hooks: Dict[str, List[Plugin]] = {name: [] for name in _HOOK_NAMES}
+        
+        # 插件目录监听器，watchdog 可用时通过 start_watching 启动
+        self.watcher = PluginWatcher(self)
+        # 监听线程与调用方线程都会增删插件，所有修改插件状态的公开方法都持有该锁
+        self._lock = threading.RLock()
         
         # 注册信息收集结构
-        self.registered_plugins = []
+        self.registered_plugins: Dict[str, PluginInfo] = {}
         
         # 创建插件目录（如果不存在）
         if not os.path.exists(self.plugins_dir):
@@ -247,16 +486,17 @@ class PluginManager:
         Returns:
             Dict[str, Any]: 加载结果，包含成功和失败的插件信息
         """
-        self.registered_plugins.clear()
-        self.logger.info(f"开始加载插件，插件目录: {self.plugins_dir}")
-        
-        plugin_files = self._scan_plugin_files(self.plugins_dir)
-        result = self._load_plugins_from_files(plugin_files, is_reload=False)
-        
-        self.logger.info(f"插件加载完成，成功: {len(result['success'])}, 失败: {len(result['failed'])}")
-        self._log_registered_plugins()
-        
-        return result
+        with self._lock:
+            self.registered_plugins.clear()
+            self.logger.info(f"开始加载插件，插件目录: {self.plugins_dir}")
+            
+            plugin_files = (entry.path for entry in self._scan_plugin_files(self.plugins_dir))
+            result = self._load_plugins_from_files(plugin_files, is_reload=False)
+            
+            self.logger.info(f"插件加载完成，成功: {len(result['success'])}, 失败: {len(result['failed'])}")
+            self._log_registered_plugins()
+            
+            return result
     
     def reload_plugins(self) -> Dict[str, Any]:
         """
@@ -265,13 +505,14 @@ class PluginManager:
         Returns:
             Dict[str, Any]: 重载结果，包含成功和失败的插件信息
         """
-        self.logger.info("开始重新加载插件")
-        
-        self.shutdown_plugins()
-        result = self.load_plugins()
-        
-        self.logger.info(f"插件重新加载完成，成功: {len(result['success'])}，失败: {len(result['failed'])}")
-        return result
+        with self._lock:
+            self.logger.info("开始重新加载插件")
+            
+            self.shutdown_plugins()
+            result = self.load_plugins()
+            
+            self.logger.info(f"插件重新加载完成，成功: {len(result['success'])}，失败: {len(result['failed'])}")
+            return result
     
     def hot_reload_plugins(self) -> Dict[str, Any]:
         """
@@ -280,38 +521,153 @@ class PluginManager:
         Returns:
             Dict[str, Any]: 热重载结果，包含成功和失败的插件信息
         """
-        self.logger.info("开始热重载插件")
-        
-        plugin_files = self._scan_plugin_files(self.plugins_dir)
-        result = self._hot_reload_plugins_from_files(plugin_files)
+        with self._lock:
+            self.logger.info("开始热重载插件")
+            
+            plugin_entries = self._scan_plugin_files(self.plugins_dir)
+            result = self._hot_reload_plugins_from_files(plugin_entries)
+            
+            self.logger.info(f"插件热重载完成，成功: {len(result['success'])}，失败: {len(result['failed'])}")
+            return result
+    
+    def start_watching(self) -> bool:
+        """
+        启动插件目录监听，文件变化后自动热重载对应插件
         
-        self.logger.info(f"插件热重载完成，成功: {len(result['success'])}，失败: {len(result['failed'])}")
-        return result
+        Returns:
+            bool: 启动成功返回True，watchdog不可用时返回False，需改用 hot_reload_plugins 轮询
+        """
+        if self.watcher.start():
+            self.logger.info(f"开始监听插件目录: {self.plugins_dir}")
+            return True
+        self.logger.warning("watchdog 不可用，插件热重载需调用 hot_reload_plugins")
+        return False
     
-    def _scan_plugin_files(self, directory: str) -> List[str]:
+    def stop_watching(self) -> None:
         """
-        递归扫描插件目录，获取所有插件文件
+        停止插件目录监听
+        """
+        self.watcher.stop()
+    
+    def apply_file_change(self, plugin_file: str, kind: str) -> None:
+        """
+        处理单个插件文件的变更
         
         Args:
-            directory: 要扫描的目录
+            plugin_file: 插件文件路径
+            kind: 变更类型，modified或deleted
+        """
+        with self._lock:
+            if kind == "deleted":
+                self._unload_plugin_file(plugin_file)
+                return
             
-        Returns:
-            List[str]: 插件文件路径列表
+            try:
+                current_mod_time = os.stat(plugin_file).st_mtime_ns
+            except FileNotFoundError:
+                # 去抖结束时文件已不存在，按删除处理
+                self._unload_plugin_file(plugin_file)
+                return
+            
+            # 修改时间未变化时忽略，避免同一次保存触发的多个事件重复加载
+            if self.plugin_mod_times.get(plugin_file) == current_mod_time:
+                return
+            
+            plugin_name = os.path.splitext(os.path.basename(plugin_file))[0]
+            is_reload = plugin_file in self.plugin_mod_times
+            self.logger.info(f"检测到插件文件{'修改' if is_reload else '新增'}: {plugin_file}")
+            self._load_plugin_from_file(plugin_file, plugin_name, is_reload=is_reload)
+    
+    def _unload_plugin_file(self, plugin_file: str) -> None:
         """
-        plugin_files = []
+        关闭并移除由指定文件加载的插件
         
-        if not os.path.exists(directory):
-            return plugin_files
+        Args:
+            plugin_file: 插件文件路径
+        """
+        self.plugin_mod_times.pop(plugin_file, None)
+        self._class_cache.pop(plugin_file, None)
+        plugin_name = self.plugin_files.pop(plugin_file, None)
+        if plugin_name is None:
+            return
+        
+        plugin = self.plugins.pop(plugin_name, None)
+        if plugin is not None:
+            self._rebuild_hooks()
+            try:
+                plugin.shutdown()
+            except Exception as e:
+                self.logger.error(f"关闭插件时发生错误，插件名称: {plugin_name}，错误: {str(e)}")
+            self._reset_dependents(plugin_name)
+            self.logger.info(f"插件文件已删除，卸载插件: {plugin_name}")
+    
+    def _reset_dependents(self, plugin_name: str) -> None:
+        """
+        被依赖的插件卸载或替换后，依赖它的插件需要在下次初始化时重新检查依赖
         
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.endswith(".py") and not file.startswith("_"):
-                    plugin_file = os.path.join(root, file)
-                    plugin_files.append(plugin_file)
+        Args:
+            plugin_name: 被卸载或替换的插件名称
+        """
+        for plugin in self.plugins.values():
+            if plugin_name in (plugin.dependencies or ()):
+                plugin._dependencies_verified = False
+    
+    def _rebuild_hooks(self) -> None:
+        """
+        根据当前已加载的插件重建各钩子的订阅插件列表
+        未重写钩子的插件继承的是空实现，分发时直接跳过
+        """
+        hooks = {name: [] for name in _HOOK_NAMES}
+        for plugin in self.plugins.values():
+            plugin_cls = type(plugin)
+            for name in _HOOK_NAMES:
+                if getattr(plugin_cls, name) is not getattr(Plugin, name):
+                    hooks[name].append(plugin)
+        # 整体替换，分发中的遍历仍使用旧列表
+        self._hooks = hooks
+    
+    @staticmethod
+    def _is_plugin_file(path: str) -> bool:
+        """
+        判断文件是否为插件文件
         
-        return plugin_files
+        Args:
+            path: 文件路径
+            
+        Returns:
+            bool: 以.py结尾且不以下划线开头的文件返回True
+        """
+        file_name = os.path.basename(path)
+        return file_name.endswith(".py") and not file_name.startswith("_")
     
-    def _load_plugins_from_files(self, plugin_files: List[str], is_reload: bool) -> Dict[str, Any]:
+    def _scan_plugin_files(self, directory: str) -> Iterator[os.DirEntry]:
+        """
+        递归扫描插件目录，逐个产出插件文件的目录项
+        使用 os.scandir 读取目录项，文件类型直接取自目录项，无需额外 stat
+        
+        Args:
+            directory: 要扫描的目录
+            
+        Returns:
+            Iterator[os.DirEntry]: 插件文件目录项迭代器，目录不存在时为空；
+                目录项的 stat() 结果会被缓存，调用方可直接复用
+        """
+        stack = [directory]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            
+            with entries:
+                for entry in entries:
+                    # 与 os.walk 一致，不进入符号链接指向的目录
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".py") and not entry.name.startswith("_"):
+                        yield entry
+    
+    def _load_plugins_from_files(self, plugin_files: Iterable[str], is_reload: bool) -> Dict[str, Any]:
         """
         从文件列表加载插件
         
@@ -327,24 +683,142 @@ class PluginManager:
             "failed": []
         }
         
-        for plugin_file in plugin_files:
+        # 第一遍导入插件类（文件较多时并行执行模块），再在当前线程中按文件顺序创建实例
+        # 按路径排序，同名插件冲突时保留哪个文件与目录遍历顺序无关
+        plugin_files = sorted(plugin_files)
+        class_results = self._load_plugin_classes(plugin_files)
+        
+        imported: Dict[str, tuple] = {}
+        for plugin_file, (plugin_cls, error) in zip(plugin_files, class_results):
             plugin_name = os.path.splitext(os.path.basename(plugin_file))[0]
-            load_result = self._load_plugin_from_file(plugin_file, plugin_name, is_reload)
+            plugin = None
+            if error is None and plugin_cls is not None:
+                try:
+                    plugin = plugin_cls(self.gateway)
+                except Exception as e:
+                    error = e
+            if error is not None:
+                self._log_plugin_load_error(plugin_file, is_reload, error)
+            
+            if plugin is None:
+                result["failed"].append(plugin_name)
+            elif plugin.get_name() in imported:
+                # 插件按类名注册，同名插件只保留路径排在前面的文件，其余视为加载失败
+                self.logger.error(
+                    f"插件名称重复: {plugin.get_name()}，文件 {plugin_file} 与 {imported[plugin.get_name()][1]} 冲突，跳过加载"
+                )
+                result["failed"].append(plugin_name)
+            else:
+                imported[plugin.get_name()] = (plugin, plugin_file, plugin_name)
+        
+        # 第二遍按依赖关系排序后依次初始化，被依赖的插件总是先于依赖它的插件初始化
+        order, cyclic = self._sort_by_dependencies(
+            {name: item[0].dependencies for name, item in imported.items()}
+        )
+        if cyclic:
+            self.logger.error(f"插件存在循环依赖，跳过加载: {', '.join(cyclic)}")
+            result["failed"].extend(imported[name][2] for name in cyclic)
+        
+        activated = set()
+        for name in order:
+            plugin, plugin_file, plugin_name = imported[name]
+            # 依赖都在本批中且已按顺序初始化成功时，无需在初始化中再逐个检查
+            if plugin.dependencies and activated.issuperset(plugin.dependencies):
+                plugin._dependencies_verified = True
+            load_result = self._activate_plugin(plugin, plugin_file, plugin_name, is_reload)
             
             if load_result["success"]:
+                activated.add(name)
                 result["success"].append(plugin_name)
             else:
                 result["failed"].append(plugin_name)
         
         return result
     
-    def _hot_reload_plugins_from_files(self, plugin_files: List[str]) -> Dict[str, Any]:
+    def _load_plugin_classes(self, plugin_files: List[str]) -> List[tuple]:
         """
-        热重载插件文件（只重载修改过的）
+        导入多个插件文件中的插件类，文件数量达到阈值时由多个线程并行执行模块
+        调用线程也参与导入，工作线程未能运行时仍能完成全部导入
         
         Args:
             plugin_files: 插件文件路径列表
             
+        Returns:
+            List[tuple]: 与文件顺序一致的 (插件类或None, 异常或None) 列表
+        """
+        results: List[tuple] = [(None, None)] * len(plugin_files)
+        next_index = iter(range(len(plugin_files))).__next__
+        lock = threading.Lock()
+        
+        def import_worker() -> None:
+            while True:
+                with lock:
+                    try:
+                        index = next_index()
+                    except StopIteration:
+                        return
+                plugin_file = plugin_files[index]
+                plugin_name = os.path.splitext(os.path.basename(plugin_file))[0]
+                try:
+                    results[index] = (self._load_plugin_class(plugin_file, plugin_name), None)
+                except Exception as e:
+                    results[index] = (None, e)
+        
+        threads = []
+        if len(plugin_files) >= self.PARALLEL_IMPORT_MIN:
+            workers = min(self.IMPORT_WORKERS, os.cpu_count() or 1, len(plugin_files))
+            threads = [
+                threading.Thread(target=import_worker, name="PluginImport", daemon=True)
+                for _ in range(workers - 1)
+            ]
+            for thread in threads:
+                thread.start()
+        import_worker()
+        for thread in threads:
+            thread.join()
+        return results
+    
+    @staticmethod
+    def _sort_by_dependencies(graph: Dict[str, List[str]]) -> tuple:
+        """
+        按依赖关系对插件进行拓扑排序（Kahn算法），同一层级按名称排序以保证顺序稳定
+        不在图中的依赖视为外部依赖，不参与排序，由插件初始化时自行检查
+        
+        Args:
+            graph: 插件名称到其依赖插件名称列表的映射
+            
+        Returns:
+            tuple: (初始化顺序列表, 处于循环依赖中而无法排序的插件名称列表)
+        """
+        in_degree = {name: 0 for name in graph}
+        dependents: Dict[str, List[str]] = {name: [] for name in graph}
+        for name, deps in graph.items():
+            for dep in set(deps or ()):
+                if dep in graph:
+                    in_degree[name] += 1
+                    dependents[dep].append(name)
+        
+        ready = [name for name, degree in in_degree.items() if degree == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            name = heapq.heappop(ready)
+            order.append(name)
+            for dependent in dependents[name]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    heapq.heappush(ready, dependent)
+        
+        cyclic = sorted(name for name, degree in in_degree.items() if degree > 0)
+        return order, cyclic
+    
+    def _hot_reload_plugins_from_files(self, plugin_entries: Iterable[os.DirEntry]) -> Dict[str, Any]:
+        """
+        热重载插件文件（只重载修改过的）
+        
+        Args:
+            plugin_entries: 插件文件目录项列表
+            
         Returns:
             Dict[str, Any]: 热重载结果
         """
@@ -353,9 +827,13 @@ class PluginManager:
             "failed": []
         }
         
-        for plugin_file in plugin_files:
-            plugin_name = os.path.splitext(os.path.basename(plugin_file))[0]
-            current_mod_time = os.path.getmtime(plugin_file)
+        for entry in plugin_entries:
+            plugin_file = entry.path
+            plugin_name = os.path.splitext(entry.name)[0]
+            try:
+                current_mod_time = entry.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
             
             if plugin_file not in self.plugin_mod_times:
                 self.logger.info(f"检测到新插件文件: {plugin_file}")
@@ -379,8 +857,8 @@ class PluginManager:
         """
         if self.registered_plugins:
             self.logger.info("  - 注册成功的插件：")
-            for plugin_info in self.registered_plugins:
-                plugin_name = plugin_info.get('plugin_name')
+            for plugin_info in self.registered_plugins.values():
+                plugin_name = plugin_info.plugin_name
                 self.logger.info(f"    - 插件{plugin_name} 注册成功 服务ID：{plugin_name}")
     
     def _load_plugin_from_file(self, plugin_file: str, plugin_name: str, is_reload: bool = False) -> Dict[str, Any]:
@@ -395,13 +873,33 @@ class PluginManager:
         Returns:
             Dict[str, Any]: 加载结果，包含success、failed和plugin_name
         """
-        result = {"success": False, "plugin_name": plugin_name}
-        
         try:
             plugin = self._import_plugin_class(plugin_file, plugin_name)
-            if not plugin:
-                return result
+        except Exception as e:
+            self._log_plugin_load_error(plugin_file, is_reload, e)
+            plugin = None
+        
+        if not plugin:
+            return {"success": False, "plugin_name": plugin_name}
+        
+        return self._activate_plugin(plugin, plugin_file, plugin_name, is_reload)
+    
+    def _activate_plugin(self, plugin: Plugin, plugin_file: str, plugin_name: str, is_reload: bool) -> Dict[str, Any]:
+        """
+        替换旧插件，初始化并注册已导入的插件实例
+        
+        Args:
+            plugin: 插件实例
+            plugin_file: 插件文件路径
+            plugin_name: 插件名称
+            is_reload: 是否为重新加载
             
+        Returns:
+            Dict[str, Any]: 加载结果，包含success和plugin_name
+        """
+        result = {"success": False, "plugin_name": plugin_name}
+        
+        try:
             self._handle_old_plugin(plugin, is_reload)
             
             if not plugin.initialize():
@@ -426,6 +924,28 @@ class PluginManager:
         Returns:
             Optional[Plugin]: 插件实例，失败返回None
         """
+        plugin_cls = self._load_plugin_class(plugin_file, plugin_name)
+        if plugin_cls is None:
+            return None
+        return plugin_cls(self.gateway)
+    
+    def _load_plugin_class(self, plugin_file: str, plugin_name: str) -> Optional[Type[Plugin]]:
+        """
+        从文件导入插件类，只执行模块而不创建实例，可在多个线程中并行调用
+        
+        Args:
+            plugin_file: 插件文件路径
+            plugin_name: 插件名称
+            
+        Returns:
+            Optional[Type[Plugin]]: 插件类，未找到返回None
+        """
+        # 修改时间与大小均未变化时直接使用缓存的插件类
+        st = os.stat(plugin_file)
+        cached = self._class_cache.get(plugin_file)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        
         spec = importlib.util.spec_from_file_location(plugin_name, plugin_file)
         if not spec or not spec.loader:
             return None
@@ -433,10 +953,30 @@ class PluginManager:
         plugin_module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(plugin_module)
         
+        # 优先使用模块声明的 PLUGIN_CLASS，未声明时才扫描模块属性
+        plugin_cls = getattr(plugin_module, "PLUGIN_CLASS", None)
+        if not (isinstance(plugin_cls, type) and issubclass(plugin_cls, Plugin)):
+            plugin_cls = self._find_plugin_class(plugin_module)
+            if plugin_cls is None:
+                return None
+        
+        self._class_cache[plugin_file] = (st.st_mtime_ns, st.st_size, plugin_cls)
+        return plugin_cls
+    
+    @staticmethod
+    def _find_plugin_class(plugin_module) -> Optional[Type[Plugin]]:
+        """
+        扫描模块属性，查找第一个 Plugin 子类
+        
+        Args:
+            plugin_module: 插件模块
+            
+        Returns:
+            Optional[Type[Plugin]]: 插件类，未找到返回None
+        """
         for name, cls in plugin_module.__dict__.items():
             if isinstance(cls, type) and issubclass(cls, Plugin) and cls != Plugin:
-                return cls(self.gateway)
-        
+                return cls
         return None
     
     def _handle_old_plugin(self, plugin: Plugin, is_reload: bool) -> None:
@@ -453,10 +993,13 @@ class PluginManager:
                 old_plugin = self.plugins[old_plugin_name]
                 old_plugin.shutdown()
                 del self.plugins[old_plugin_name]
+                self._rebuild_hooks()
+                self._reset_dependents(old_plugin_name)
         else:
             if plugin.get_name() in self.plugins:
                 old_plugin = self.plugins[plugin.get_name()]
                 old_plugin.shutdown()
+                self._reset_dependents(plugin.get_name())
     
     def _find_old_plugin_name(self, plugin: Plugin) -> Optional[str]:
         """
@@ -483,14 +1026,13 @@ class PluginManager:
             is_reload: 是否为重新加载
         """
         self.plugins[plugin.get_name()] = plugin
-        self.plugin_mod_times[plugin_file] = os.path.getmtime(plugin_file)
+        # 记录导入时的修改时间，导入之后文件再被修改仍能被检测到
+        cached = self._class_cache.get(plugin_file)
+        self.plugin_mod_times[plugin_file] = cached[0] if cached else os.stat(plugin_file).st_mtime_ns
+        self.plugin_files[plugin_file] = plugin.get_name()
+        self._rebuild_hooks()
         
-        plugin_info = {
-            'plugin_name': plugin.get_name(),
-            'status': plugin.get_status(),
-            'path': plugin_file
-        }
-        self.registered_plugins.append(plugin_info)
+        self.registered_plugins[plugin.get_name()] = PluginInfo(plugin.get_name(), plugin.get_status(), plugin_file)
         
         if is_reload:
             self.logger.info(f"成功热重载插件: {plugin.get_name()}")
@@ -564,21 +1106,26 @@ class PluginManager:
         """
         关闭所有插件
         """
-        self.logger.info("开始关闭所有插件")
-        
-        for plugin_name, plugin in self.plugins.items():
-            try:
-                if plugin.shutdown():
-                    self.logger.debug(f"成功关闭插件: {plugin_name}")
-                else:
-                    self.logger.error(f"关闭插件失败: {plugin_name}")
-            except Exception as e:
-                self.logger.error(f"关闭插件时发生错误，插件名称: {plugin_name}，错误: {str(e)}")
-        
-        # 清空插件列表和修改时间记录
-        self.plugins.clear()
-        self.plugin_mod_times.clear()
-        self.logger.info("所有插件已关闭")
+        with self._lock:
+            self.logger.info("开始关闭所有插件")
+            
+            for plugin_name, plugin in self.plugins.items():
+                try:
+                    if plugin.shutdown():
+                        self.logger.debug(f"成功关闭插件: {plugin_name}")
+                    else:
+                        self.logger.error(f"关闭插件失败: {plugin_name}")
+                except Exception as e:
+                    self.logger.error(f"关闭插件时发生错误，插件名称: {plugin_name}，错误: {str(e)}")
+                # 子类重写 shutdown 时可能不调用基类实现，这里统一清除依赖检查结果
+                plugin._dependencies_verified = False
+            
+            # 清空插件列表和修改时间记录
+            self.plugins.clear()
+            self.plugin_mod_times.clear()
+            self.plugin_files.clear()
+            self._rebuild_hooks()
+            self.logger.info("所有插件已关闭")
     
     def notify_service_reloaded(self, service_id: str) -> None:
         """
@@ -587,7 +1134,7 @@ class PluginManager:
         Args:
             service_id: 重载的服务ID
         """
-        for plugin in self.plugins.values():
+        for plugin in self._hooks["on_service_reloaded"]:
             try:
                 plugin.on_service_reloaded(service_id)
             except Exception as e:
@@ -597,7 +1144,7 @@ class PluginManager:
         """
         通知所有插件API映射完成
         """
-        for plugin in self.plugins.values():
+        for plugin in self._hooks["on_api_mapped"]:
             try:
                 plugin.on_api_mapped()
             except Exception as e:
@@ -613,7 +1160,7 @@ class PluginManager:
         Returns:
             Optional[Any]: 如果有插件返回响应，则返回该响应
         """
-        for plugin in self.plugins.values():
+        for plugin in self._hooks["on_request_incoming"]:
             try:
                 response = plugin.on_request_incoming(request)
                 if response is not None:
@@ -632,7 +1179,7 @@ class PluginManager:
             action: 请求动作
             data: 请求数据
         """
-        for plugin in self.plugins.values():
+        for plugin in self._hooks["on_service_calling_engine"]:
             try:
                 plugin.on_service_calling_engine(service_id, engine_id, action, data)
             except Exception as e:
@@ -647,7 +1194,7 @@ class PluginManager:
             action: 请求动作
             response: 引擎响应
         """
-        for plugin in self.plugins.values():
+        for plugin in self._hooks["on_engine_responding"]:
             try:
                 plugin.on_engine_responding(engine_id, action, response)
             except Exception as e:
@@ -664,7 +1211,7 @@ class PluginManager:
         Returns:
             Optional[Dict[str, Any]]: 如果有插件返回路由信息，则返回该信息
         """
-        for plugin in self.plugins.values():
+        for plugin in self._hooks["on_route_matching"]:
             try:
                 route_info = plugin.on_route_matching(path, method)
                 if route_info is not None:
@@ -683,7 +1230,7 @@ class PluginManager:
         Returns:
             Optional[Any]: 如果有插件返回响应，则返回该响应
         """
-        for plugin in self.plugins.values():
+        for plugin in self._hooks["on_response_outgoing"]:
             try:
                 plugin_resp = plugin.on_response_outgoing(response)
                 if plugin_resp is not None:
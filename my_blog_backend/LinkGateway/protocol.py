@@ -1,45 +1,100 @@
-import uuid
-from datetime import datetime
+import os
+from collections import deque
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+
+
+# 预先生成的请求ID池，一次读取多个ID所需的随机字节，分摊随机数系统调用
+_REQUEST_ID_BATCH = 1024
+_REQUEST_ID_POOL: deque = deque()
+
+
+def _refill_request_ids() -> None:
+    """
+    批量生成UUID4格式的请求ID并放入请求ID池
+    """
+    raw = bytearray(os.urandom(16 * _REQUEST_ID_BATCH))
+    ids = []
+    for offset in range(0, len(raw), 16):
+        # 设置UUID版本号(4)与变体位
+        raw[offset + 6] = (raw[offset + 6] & 0x0F) | 0x40
+        raw[offset + 8] = (raw[offset + 8] & 0x3F) | 0x80
+        h = raw[offset:offset + 16].hex()
+        ids.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+    _REQUEST_ID_POOL.extend(ids)
+
+
+def new_request_id() -> str:
+    """
+    生成新的请求ID，格式与 str(uuid.uuid4()) 相同
+    
+    Returns:
+        str: 请求ID
+    """
+    # 多线程下 popleft 是原子操作，池为空时可能被多个线程同时补充，不影响唯一性
+    while True:
+        try:
+            return _REQUEST_ID_POOL.popleft()
+        except IndexError:
+            _refill_request_ids()
+
+
+# fork 出的子进程清空继承的请求ID池，避免与父进程产生相同的ID
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_REQUEST_ID_POOL.clear)
+
+
+def _utcnow() -> datetime:
+    """
+    获取当前UTC时间（带时区）
+    
+    Returns:
+        datetime: 当前UTC时间
+    """
+    return datetime.now(timezone.utc)
+
+
+def _isoformat(value: datetime) -> str:
+    """
+    将时间序列化为ISO格式字符串
+    
+    Args:
+        value: 时间
+        
+    Returns:
+        str: ISO格式时间字符串
+    """
+    return value.isoformat()
+
 
 class Request(BaseModel):
     """
     统一请求格式
     """
-    request_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="请求ID")
+    request_id: str = Field(default_factory=new_request_id, description="请求ID")
     service_id: Optional[str] = Field(None, description="目标服务ID")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="请求时间")
+    timestamp: datetime = Field(default_factory=_utcnow, description="请求时间")
     action: str = Field(..., description="请求动作")
     data: Dict[str, Any] = Field(default_factory=dict, description="请求数据")
     auth: Optional[Dict[str, Any]] = Field(None, description="认证信息")
     
-    class Config:
-        """
-        配置模型的配置
-        """
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    # 序列化为JSON时时间字段输出ISO格式字符串
+    _serialize_datetime = field_serializer("timestamp", when_used="json")(_isoformat)
 
 class Response(BaseModel):
     """
     统一响应格式
     """
     request_id: str = Field(..., description="请求ID")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="响应时间")
+    timestamp: datetime = Field(default_factory=_utcnow, description="响应时间")
     status: str = Field(..., description="响应状态，success表示成功，error表示失败")
     code: int = Field(..., description="响应码，200表示成功，其他表示失败")
     data: Dict[str, Any] = Field(default_factory=dict, description="响应数据")
     error: Optional[str] = Field(None, description="错误信息，仅在status为error时存在")
     
-    class Config:
-        """
-        配置模型的配置
-        """
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    # 序列化为JSON时时间字段输出ISO格式字符串
+    _serialize_datetime = field_serializer("timestamp", when_used="json")(_isoformat)
     
     @classmethod
     def success(cls, request_id: str, data: Dict[str, Any] = None) -> "Response":
@@ -53,17 +108,20 @@ class Response(BaseModel):
         Returns:
             Response: 成功响应对象
         """
-        return cls(
+        # 参数均由网关内部提供，跳过校验直接构造
+        return cls.model_construct(
             request_id=request_id,
+            timestamp=_utcnow(),
             status="success",
             code=200,
-            data=data or {}
+            data=data or {},
+            error=None
         )
     
     @classmethod
-    def error(cls, request_id: str, code: int, error: str) -> "Response":
+    def failure(cls, request_id: str, code: int, error: str) -> "Response":
         """
-        创建错误响应
+        创建错误响应（error 是模型字段名，类方法不能同名，否则会被字段遮蔽）
         
         Args:
             request_id: 请求ID
@@ -73,14 +131,23 @@ class Response(BaseModel):
         Returns:
             Response: 错误响应对象
         """
-        return cls(
+        return cls.model_construct(
             request_id=request_id,
+            timestamp=_utcnow(),
             status="error",
             code=code,
             error=error,
             data={}
         )
 
+class BatchItem(BaseModel):
+    """
+    批量调用中的单个引擎调用
+    """
+    engine_id: str = Field(..., description="目标引擎ID")
+    action: str = Field(..., description="请求动作")
+    data: Dict[str, Any] = Field(default_factory=dict, description="请求数据")
+
 class ServiceInfo(BaseModel):
     """
     服务信息模型
@@ -91,16 +158,11 @@ class ServiceInfo(BaseModel):
     engine_type: str = Field(..., description="引擎类型")
     status: str = Field(..., description="服务状态")
     description: Optional[str] = Field(None, description="服务描述")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="创建时间")
-    updated_at: datetime = Field(default_factory=datetime.utcnow, description="更新时间")
+    created_at: datetime = Field(default_factory=_utcnow, description="创建时间")
+    updated_at: datetime = Field(default_factory=_utcnow, description="更新时间")
     
-    class Config:
-        """
-        配置模型的配置
-        """
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    # 序列化为JSON时时间字段输出ISO格式字符串
+    _serialize_datetime = field_serializer("created_at", "updated_at", when_used="json")(_isoformat)
 
 class APIInfo(BaseModel):
     """
@@ -112,8 +174,4 @@ class APIInfo(BaseModel):
     endpoint: str = Field(..., description="处理函数名称")
     description: Optional[str] = Field(None, description="API描述")
     
-    class Config:
-        """
-        配置模型的配置
-        """
-        allow_population_by_field_name = True
+    model_config = ConfigDict(validate_by_name=True)
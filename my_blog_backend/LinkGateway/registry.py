@@ -1,7 +1,15 @@
 import os
+import re
+import sys
+import ast
 import json
+import types
+import hashlib
+import time
+import compileall
+import threading
 import importlib.util
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from pathlib import Path
 from BaseEngine.base import BaseEngine
 from .db import init_db, ServiceType, ServiceStatus, EngineType
@@ -9,11 +17,62 @@ from .path_manager import PathManager
 from .standards import ServiceStandard, EngineStandard
 from .logs import get_logger
 
+# 优先使用 orjson 解析与序列化服务配置，未安装时退回标准库；
+# orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，原有异常处理保持不变
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(data) -> str:
+        return orjson.dumps(data).decode("utf-8")
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# 枚举成员到取值的映射，读取数据库记录时直接查表，None 等未知值由 get 的默认值处理
+_SERVICE_STATUS_VALUE = {status: status.value for status in ServiceStatus}
+_ENGINE_TYPE_VALUE = {engine_type: engine_type.value for engine_type in EngineType}
+
+# 顶层语句的起始位置：换行后紧跟非空白字符
+_TOP_LEVEL_LINE = re.compile(rb"\n(?=\S)")
+# 类定义头部，用于保留被截断的最后一个类定义
+_CLASS_HEADER = re.compile(rb"class\s+\w+\s*(?:\([^)]*\))?\s*:")
+
+
+def _intern(value: Any) -> Any:
+    """
+    驻留字符串，服务ID、版本号等在注册表的多个字典中重复出现，
+    驻留后各处共享同一对象，字典查找比较时可直接按对象判等
+    
+    Args:
+        value: 待驻留的值，非字符串原样返回
+        
+    Returns:
+        Any: 驻留后的字符串或原值
+    """
+    return sys.intern(value) if type(value) is str else value
+
 class ServiceRegistry:
     """
     服务注册与发现类，负责管理业务和引擎的注册与发现
     """
     
+    # 识别引擎实现文件时读取的文件开头字节数
+    ENGINE_SNIFF_BYTES = 16384
+    # 引擎数量达到该值时并行处理引擎
+    PARALLEL_ENGINE_MIN = 2
+    # 并行处理引擎的最大线程数（包括调用线程）
+    ENGINE_WORKERS = 8
+    # 服务配置验证结果缓存的最大条目数
+    VALIDATION_CACHE_SIZE = 512
+    # 扫描服务和引擎目录时跳过的目录（以 . 开头的隐藏目录同样跳过）
+    SKIPPED_SCAN_DIRS = frozenset({"__pycache__", "node_modules", "venv"})
+    # 文件修改时间距今不足该值（纳秒）时，同一时间戳内可能还有未反映的修改，不计算目录指纹
+    FINGERPRINT_RACY_NS = 1_000_000_000
+    # 服务类型缓存的有效期（秒）
+    SERVICE_TYPE_TTL = 60.0
+    
     def __init__(self, base_path: str):
         """
         初始化服务注册中心
@@ -25,10 +84,37 @@ class ServiceRegistry:
         self.engines: Dict[str, BaseEngine] = {}
         self.businesses: Dict[str, Dict[str, Any]] = {}
         self.services: Dict[str, Any] = {}
+        # 服务信息的版本号，服务或其状态每次变化时递增，供网关判断缓存是否过期
+        self.services_version = 0
         
         self.registered_engines = []
         self.registered_businesses = []
         
+        # 服务发现期间暂存的数据库写入，发现结束后一次性批量写入
+        self._pending_db_writes: List[Dict[str, Any]] = []
+        # 服务发现期间暂存的状态更新 (服务ID, 状态, 原因)，发现结束后一次性批量更新
+        self._pending_status_updates: List[Tuple[str, ServiceStatus, Optional[str]]] = []
+        # 引擎文件识别结果缓存：文件路径 -> (修改时间, 是否为引擎文件)，文件修改后自动失效
+        self._engine_file_cache: Dict[str, Tuple[int, bool]] = {}
+        # 已执行的引擎模块缓存：引擎文件路径 -> (修改时间, 模块)，文件未修改时不再重复执行模块
+        self._module_cache: Dict[str, Tuple[int, types.ModuleType]] = {}
+        # 执行引擎模块时新定义的 BaseEngine 子类：引擎文件路径 -> 子类列表，与模块缓存同步更新
+        self._engine_class_candidates: Dict[str, List[type]] = {}
+        # 引擎模块执行时会修改 sys.path 并按模块名导入同目录下的模块，需逐个执行
+        self._engine_import_lock = threading.Lock()
+        # 串行化注册表（services、businesses、engines）和收集结构的增删，
+        # 读取方遍历时先取 tuple 快照，不加锁
+        self._register_lock = threading.Lock()
+        # 业务配置验证结果缓存：service.json 内容摘要 -> 验证结果，内容未变化时跳过验证
+        self._service_validation_cache: Dict[bytes, Dict[str, Any]] = {}
+        # 引擎配置验证结果缓存：配置文件路径 -> (配置对象, 验证结果)；
+        # 路径管理器在文件未变化时返回同一配置对象，据此判断是否可复用
+        self._engine_validation_cache: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+        # 上次服务发现的 (目录指纹, 完成时的服务版本号, 发现结果)，目录与服务均未变化时直接复用
+        self._last_discovery: Optional[Tuple[bytes, int, Dict[str, Any]]] = None
+        # 服务类型缓存：服务ID -> (服务类型, 过期时间)，服务间调用鉴权时免去数据库查询
+        self._type_cache: Dict[str, Tuple[ServiceType, float]] = {}
+        
         self._initialize_path_manager(base_path)
         self._initialize_logger()
         self._initialize_directories(base_path)
@@ -100,6 +186,14 @@ class ServiceRegistry:
             self.businesses.clear()
             self.engines.clear()
             self.logger.log_progress("服务注册中心初始化完成，但未加载到服务信息")
+        finally:
+            self._mark_services_changed()
+    
+    def _mark_services_changed(self) -> None:
+        """
+        标记服务信息已变化，递增服务版本号
+        """
+        self.services_version += 1
     
     def _load_services_from_db(self) -> None:
         """
@@ -114,81 +208,81 @@ class ServiceRegistry:
             return
         
         try:
-            db_services = self.db_manager.list_services()
+            db_services = self.db_manager.list_services_raw()
             
             if not isinstance(db_services, list):
                 self.logger.log("ERROR", "数据库返回的服务列表格式错误", False)
                 return
             
-            for db_service in db_services:
-                self._process_db_service(db_service)
+            for row in db_services:
+                self._process_db_service(row)
         except Exception as e:
             self.logger.log("ERROR", f"从数据库加载服务信息失败: {str(e)}", False)
             self.services.clear()
             self.businesses.clear()
             self.engines.clear()
     
-    def _process_db_service(self, db_service: Any) -> None:
+    def _process_db_service(self, row: tuple) -> None:
         """
         处理单个数据库服务
         
         Args:
-            db_service: 数据库服务对象
+            row: list_services_raw 返回的服务记录元组
         """
+        service_id = row[0]
         try:
-            service_id = getattr(db_service, 'service_id', None)
             if not service_id:
                 self.logger.log("WARNING", "跳过缺少service_id的服务", None)
                 return
             
-            service_type = getattr(db_service, 'service_type', None)
+            service_type = row[2]
             if not service_type:
                 self.logger.log("WARNING", f"服务 {service_id} 缺少服务类型", None)
                 return
             
-            service_type_value = service_type.value if hasattr(service_type, 'value') else str(service_type)
-            
-            if service_type_value == "business":
-                self._process_business_service(db_service, service_id)
-            elif service_type_value == "engine":
-                self._process_engine_service(db_service, service_id)
+            if service_type is ServiceType.BUSINESS:
+                self._process_business_service(row)
+            elif service_type is ServiceType.ENGINE:
+                self._process_engine_service(row)
         except Exception as e:
-            self.logger.log("ERROR", f"处理服务 {getattr(db_service, 'service_id', 'unknown')} 时出错: {str(e)}", False)
+            self.logger.log("ERROR", f"处理服务 {service_id or 'unknown'} 时出错: {str(e)}", False)
     
-    def _process_business_service(self, db_service: Any, service_id: str) -> None:
+    def _process_business_service(self, row: tuple) -> None:
         """
         处理业务服务
         
         Args:
-            db_service: 数据库服务对象
-            service_id: 服务ID
-        """
-        service_info = {
+            row: list_services_raw 返回的服务记录元组
+        """
+        (service_id, service_name, _, version, status, reason, description,
+         database_config, api_config, business_path, _) = row
+        service_id = _intern(service_id)
+        version = _intern(version)
+        # 直接构建业务信息，数据库和API配置存在时再补充
+        business_info = {
             "service_id": service_id,
-            "service_name": getattr(db_service, 'service_name', service_id),
-            "version": getattr(db_service, 'version', "1.0.0"),
-            "status": getattr(db_service, 'status', None).value if getattr(db_service, 'status', None) else "unknown",
-            "reason": getattr(db_service, 'reason', None),
-            "description": getattr(db_service, 'description', "")
+            "service_name": service_name,
+            "version": version,
+            "status": _SERVICE_STATUS_VALUE.get(status, "unknown"),
+            "reason": reason,
+            "description": description
         }
         
-        business_info = service_info.copy()
-        
-        if getattr(db_service, 'database_config', None):
+        if database_config:
             try:
-                business_info["database"] = json.loads(db_service.database_config)
+                business_info["database"] = _json_loads(database_config)
             except json.JSONDecodeError as e:
                 self.logger.log("ERROR", f"解析服务 {service_id} 的数据库配置失败: {str(e)}", False)
                 business_info["database"] = {}
         
-        if getattr(db_service, 'api_config', None):
+        if api_config:
             try:
-                business_info["apis"] = json.loads(db_service.api_config)
+                business_info["apis"] = _json_loads(api_config)
             except json.JSONDecodeError as e:
                 self.logger.log("ERROR", f"解析服务 {service_id} 的API配置失败: {str(e)}", False)
                 business_info["apis"] = []
         
-        business_info["business_path"] = getattr(db_service, 'business_path', "")
+        business_info["business_path"] = business_path
         
         self.businesses[service_id] = business_info
         self.services[service_id] = {
@@ -196,33 +290,32 @@ class ServiceRegistry:
             "info": business_info
         }
     
-    def _process_engine_service(self, db_service: Any, service_id: str) -> None:
+    def _process_engine_service(self, row: tuple) -> None:
         """
         处理引擎服务
         
         Args:
-            db_service: 数据库服务对象
-            service_id: 服务ID
+            row: list_services_raw 返回的服务记录元组
         """
-        service_info = {
+        service_id, service_name, _, version, status, reason, description, _, _, _, engine_type = row
+        service_id = _intern(service_id)
+        version = _intern(version)
+        engine_info = {
             "service_id": service_id,
-            "service_name": getattr(db_service, 'service_name', service_id),
-            "version": getattr(db_service, 'version', "1.0.0"),
-            "status": getattr(db_service, 'status', None).value if getattr(db_service, 'status', None) else "unknown",
-            "reason": getattr(db_service, 'reason', None),
-            "description": getattr(db_service, 'description', "")
+            "service_name": service_name,
+            "version": version,
+            "status": _SERVICE_STATUS_VALUE.get(status, "unknown"),
+            "reason": reason,
+            "description": description,
+            "engine_type": _ENGINE_TYPE_VALUE.get(engine_type)
         }
         
-        engine_info = service_info.copy()
-        engine_type = getattr(db_service, 'engine_type', None)
-        engine_info["engine_type"] = engine_type.value if engine_type else None
-        
         self.services[service_id] = {
             "type": "engine",
             "info": engine_info
         }
     
-    def _find_config_file(self, directory: str, service_name: str, file_patterns: list) -> str:
+    def _find_config_file(self, directory: str, service_name: str, file_patterns: list, file_names: Optional[List[str]] = None) -> str:
         """
         查找配置文件
         
@@ -230,50 +323,75 @@ class ServiceRegistry:
             directory: 目录路径
             service_name: 服务名称
             file_patterns: 文件模式列表
+            file_names: 目录下的文件名列表，遍历目录时已读取的可直接传入，避免再次读取目录
             
         Returns:
             str: 配置文件路径，未找到返回None
         """
-        for pattern in file_patterns:
-            candidate_path = os.path.join(directory, pattern.format(name=service_name))
-            if os.path.exists(candidate_path):
-                self.logger.debug(f"找到配置文件：{candidate_path}")
-                return candidate_path
-        
-        # 最后尝试查找任何.json文件
-        for file in os.listdir(directory):
-            if file.endswith(".json"):
-                candidate_path = os.path.join(directory, file)
-                self.logger.debug(f"找到配置文件：{candidate_path}（通用JSON文件）")
-                return candidate_path
+        if file_names is None:
+            with os.scandir(directory) as entries:
+                file_names = [entry.name for entry in entries if not entry.is_dir()]
+        
+        # 模式按优先级预先展开，一次遍历文件名同时找出最优匹配和通用JSON文件
+        wanted: Dict[str, int] = {}
+        for rank, pattern in enumerate(file_patterns):
+            wanted.setdefault(pattern.format(name=service_name), rank)
+        
+        matched = None
+        matched_rank = len(file_patterns)
+        fallback = None
+        for file in file_names:
+            rank = wanted.get(file)
+            if rank is not None:
+                if rank < matched_rank:
+                    matched, matched_rank = file, rank
+                    if rank == 0:
+                        break
+            elif fallback is None and file.endswith(".json"):
+                fallback = file
+        
+        if matched is not None:
+            candidate_path = os.path.join(directory, matched)
+            self.logger.debug("找到配置文件：%s", candidate_path)
+            return candidate_path
+        
+        # 最后尝试使用任何.json文件
+        if fallback is not None:
+            candidate_path = os.path.join(directory, fallback)
+            self.logger.debug("找到配置文件：%s（通用JSON文件）", candidate_path)
+            return candidate_path
         
         return None
     
-    def _find_engine_file(self, directory: str, engine_name: str) -> str:
+    def _find_engine_file(self, directory: str, engine_name: str, file_names: Optional[List[str]] = None) -> str:
         """
         查找引擎实现文件
         
         Args:
             directory: 目录路径
             engine_name: 引擎名称
+            file_names: 目录下的文件名列表，遍历目录时已读取的可直接传入，避免再次读取目录
             
         Returns:
             str: 引擎实现文件路径，未找到返回None
         """
+        if file_names is None:
+            file_names = os.listdir(directory)
+        
         # 首先尝试查找与引擎名称同名的.py文件
-        expected_engine_file = os.path.join(directory, f"{engine_name}.py")
-        if os.path.exists(expected_engine_file):
-            self.logger.debug(f"找到引擎实现文件：{expected_engine_file}（与引擎名称同名）")
+        if f"{engine_name}.py" in file_names:
+            expected_engine_file = os.path.join(directory, f"{engine_name}.py")
+            self.logger.debug("找到引擎实现文件：%s（与引擎名称同名）", expected_engine_file)
             return expected_engine_file
         
         # 查找包含引擎类定义的文件
-        for file in os.listdir(directory):
+        for file in file_names:
             if not file.endswith(".py") or file.startswith("_"):
                 continue
             
             # 跳过可能是路由或配置文件的文件
             if "route" in file.lower() or "config" in file.lower() or "test" in file.lower():
-                self.logger.debug(f"跳过非引擎实现文件：{file}")
+                self.logger.debug("跳过非引擎实现文件：%s", file)
                 continue
             
             file_path = os.path.join(directory, file)
@@ -293,35 +411,100 @@ class ServiceRegistry:
             bool: 是引擎文件返回True，否则返回False
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                # 简单检查是否包含引擎类定义
-                if "class " in content and "BaseEngine" in content:
-                    self.logger.debug(f"找到引擎实现文件：{file_path}（包含引擎类定义）")
-                    return True
+            mtime_ns = os.stat(file_path).st_mtime_ns
+            cached = self._engine_file_cache.get(file_path)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+            
+            # 引擎类定义通常位于文件开头，只读取前 16 KiB
+            with open(file_path, "rb") as f:
+                head = f.read(self.ENGINE_SNIFF_BYTES)
+            # 未出现 BaseEngine 字样的文件无需解析
+            is_engine = b"BaseEngine" in head and self._defines_engine_class(head, len(head) == self.ENGINE_SNIFF_BYTES)
+            self._engine_file_cache[file_path] = (mtime_ns, is_engine)
+            if is_engine:
+                self.logger.debug("找到引擎实现文件：%s（包含引擎类定义）", file_path)
+            return is_engine
         except Exception as e:
             self.logger.log("ERROR", f"检查引擎文件失败: {file_path}, 错误: {str(e)}", False)
         
         return False
     
-    def discover_services(self) -> Dict[str, Any]:
+    @staticmethod
+    def _defines_engine_class(source: bytes, truncated: bool) -> bool:
+        """
+        解析源码，检查顶层是否定义了直接继承 BaseEngine 的类，
+        注释和文档字符串中提到 BaseEngine 不会误判
+        
+        Args:
+            source: 源码字节
+            truncated: 源码是否只是文件开头的一部分，是则截断到最后一个顶层语句之前再解析
+            
+        Returns:
+            bool: 定义了引擎类返回True，否则返回False；无法解析时退回按关键字判断
+        """
+        if truncated:
+            # 最后一个顶层语句可能不完整，只解析其之前的部分；若它是类定义，只保留类头
+            boundaries = [m.start() for m in _TOP_LEVEL_LINE.finditer(source)]
+            if boundaries:
+                header = _CLASS_HEADER.match(source, boundaries[-1] + 1)
+                source = source[:boundaries[-1]]
+                if header:
+                    source += b"\n" + header.group(0) + b" pass\n"
+        
+        try:
+            tree = ast.parse(source)
+        except (SyntaxError, ValueError):
+            return b"class " in source and b"BaseEngine" in source
+        
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                for base in node.bases:
+                    if (isinstance(base, ast.Name) and base.id == "BaseEngine") or (
+                        isinstance(base, ast.Attribute) and base.attr == "BaseEngine"
+                    ):
+                        return True
+        return False
+    
+    def discover_services(self, force: bool = False) -> Dict[str, Any]:
         """
         发现所有服务（业务和引擎）
+        服务和引擎目录自上次发现后未变化、且服务信息未被修改时直接返回上次的结果
         
+        Args:
+            force: 是否忽略上次的结果，强制重新发现
+            
         Returns:
             Dict[str, Any]: 发现结果，包含业务和引擎的信息
         """
+        fingerprint = self._discovery_fingerprint()
+        last = self._last_discovery
+        if (not force and fingerprint is not None and last is not None
+                and last[0] == fingerprint and last[1] == self.services_version):
+            self.logger.info("服务目录未变化，沿用上次的服务发现结果")
+            return self._copy_discovery_result(last[2])
+        self._last_discovery = None
+        
         # 清空当前服务信息，避免重复计数
         self.services.clear()
+        # 重新发现时配置文件可能刚被创建，不再沿用“文件不存在”的缓存结果
+        self.path_manager.forget_missing_json_files()
         self.businesses.clear()
         self.engines.clear()
         
         # 清空注册信息收集结构
         self.registered_engines.clear()
         self.registered_businesses.clear()
+        self._pending_db_writes.clear()
+        self._pending_status_updates.clear()
+        # 重新发现后服务类型可能变化
+        self._type_cache.clear()
         
         self.logger.info("开始服务发现...")
         
+        # 发现业务服务的同时在后台预编译引擎模块，发现引擎时直接加载字节码缓存
+        self._prewarm_engine_bytecode()
+        
         # 发现业务
         business_result = []
         try:
@@ -357,6 +540,9 @@ class ServiceRegistry:
         valid_engines = sum(1 for e in engine_result if isinstance(e, dict) and e.get("status") == "valid")
         invalid_engines = engine_count - valid_engines
         
+        self._flush_pending_db_writes()
+        self._mark_services_changed()
+        
         # 统一输出服务发现汇总信息
         self.logger.info(f"服务发现完成：共发现 {total_services} 个服务")
         self.logger.info(f"  - 业务服务：{business_count} 个（有效: {valid_businesses}, 无效: {invalid_businesses}")
@@ -377,7 +563,7 @@ class ServiceRegistry:
                 service_name = engine_info.get('service_name', service_id)
                 self.logger.log("INFO", f"    - 引擎{service_name} 注册成功 服务ID：{service_id}", True)
         
-        return {
+        result = {
             "businesses": business_result,
             "engines": engine_result,
             "total_services": total_services,
@@ -394,6 +580,167 @@ class ServiceRegistry:
                 }
             }
         }
+        
+        # 引擎启动失败可能是暂时的，有失败的引擎时不复用本次结果，下次重新发现；
+        # 发现结束后重新计算指纹，发现期间目录有变化时结果可能不完整，同样不复用
+        if fingerprint is not None and not invalid_engines and self._discovery_fingerprint() == fingerprint:
+            # 缓存副本，调用方修改返回的结果不会影响下次复用
+            self._last_discovery = (fingerprint, self.services_version, self._copy_discovery_result(result))
+        return result
+    
+    @staticmethod
+    def _copy_discovery_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        复制服务发现结果，包括各服务条目和统计信息
+        
+        Args:
+            result: 服务发现结果
+            
+        Returns:
+            Dict[str, Any]: 结果副本
+        """
+        return {
+            "businesses": [dict(item) for item in result["businesses"]],
+            "engines": [dict(item) for item in result["engines"]],
+            "total_services": result["total_services"],
+            "summary": {key: dict(value) for key, value in result["summary"].items()},
+        }
+    
+    def _discovery_fingerprint(self) -> Optional[bytes]:
+        """
+        计算服务和引擎目录的指纹，包含各文件的路径、修改时间和大小以及各目录的路径，不打开任何文件；
+        目录的增删改名已体现在排序后的条目列表中，不计入目录自身的修改时间，
+        导入或预编译引擎时创建 __pycache__ 不会使指纹变化
+        
+        Returns:
+            Optional[bytes]: 目录指纹；有文件刚被修改、指纹不可靠时返回None
+        """
+        racy_after = time.time_ns() - self.FINGERPRINT_RACY_NS
+        digest = hashlib.blake2b(digest_size=16)
+        for root in (self.services_dir, self.engines_dir):
+            stack = [root]
+            while stack:
+                path = stack.pop()
+                try:
+                    with os.scandir(path) as entries:
+                        entries = sorted(entries, key=lambda entry: entry.name)
+                except OSError:
+                    digest.update(f"{path}\0missing\n".encode("utf-8", "surrogateescape"))
+                    continue
+                
+                for entry in entries:
+                    name = entry.name
+                    is_dir = entry.is_dir()
+                    # 与目录扫描一致，跳过的目录不计入指纹
+                    if is_dir and (name[0] == "." or name in self.SKIPPED_SCAN_DIRS):
+                        continue
+                    if is_dir and not entry.is_symlink():
+                        digest.update(f"{entry.path}\0dir\n".encode("utf-8", "surrogateescape"))
+                        stack.append(entry.path)
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    if st.st_mtime_ns >= racy_after:
+                        return None
+                    digest.update(f"{entry.path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode("utf-8", "surrogateescape"))
+        return digest.digest()
+    
+    def _prewarm_engine_bytecode(self) -> Optional[threading.Thread]:
+        """
+        启动后台线程预编译引擎目录下的模块并写入 __pycache__，不等待其完成；
+        文件未修改时 compileall 只比较时间戳，几乎没有开销
+        
+        Returns:
+            Optional[threading.Thread]: 预编译线程，禁止写入字节码或引擎目录不存在时返回None
+        """
+        if sys.dont_write_bytecode or not os.path.isdir(self.engines_dir):
+            return None
+        
+        def compile_engines() -> None:
+            try:
+                # 在当前线程内编译，不从多线程进程中创建子进程；编译错误由引擎加载时报告
+                compileall.compile_dir(self.engines_dir, quiet=2, workers=1)
+            except Exception as e:
+                self.logger.debug("预编译引擎模块失败：%s", e)
+        
+        thread = threading.Thread(target=compile_engines, name="EngineBytecodePrewarm", daemon=True)
+        thread.start()
+        return thread
+    
+    def _queue_status_update(self, service_id: str, status: ServiceStatus, reason: Optional[str] = None) -> None:
+        """
+        暂存服务发现期间的状态更新，发现结束后批量写入数据库
+        
+        Args:
+            service_id: 服务ID
+            status: 服务状态
+            reason: 状态变更原因，可选
+        """
+        self._pending_status_updates.append((service_id, status, reason))
+    
+    def _flush_pending_db_writes(self) -> None:
+        """
+        将服务发现期间暂存的状态更新和服务信息分别在一个事务中批量写入数据库
+        状态更新先于服务信息写入，同一服务两者都有时以服务信息为准
+        """
+        pending_status, self._pending_status_updates = self._pending_status_updates, []
+        pending, self._pending_db_writes = self._pending_db_writes, []
+        if not self.db_manager:
+            return
+        
+        if pending_status:
+            if self.db_manager.bulk_update_status(pending_status):
+                self.logger.debug("已批量更新 %s 个服务的状态", len(pending_status))
+            else:
+                self.logger.log("ERROR", f"批量更新 {len(pending_status)} 个服务的状态失败", False)
+        
+        if not pending:
+            return
+        
+        if self.db_manager.bulk_upsert_services(pending):
+            self.logger.debug("已批量写入 %s 个服务到数据库", len(pending))
+        else:
+            self.logger.log("ERROR", f"批量写入 {len(pending)} 个服务到数据库失败", False)
+    
+    @classmethod
+    def _iter_dirs(cls, root: str, stop_at: Optional[str] = None) -> Iterator[Tuple[str, List[str]]]:
+        """
+        与 os.walk 顺序一致地递归遍历目录，每个目录只用一次 os.scandir 读取，
+        文件类型直接取自目录项，调用方据此判断文件是否存在，无需再 stat 或重新读取目录
+        隐藏目录和 SKIPPED_SCAN_DIRS 中的目录不进入
+        
+        Args:
+            root: 根目录
+            stop_at: 标记文件名，目录中存在该文件时不再进入其子目录
+            
+        Returns:
+            Iterator[Tuple[str, List[str]]]: (目录路径, 该目录下的非目录文件名列表) 迭代器，
+                不进入符号链接指向的目录
+        """
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            files = []
+            subdirs = []
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            name = entry.name
+                            if not entry.is_symlink() and name[0] != "." and name not in cls.SKIPPED_SCAN_DIRS:
+                                subdirs.append(entry.path)
+                        else:
+                            files.append(entry.name)
+            except OSError:
+                continue
+            
+            yield path, files
+            if stop_at is not None and stop_at in files:
+                continue
+            # 逆序入栈，子目录按读取顺序先序遍历
+            stack.extend(reversed(subdirs))
     
     def discover_businesses(self) -> List[Dict[str, Any]]:
         """
@@ -406,19 +753,18 @@ class ServiceRegistry:
         
         # 确保服务目录存在
         if not os.path.exists(self.services_dir):
-            self.logger.debug(f"业务服务目录不存在：{self.services_dir}")
+            self.logger.debug("业务服务目录不存在：%s", self.services_dir)
             return result
         
-        self.logger.debug(f"开始扫描业务服务目录：{self.services_dir}")
+        self.logger.debug("开始扫描业务服务目录：%s", self.services_dir)
         
-        # 递归扫描服务目录下的所有文件夹
-        for root, dirs, files in os.walk(self.services_dir):
+        # 递归扫描服务目录下的所有文件夹，服务目录内部不再向下扫描
+        for root, files in self._iter_dirs(self.services_dir, stop_at="service.json"):
             # 只在DEBUG级别下输出扫描目录信息，正常运行时不输出
-            self.logger.debug(f"扫描目录：{root}")
+            self.logger.debug("扫描目录：%s", root)
             
-            # 检查当前目录下是否有 service.json 文件
-            service_json_path = os.path.join(root, "service.json")
-            if os.path.exists(service_json_path):
+            # 检查当前目录下是否有 service.json 文件（文件名在遍历目录时已读取）
+            if "service.json" in files:
                 # 处理业务服务，使用文件夹名称作为业务名称
                 business_name = os.path.basename(root)
                 business_path = root
@@ -439,14 +785,14 @@ class ServiceRegistry:
         Returns:
             Dict[str, Any]: 业务处理结果
         """
-        self.logger.debug(f"正在处理业务服务：{business_name}，路径：{business_path}")
+        self.logger.debug("正在处理业务服务：%s，路径：%s", business_name, business_path)
         
         # 检查是否存在 service.json 文件
         service_json_path = self.path_manager.get_service_json_path(business_path)
         if not os.path.exists(service_json_path):
             self.logger.error(f"业务服务 {business_name} 缺少 service.json 文件")
             # 保存到数据库
-            self.db_manager.update_service_status(
+            self._queue_status_update(
                 business_name,
                 ServiceStatus.INVALID,
                 "Missing service.json file"
@@ -460,17 +806,25 @@ class ServiceRegistry:
         
         try:
             # 解析 service.json 文件
-            with open(service_json_path, "r", encoding="utf-8") as f:
-                service_info = json.load(f)
-            self.logger.debug(f"成功解析业务服务 {business_name} 的 service.json 文件")
+            with open(service_json_path, "rb") as f:
+                data = f.read()
+            service_info = _json_loads(data)
+            self.logger.debug("成功解析业务服务 %s 的 service.json 文件", business_name)
             
-            # 使用服务标准验证配置文件
-            validation_result = ServiceStandard.validate_service_json(service_info)
+            # 使用服务标准验证配置文件，内容未变化时复用上次的验证结果
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            validation_result = self._service_validation_cache.get(digest)
+            if validation_result is None:
+                validation_result = ServiceStandard.validate_service_json(service_info)
+                if len(self._service_validation_cache) >= self.VALIDATION_CACHE_SIZE:
+                    # 淘汰最早加入的结果
+                    del self._service_validation_cache[next(iter(self._service_validation_cache))]
+                self._service_validation_cache[digest] = validation_result
             if not validation_result["valid"]:
                 service_id = service_info.get("service_id", business_name)
                 self.logger.log("ERROR", f"业务服务 {service_id} 的配置验证失败: {validation_result['reason']}", False)
                 # 保存到数据库
-                self.db_manager.update_service_status(
+                self._queue_status_update(
                     service_id,
                     ServiceStatus.INVALID,
                     validation_result["reason"]
@@ -482,14 +836,14 @@ class ServiceRegistry:
                     "reason": validation_result["reason"]
                 }
             
-            self.logger.debug(f"业务服务 {service_info.get('service_id', business_name)} 的配置验证成功")
+            self.logger.debug("业务服务 %s 的配置验证成功", service_info.get('service_id', business_name))
             
             # 检查业务是否提供数据库连接信息
             if "database" not in service_info or not service_info["database"]:
                 service_id = service_info["service_id"]
                 self.logger.log("ERROR", f"业务服务 {service_id} 缺少数据库配置", False)
                 # 保存到数据库
-                self.db_manager.update_service_status(
+                self._queue_status_update(
                     service_id,
                     ServiceStatus.INVALID,
                     "Missing database configuration"
@@ -505,11 +859,14 @@ class ServiceRegistry:
             # 获取数据库配置
             db_config = service_info["database"]
             
+            service_id = _intern(service_info["service_id"])
+            version = _intern(service_info["version"])
+            
             # 注册业务
             business_info = {
-                "service_id": service_info["service_id"],
+                "service_id": service_id,
                 "service_name": service_info["service_name"],
-                "version": service_info["version"],
+                "version": version,
                 "description": service_info.get("description", ""),
                 "database": db_config,
                 "apis": service_info.get("apis", []),
@@ -517,44 +874,39 @@ class ServiceRegistry:
                 "business_path": business_path
             }
             
-            service_id = service_info["service_id"]
-            
             # 添加到业务注册表
-            self.businesses[service_id] = business_info
-            self.services[service_id] = {
-                "type": "business",
-                "info": business_info
-            }
+            with self._register_lock:
+                self.businesses[service_id] = business_info
+                self.services[service_id] = {
+                    "type": "business",
+                    "info": business_info
+                }
             
             # 保存到数据库
             db_service_info = {
                 "service_id": service_id,
                 "service_name": service_info["service_name"],
                 "service_type": ServiceType.BUSINESS,
-                "version": service_info["version"],
+                "version": version,
                 "status": ServiceStatus.VALID,
                 "description": service_info.get("description", ""),
-                "database_config": json.dumps(db_config),
-                "api_config": json.dumps(service_info.get("apis", [])),
+                "database_config": _json_dumps(db_config),
+                "api_config": _json_dumps(service_info.get("apis", [])),
                 "business_path": business_path
             }
             
-            if self.db_manager.service_exists(service_id):
-                self.db_manager.update_service(service_id, db_service_info)
-                self.logger.debug(f"已更新业务服务 {service_id} 到数据库")
-            else:
-                self.db_manager.add_service(db_service_info)
-                self.logger.debug(f"已注册业务服务 {service_id} 到数据库")
+            # 暂存，服务发现结束后批量写入
+            self._pending_db_writes.append(db_service_info)
             
             # 将注册成功的业务服务信息添加到收集结构
             self.registered_businesses.append(business_info)
             
-            self.logger.debug(f"业务服务 {service_id} 处理完成，状态: 有效")
+            self.logger.debug("业务服务 %s 处理完成，状态: 有效", service_id)
             return business_info
         except json.JSONDecodeError as e:
             self.logger.log("ERROR", f"业务服务 {business_name} 的 service.json 文件格式无效: {str(e)}", False)
             # 保存到数据库
-            self.db_manager.update_service_status(
+            self._queue_status_update(
                 business_name,
                 ServiceStatus.INVALID,
                 f"Invalid service.json format: {str(e)}"
@@ -568,7 +920,7 @@ class ServiceRegistry:
         except Exception as e:
             self.logger.log("ERROR", f"处理业务服务 {business_name} 失败: {str(e)}", False)
             # 保存到数据库
-            self.db_manager.update_service_status(
+            self._queue_status_update(
                 business_name,
                 ServiceStatus.INVALID,
                 f"Error processing business: {str(e)}"
@@ -591,47 +943,88 @@ class ServiceRegistry:
         
         # 确保引擎目录存在
         if not os.path.exists(self.engines_dir):
-            self.logger.debug(f"引擎目录不存在：{self.engines_dir}")
+            self.logger.debug("引擎目录不存在：%s", self.engines_dir)
             return result
         
-        self.logger.debug(f"开始扫描引擎目录：{self.engines_dir}")
+        self.logger.debug("开始扫描引擎目录：%s", self.engines_dir)
         
-        # 递归扫描引擎目录下的所有文件夹
-        for root, dirs, files in os.walk(self.engines_dir):
-            self.logger.debug(f"扫描目录：{root}")
+        engine_tasks = []
+        # 递归扫描引擎目录下的所有文件夹，先收集引擎再统一处理
+        for root, files in self._iter_dirs(self.engines_dir):
+            self.logger.debug("扫描目录：%s", root)
             
             engine_name = os.path.basename(root)
             
-            # 查找引擎配置文件
-            engine_json_path = self._find_config_file(root, engine_name, ["{name}.json", "engine.json"])
+            # 查找引擎配置文件，复用遍历目录时读取的文件名
+            engine_json_path = self._find_config_file(root, engine_name, ["{name}.json", "engine.json"], files)
             
             if engine_json_path:
                 # 查找引擎实现文件
-                engine_file = self._find_engine_file(root, engine_name)
+                engine_file = self._find_engine_file(root, engine_name, files)
                 
                 if engine_file:
-                    engine_info = self._process_engine(engine_name, engine_file)
-                    result.append(engine_info)
+                    engine_tasks.append((engine_name, engine_file, engine_json_path))
                 else:
-                    self.logger.debug(f"在目录 {root} 中未找到有效的引擎实现文件")
+                    self.logger.debug("在目录 %s 中未找到有效的引擎实现文件", root)
         
+        result.extend(self._process_engines(engine_tasks))
         return result
     
-    def _process_engine(self, engine_name: str, engine_path: str) -> Dict[str, Any]:
+    def _process_engines(self, engine_tasks: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+        """
+        处理多个引擎，引擎数量达到阈值时由多个线程并行处理，
+        引擎启动等待的 I/O 可以相互重叠；调用线程也参与处理，工作线程未能运行时仍能处理全部引擎
+        
+        Args:
+            engine_tasks: (引擎名称, 引擎实现文件路径, 引擎配置文件路径) 列表
+            
+        Returns:
+            List[Dict[str, Any]]: 与任务顺序一致的引擎处理结果列表
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(engine_tasks)
+        next_index = iter(range(len(engine_tasks))).__next__
+        lock = threading.Lock()
+        
+        def engine_worker() -> None:
+            while True:
+                with lock:
+                    try:
+                        index = next_index()
+                    except StopIteration:
+                        return
+                results[index] = self._process_engine(*engine_tasks[index])
+        
+        threads = []
+        if len(engine_tasks) >= self.PARALLEL_ENGINE_MIN:
+            workers = min(self.ENGINE_WORKERS, (os.cpu_count() or 1) * 2, len(engine_tasks))
+            threads = [
+                threading.Thread(target=engine_worker, name="EngineDiscovery", daemon=True)
+                for _ in range(workers - 1)
+            ]
+            for thread in threads:
+                thread.start()
+        engine_worker()
+        for thread in threads:
+            thread.join()
+        return results
+    
+    def _process_engine(self, engine_name: str, engine_path: str, engine_json_path: Optional[str] = None) -> Dict[str, Any]:
         """
         处理单个引擎
         
         Args:
             engine_name: 引擎名称（文件夹名称）
             engine_path: 引擎路径
+            engine_json_path: 已找到的引擎配置文件路径，未提供时在引擎目录中查找
             
         Returns:
             Dict[str, Any]: 引擎处理结果
         """
-        self.logger.debug(f"正在处理引擎服务：{engine_name}，路径：{engine_path}")
+        self.logger.debug("正在处理引擎服务：%s，路径：%s", engine_name, engine_path)
         
         engine_dir = self._get_engine_dir(engine_path)
-        engine_json_path = self._find_engine_config_file(engine_dir, engine_name)
+        if engine_json_path is None:
+            engine_json_path = self._find_engine_config_file(engine_dir, engine_name)
         
         if not engine_json_path:
             return self._build_engine_error_result(
@@ -659,7 +1052,7 @@ class ServiceRegistry:
             
             engine_metadata = self._start_and_register_engine(engine, engine_config, engine_path)
             
-            self.logger.debug(f"引擎服务 {engine_metadata['service_id']} 处理完成，状态: {'有效' if engine.status == 'running' else '无效'}")
+            self.logger.debug("引擎服务 %s 处理完成，状态: %s", engine_metadata['service_id'], '有效' if engine.status == 'running' else '无效')
             return {
                 "service_id": engine_metadata["service_id"],
                 "service_name": engine_metadata["service_name"],
@@ -707,7 +1100,7 @@ class ServiceRegistry:
         
         if not engine_json_path:
             self.logger.log("ERROR", f"引擎服务 {engine_name} 缺少配置文件，查找目录：{engine_dir}", False)
-            self.db_manager.update_service_status(
+            self._queue_status_update(
                 engine_name,
                 ServiceStatus.INVALID,
                 f"Missing engine configuration file. Searched directory: {engine_dir}"
@@ -727,20 +1120,25 @@ class ServiceRegistry:
             Optional[Dict[str, Any]]: 配置信息，验证失败返回None
         """
         engine_config = self.path_manager.load_json_file(engine_json_path)
-        self.logger.debug(f"成功加载引擎服务 {engine_name} 的配置文件：{engine_json_path}")
+        self.logger.debug("成功加载引擎服务 %s 的配置文件：%s", engine_name, engine_json_path)
         
-        validation_result = EngineStandard.validate_engine_json(engine_config)
+        cached = self._engine_validation_cache.get(engine_json_path)
+        if cached is not None and cached[0] is engine_config:
+            validation_result = cached[1]
+        else:
+            validation_result = EngineStandard.validate_engine_json(engine_config)
+            self._engine_validation_cache[engine_json_path] = (engine_config, validation_result)
         if not validation_result["valid"]:
             service_id = engine_config.get("service_id", engine_name)
             self.logger.log("ERROR", f"引擎服务 {service_id} 的配置验证失败: {validation_result['reason']}", False)
-            self.db_manager.update_service_status(
+            self._queue_status_update(
                 service_id,
                 ServiceStatus.INVALID,
                 validation_result["reason"]
             )
             return None
         
-        self.logger.debug(f"引擎服务 {engine_config.get('service_id', engine_name)} 的配置验证成功")
+        self.logger.debug("引擎服务 %s 的配置验证成功", engine_config.get('service_id', engine_name))
         return engine_config
     
     def _load_and_create_engine(self, engine_config: Dict[str, Any], engine_path: str, engine_name: str) -> Optional[BaseEngine]:
@@ -758,50 +1156,102 @@ class ServiceRegistry:
         service_id = engine_config.get("service_id", engine_name)
         service_name = engine_config.get("service_name", service_id)
         
-        self.logger.debug(f"正在创建引擎服务 {service_id} 的实例...")
+        self.logger.debug("正在创建引擎服务 %s 的实例...", service_id)
         
-        spec = importlib.util.spec_from_file_location(service_id, engine_path)
-        if not spec or not spec.loader:
+        engine_module = self._load_engine_module(service_id, engine_path)
+        if engine_module is None:
             self.logger.log("ERROR", f"引擎服务 {service_id} 模块加载失败", False)
-            self.db_manager.update_service_status(
+            self._queue_status_update(
                 service_id,
                 ServiceStatus.INVALID,
                 "Failed to load engine module"
             )
             return None
         
-        engine_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(engine_module)
-        self.logger.debug(f"成功导入引擎模块：{engine_path}")
-        
-        engine_class = self._find_engine_class(engine_module, service_id)
+        candidates = self._engine_class_candidates.get(engine_path)
+        engine_class = self._find_engine_class(engine_module, service_id, candidates)
         if not engine_class:
             return None
         
-        self.logger.debug(f"找到引擎类：{engine_class.__name__}")
+        self.logger.debug("找到引擎类：%s", engine_class.__name__)
         
         engine = self._create_engine_instance(engine_class, service_id, service_name, engine_config)
         self._start_engine_safely(engine, service_id)
         
         return engine
     
-    def _find_engine_class(self, engine_module: Any, service_id: str) -> Optional[type]:
+    def _load_engine_module(self, service_id: str, engine_path: str) -> Optional[types.ModuleType]:
+        """
+        加载引擎模块，引擎文件未修改时直接复用已执行的模块；模块逐个执行
+        
+        Args:
+            service_id: 服务ID，作为模块名
+            engine_path: 引擎实现文件路径
+            
+        Returns:
+            Optional[types.ModuleType]: 引擎模块，无法创建模块规格时返回None
+        """
+        with self._engine_import_lock:
+            mtime_ns = os.stat(engine_path).st_mtime_ns
+            cached = self._module_cache.get(engine_path)
+            if cached is not None and cached[0] == mtime_ns:
+                self.logger.debug("复用已加载的引擎模块：%s", engine_path)
+                return cached[1]
+            
+            spec = importlib.util.spec_from_file_location(service_id, engine_path)
+            if not spec or not spec.loader:
+                return None
+            
+            engine_module = importlib.util.module_from_spec(spec)
+            # 执行前登记到 sys.modules，模块内的 dataclasses、typing.get_type_hints 等依赖按模块名查找；
+            # 不覆盖同名的其他模块
+            previous = sys.modules.get(service_id)
+            registered = previous is None or (cached is not None and previous is cached[1])
+            if registered:
+                sys.modules[service_id] = engine_module
+            # 记录执行前已有的子类，执行后的差集即模块新定义的引擎类
+            before = set(BaseEngine.__subclasses__())
+            try:
+                spec.loader.exec_module(engine_module)
+            except BaseException:
+                if registered:
+                    if previous is None:
+                        sys.modules.pop(service_id, None)
+                    else:
+                        sys.modules[service_id] = previous
+                self._module_cache.pop(engine_path, None)
+                self._engine_class_candidates.pop(engine_path, None)
+                raise
+            
+            self._module_cache[engine_path] = (mtime_ns, engine_module)
+            self._engine_class_candidates[engine_path] = [
+                cls for cls in BaseEngine.__subclasses__()
+                if cls not in before and cls.__module__ == engine_module.__name__
+            ]
+            self.logger.debug("成功导入引擎模块：%s", engine_path)
+            return engine_module
+    
+    def _find_engine_class(self, engine_module: Any, service_id: str, candidates: Optional[List[type]] = None) -> Optional[type]:
         """
         查找引擎类
         
         Args:
             engine_module: 引擎模块
             service_id: 服务ID
+            candidates: 执行模块时新定义的 BaseEngine 子类，为空时退回扫描模块属性
             
         Returns:
             Optional[type]: 引擎类，未找到返回None
         """
+        if candidates:
+            return candidates[0]
+        
         for name, cls in engine_module.__dict__.items():
             if isinstance(cls, type) and issubclass(cls, BaseEngine) and cls != BaseEngine:
                 return cls
         
         self.logger.log("ERROR", f"引擎服务 {service_id} 中未找到继承自 BaseEngine 的类", False)
-        self.db_manager.update_service_status(
+        self._queue_status_update(
             service_id,
             ServiceStatus.INVALID,
             "No class inheriting from BaseEngine found"
@@ -821,7 +1271,7 @@ class ServiceRegistry:
         Returns:
             BaseEngine: 引擎实例
         """
-        self.logger.debug(f"正在初始化引擎实例：{service_id}")
+        self.logger.debug("正在初始化引擎实例：%s", service_id)
         engine = engine_class(service_id, engine_config["version"])
         engine.service_name = service_name
         engine.engine_type = engine_config["engine_type"]
@@ -835,7 +1285,7 @@ class ServiceRegistry:
             engine: 引擎实例
             service_id: 服务ID
         """
-        self.logger.debug(f"正在启动引擎：{service_id}")
+        self.logger.debug("正在启动引擎：%s", service_id)
         try:
             start_result = self._start_engine_with_timeout(engine, service_id, timeout=30)
             if start_result:
@@ -859,12 +1309,13 @@ class ServiceRegistry:
             Dict[str, Any]: 引擎元数据
         """
         engine_metadata = engine.get_metadata()
-        self.logger.debug(f"引擎实例初始化完成，元数据：{engine_metadata}")
+        self.logger.debug("引擎实例初始化完成，元数据：%s", engine_metadata)
         
-        self._register_engine_to_memory(engine_metadata, engine)
-        self._register_engine_to_db(engine_metadata, engine_config, engine_path)
-        
-        self.registered_engines.append(engine_metadata)
+        with self._register_lock:
+            self._register_engine_to_memory(engine_metadata, engine)
+            self._register_engine_to_db(engine_metadata, engine_config, engine_path)
+            
+            self.registered_engines.append(engine_metadata)
         return engine_metadata
     
     def _register_engine_to_memory(self, engine_metadata: Dict[str, Any], engine: BaseEngine) -> None:
@@ -875,27 +1326,34 @@ class ServiceRegistry:
             engine_metadata: 引擎元数据
             engine: 引擎实例
         """
-        self.engines[engine_metadata["service_id"]] = engine
-        self.services[engine_metadata["service_id"]] = {
+        service_id = _intern(engine_metadata["service_id"])
+        self.engines[service_id] = engine
+        self.services[service_id] = {
             "type": "engine",
             "info": engine_metadata
         }
-        self.logger.debug(f"引擎服务 {engine_metadata['service_id']} 已注册到内存注册表")
+        self.logger.debug("引擎服务 %s 已注册到内存注册表", service_id)
     
     def _register_engine_to_db(self, engine_metadata: Dict[str, Any], engine_config: Dict[str, Any], engine_path: str) -> None:
         """
-        注册引擎到数据库
+        注册引擎到数据库（暂存，服务发现结束后批量写入）
         
         Args:
             engine_metadata: 引擎元数据
             engine_config: 引擎配置
             engine_path: 引擎路径
         """
-        service_status = ServiceStatus.VALID if engine_metadata.get("status") == "running" else ServiceStatus.INVALID
-        reason = None if engine_metadata.get("status") == "running" else f"Engine startup failed, current status: {engine_metadata.get('status')}"
+        # 状态只读取和比较一次
+        status = engine_metadata.get("status")
+        if status == "running":
+            service_status = ServiceStatus.VALID
+            reason = None
+        else:
+            service_status = ServiceStatus.INVALID
+            reason = f"Engine startup failed, current status: {status}"
         
         db_service_info = {
-            "service_id": engine_metadata["service_id"],
+            "service_id": _intern(engine_metadata["service_id"]),
             "service_name": engine_metadata["service_name"],
             "service_type": ServiceType.ENGINE,
             "version": engine_metadata["version"],
@@ -906,12 +1364,8 @@ class ServiceRegistry:
             "engine_path": engine_path
         }
         
-        if self.db_manager.service_exists(engine_metadata["service_id"]):
-            self.db_manager.update_service(engine_metadata["service_id"], db_service_info)
-            self.logger.debug(f"已更新引擎服务 {engine_metadata['service_id']} 到数据库")
-        else:
-            self.db_manager.add_service(db_service_info)
-            self.logger.debug(f"已注册引擎服务 {engine_metadata['service_id']} 到数据库")
+        # 暂存，服务发现结束后批量写入
+        self._pending_db_writes.append(db_service_info)
     
     def _build_engine_error_result(self, service_id: str, service_name: str, reason: str) -> Dict[str, Any]:
         """
@@ -925,7 +1379,7 @@ class ServiceRegistry:
         Returns:
             Dict[str, Any]: 错误结果
         """
-        self.db_manager.update_service_status(
+        self._queue_status_update(
             service_id,
             ServiceStatus.INVALID,
             reason
@@ -949,9 +1403,6 @@ class ServiceRegistry:
         Returns:
             bool: 启动成功返回True，失败返回False
         """
-        import threading
-        import time
-        
         result = {"success": False, "error": None}
         
         def start_engine():
@@ -960,8 +1411,9 @@ class ServiceRegistry:
             except Exception as e:
                 result["error"] = str(e)
         
-        # 创建启动线程
-        thread = threading.Thread(target=start_engine, daemon=True)
+        # 每次启动使用独立的守护线程，超时后可直接放弃，卡住的 start() 不会占用共享的工作线程；
+        # 多个引擎的启动已由 _process_engines 并行进行
+        thread = threading.Thread(target=start_engine, name=f"EngineStart-{service_id}", daemon=True)
         thread.start()
         
         # 等待线程完成或超时
@@ -1026,45 +1478,77 @@ class ServiceRegistry:
             List[Dict[str, Any]]: 服务列表，包含完整的服务信息
         """
         result = []
-        for service_id, service_info in self.services.items():
+        # 一次查询取出数据库中的全部服务，不再逐个服务查询
+        db_services = self._get_db_services_by_id()
+        # 遍历快照，其他线程同时注册或注销服务时不会改变正在遍历的内容
+        for service_id, service_info in tuple(self.services.items()):
             if service_type is None or service_info["type"] == service_type:
                 # 从数据库获取完整的服务信息
-                db_service = self.db_manager.get_service(service_id)
+                db_service = db_services.get(service_id)
                 
+                service_kind = service_info["type"]
                 # 复制原始info，确保包含business_path
                 info_copy = service_info["info"].copy()
                 
-                # 根据服务类型添加特有字段到info中
-                if service_info["type"] == "business" and db_service:
-                    info_copy["business_path"] = db_service.business_path
+                if db_service:
+                    # 数据库记录的属性各读取一次
+                    last_check_at = db_service.last_check_at
+                    database_info = {
+                        "status": _SERVICE_STATUS_VALUE.get(db_service.status, "unknown"),
+                        "reason": db_service.reason,
+                        "created_at": db_service.created_at.isoformat(),
+                        "updated_at": db_service.updated_at.isoformat(),
+                        "last_check_at": last_check_at.isoformat() if last_check_at else None,
+                        "version": db_service.version,
+                        "description": db_service.description
+                    }
+                    
+                    # 根据服务类型添加特有字段到info和database_info中
+                    if service_kind == "business":
+                        business_path = db_service.business_path
+                        info_copy["business_path"] = business_path
+                        database_info["business_path"] = business_path
+                    elif service_kind == "engine":
+                        database_info["engine_type"] = _ENGINE_TYPE_VALUE.get(db_service.engine_type)
+                        database_info["engine_path"] = db_service.engine_path
+                else:
+                    database_info = {
+                        "status": "unknown",
+                        "reason": None,
+                        "created_at": None,
+                        "updated_at": None,
+                        "last_check_at": None,
+                        "version": None,
+                        "description": None
+                    }
                 
                 # 构建完整的服务信息
                 complete_service_info = {
                     "service_id": service_id,
-                    "type": service_info["type"],
+                    "type": service_kind,
                     "info": info_copy,
-                    "database_info": {
-                        "status": db_service.status.value if db_service else "unknown",
-                        "reason": db_service.reason if db_service else None,
-                        "created_at": db_service.created_at.isoformat() if db_service else None,
-                        "updated_at": db_service.updated_at.isoformat() if db_service else None,
-                        "last_check_at": db_service.last_check_at.isoformat() if db_service and db_service.last_check_at else None,
-                        "version": db_service.version if db_service else None,
-                        "description": db_service.description if db_service else None
-                    }
+                    "database_info": database_info
                 }
                 
-                # 根据服务类型添加特有字段到database_info中
-                if service_info["type"] == "business" and db_service:
-                    complete_service_info["database_info"]["business_path"] = db_service.business_path
-                elif service_info["type"] == "engine" and db_service:
-                    complete_service_info["database_info"]["engine_type"] = db_service.engine_type.value if db_service.engine_type else None
-                    complete_service_info["database_info"]["engine_path"] = db_service.engine_path
-                
                 result.append(complete_service_info)
         
         return result
     
+    def _get_db_services_by_id(self) -> Dict[str, Any]:
+        """
+        一次查询数据库中的全部服务，按服务ID建立索引
+        
+        Returns:
+            Dict[str, Any]: 服务ID到数据库服务记录的映射，数据库不可用时为空
+        """
+        if not self.db_manager:
+            return {}
+        
+        db_services = self.db_manager.list_services()
+        if not isinstance(db_services, list):
+            return {}
+        return {service.service_id: service for service in db_services if service.service_id}
+    
     def register_service(self, service_info: Dict[str, Any]) -> bool:
         """
         手动注册服务
@@ -1089,20 +1573,20 @@ class ServiceRegistry:
         Returns:
             bool: 注销成功返回True，失败返回False
         """
-        # 从服务注册表中移除
-        if service_id in self.services:
-            del self.services[service_id]
-        
-        # 从业务注册表中移除
-        if service_id in self.businesses:
-            del self.businesses[service_id]
-        
-        # 从引擎注册表中移除
-        if service_id in self.engines:
-            del self.engines[service_id]
+        with self._register_lock:
+            # 从服务注册表中移除
+            self.services.pop(service_id, None)
+            
+            # 从业务注册表中移除
+            self.businesses.pop(service_id, None)
+            
+            # 从引擎注册表中移除
+            self.engines.pop(service_id, None)
         
         # 从数据库中移除
         self.db_manager.delete_service(service_id)
+        self._type_cache.pop(service_id, None)
+        self._mark_services_changed()
         
         return True
     
@@ -1118,7 +1602,7 @@ class ServiceRegistry:
         self.businesses.clear()
         self.engines.clear()
         
-        result = self.discover_services()
+        result = self.discover_services(force=True)
         self.logger.log_success("服务重新加载完成")
         return result
     
@@ -1134,31 +1618,39 @@ class ServiceRegistry:
         Returns:
             bool: 更新成功返回True，失败返回False
         """
-        status = ServiceStatus.VALID if is_healthy else ServiceStatus.INVALID
+        if is_healthy:
+            status, status_value, engine_status = ServiceStatus.VALID, "valid", "running"
+        else:
+            status, status_value, engine_status = ServiceStatus.INVALID, "invalid", "failed"
         
         # 更新数据库中的服务状态
         db_update_result = self.db_manager.update_service_status(service_id, status, reason)
         
         # 同时更新内存中的服务状态
-        if db_update_result and service_id in self.services:
-            service_info = self.services[service_id]
+        service_info = self.services.get(service_id) if db_update_result else None
+        if service_info is not None:
             # 更新内存中的状态信息
-            if "info" in service_info:
-                service_info["info"]["status"] = "valid" if is_healthy else "invalid"
+            info = service_info.get("info")
+            if info is not None:
+                info["status"] = status_value
                 if reason:
-                    service_info["info"]["reason"] = reason
+                    info["reason"] = reason
             
             # 如果是业务服务，也更新businesses中的状态
-            if service_id in self.businesses:
-                self.businesses[service_id]["status"] = "valid" if is_healthy else "invalid"
+            business_info = self.businesses.get(service_id)
+            if business_info is not None:
+                business_info["status"] = status_value
                 if reason:
-                    self.businesses[service_id]["reason"] = reason
+                    business_info["reason"] = reason
             
             # 如果是引擎服务，也更新engines中的状态
-            if service_id in self.engines:
-                engine = self.engines[service_id]
-                engine.status = "running" if is_healthy else "failed"
+            engine = self.engines.get(service_id)
+            if engine is not None:
+                engine.status = engine_status
         
+        if db_update_result:
+            self._type_cache.pop(service_id, None)
+            self._mark_services_changed()
         return db_update_result
     
     def check_service_health(self, service_id: str) -> bool:
@@ -1238,7 +1730,7 @@ class ServiceRegistry:
         
         try:
             service = self.db_manager.get_service(service_id)
-            if service and hasattr(service, "status"):
+            if service:
                 return service.status == ServiceStatus.VALID
         except Exception as e:
             self.logger.log("ERROR", f"从数据库检查服务健康状态失败: {str(e)}", False)
@@ -1258,24 +1750,27 @@ class ServiceRegistry:
         }
         
         try:
-            self._check_memory_services_health(result)
-            self._check_db_services_health(result)
+            # 数据库中的服务只查询一次，供内存服务和仅存在于数据库的服务共同使用
+            db_services = self._get_db_services_by_id()
+            self._check_memory_services_health(result, db_services)
+            self._check_db_services_health(result, db_services)
         except Exception as e:
             self.logger.log("ERROR", f"检查所有服务健康状态失败: {str(e)}", False)
             return {"healthy": [], "unhealthy": []}
         
         return result
     
-    def _check_memory_services_health(self, result: Dict[str, Any]) -> None:
+    def _check_memory_services_health(self, result: Dict[str, Any], db_services: Dict[str, Any]) -> None:
         """
         检查内存中所有服务的健康状态
         
         Args:
             result: 结果字典，用于存储健康检查结果
+            db_services: 服务ID到数据库服务记录的映射
         """
-        for service_id, service_info in self.services.items():
+        for service_id, service_info in tuple(self.services.items()):
             try:
-                is_healthy, reason = self._check_single_memory_service_health(service_id, service_info)
+                is_healthy, reason = self._check_single_memory_service_health(service_id, service_info, db_services)
                 
                 if is_healthy:
                     result["healthy"].append(service_id)
@@ -1291,13 +1786,14 @@ class ServiceRegistry:
                     "reason": f"Health check failed: {str(e)}"
                 })
     
-    def _check_single_memory_service_health(self, service_id: str, service_info: Dict[str, Any]) -> tuple:
+    def _check_single_memory_service_health(self, service_id: str, service_info: Dict[str, Any], db_services: Dict[str, Any]) -> tuple:
         """
         检查单个内存服务的健康状态
         
         Args:
             service_id: 服务ID
             service_info: 服务信息
+            db_services: 服务ID到数据库服务记录的映射
             
         Returns:
             tuple: (is_healthy, reason)
@@ -1316,14 +1812,11 @@ class ServiceRegistry:
         reason = info.get("reason")
         is_healthy = status == "valid"
         
-        if not is_healthy and self.db_manager:
-            try:
-                service = self.db_manager.get_service(service_id)
-                if service and hasattr(service, "status"):
-                    is_healthy = service.status == ServiceStatus.VALID
-                    reason = getattr(service, "reason", None)
-            except Exception as e:
-                self.logger.error(f"从数据库检查服务 {service_id} 健康状态失败: {str(e)}")
+        if not is_healthy:
+            service = db_services.get(service_id)
+            if service:
+                is_healthy = service.status == ServiceStatus.VALID
+                reason = service.reason
         
         if service_info.get("type") == "engine" and service_id in self.engines:
             engine = self.engines[service_id]
@@ -1333,55 +1826,39 @@ class ServiceRegistry:
         
         return is_healthy, reason
     
-    def _check_db_services_health(self, result: Dict[str, Any]) -> None:
+    def _check_db_services_health(self, result: Dict[str, Any], db_services: Dict[str, Any]) -> None:
         """
         检查数据库中存在但内存中不存在的服务
         
         Args:
             result: 结果字典，用于存储健康检查结果
+            db_services: 服务ID到数据库服务记录的映射
         """
-        if not self.db_manager:
-            return
+        missing_services = db_services.keys() - self.services.keys()
         
-        try:
-            db_services = self.db_manager.list_services()
-            if not isinstance(db_services, list):
-                return
-            
-            db_service_ids = {getattr(service, "service_id", None) for service in db_services}
-            db_service_ids.discard(None)
-            memory_service_ids = set(self.services.keys())
-            
-            missing_services = db_service_ids - memory_service_ids
-            
-            for service_id in missing_services:
-                try:
-                    self._check_single_db_service_health(service_id, result)
-                except Exception as e:
-                    self.logger.error(f"检查数据库服务 {service_id} 健康状态失败: {str(e)}")
-                    result["unhealthy"].append({
-                        "service_id": service_id,
-                        "reason": f"Database check failed: {str(e)}"
-                    })
-        except Exception as e:
-            self.logger.log("ERROR", f"获取数据库服务列表失败: {str(e)}", False)
+        for service_id in missing_services:
+            try:
+                self._check_single_db_service_health(service_id, db_services[service_id], result)
+            except Exception as e:
+                self.logger.error(f"检查数据库服务 {service_id} 健康状态失败: {str(e)}")
+                result["unhealthy"].append({
+                    "service_id": service_id,
+                    "reason": f"Database check failed: {str(e)}"
+                })
     
-    def _check_single_db_service_health(self, service_id: str, result: Dict[str, Any]) -> None:
+    def _check_single_db_service_health(self, service_id: str, service: Any, result: Dict[str, Any]) -> None:
         """
         检查单个数据库服务的健康状态
         
         Args:
             service_id: 服务ID
+            service: 数据库服务记录
             result: 结果字典，用于存储健康检查结果
         """
-        service = self.db_manager.get_service(service_id)
-        if not service:
-            return
-        
-        if hasattr(service, "status") and service.status == ServiceStatus.VALID:
+        if service.status == ServiceStatus.VALID:
             result["healthy"].append(service_id)
         else:
-            reason = getattr(service, "reason", None)
+            reason = service.reason
             result["unhealthy"].append({
                 "service_id": service_id,
                 "reason": reason or "Service not in memory"
@@ -1404,15 +1881,39 @@ class ServiceRegistry:
         # 3. 引擎服务可以被业务服务调用
         
         # 获取源服务和目标服务的类型
-        source_service = self.db_manager.get_service(source_service_id)
-        target_service = self.db_manager.get_service(target_service_id)
+        source_type = self._get_service_type(source_service_id)
+        target_type = self._get_service_type(target_service_id)
         
-        if not source_service or not target_service:
+        if source_type is None or target_type is None:
             return False
         
         # 引擎服务不能直接相互调用
-        if source_service.service_type == ServiceType.ENGINE and target_service.service_type == ServiceType.ENGINE:
+        if source_type == ServiceType.ENGINE and target_type == ServiceType.ENGINE:
             return False
         
         # 其他情况都允许
         return True
+    
+    def _get_service_type(self, service_id: str) -> Optional[ServiceType]:
+        """
+        获取服务类型，优先使用未过期的缓存，过期或未缓存时查询数据库
+        
+        Args:
+            service_id: 服务ID
+            
+        Returns:
+            Optional[ServiceType]: 服务类型，服务不存在时返回None（不缓存，新注册的服务可立即生效）
+        """
+        now = time.monotonic()
+        cached = self._type_cache.get(service_id)
+        if cached is not None and now < cached[1]:
+            return cached[0]
+        
+        service = self.db_manager.get_service(service_id)
+        if not service:
+            self._type_cache.pop(service_id, None)
+            return None
+        
+        service_type = service.service_type
+        self._type_cache[service_id] = (service_type, now + self.SERVICE_TYPE_TTL)
+        return service_type
@@ -35,17 +35,10 @@ class ServiceCommunicator:
         try:
             self.logger.info(f"服务层调用引擎: {engine_id}, 动作: {action}")
             
-            # 使用 InnerCommunicator 发送请求
-            result = self.inner_comm.send_request(engine_id, action, data or {})
+            # 使用 InnerCommunicator 的快速路径，直接获取引擎返回的数据
+            result = self.inner_comm.call(engine_id, action, data or {})
             
-            if result is None:
-                self.logger.error(f"引擎 {engine_id} 不存在或未注册")
-                return {
-                    "status": "error",
-                    "error": f"Engine {engine_id} not found or not registered"
-                }
-            
-            self.logger.info(f"引擎 {engine_id} 返回结果: {result.get('status', 'unknown')}")
+            self.logger.info(f"引擎 {engine_id} 调用完成")
             return result
             
         except Exception as e:
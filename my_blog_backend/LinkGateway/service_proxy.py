@@ -163,6 +163,9 @@ class ServiceProxy:
             result = engine.handle_request(action, data)
             if not isinstance(result, dict):
                 result = {"result": result}
+            elif "status" not in result:
+                # 复制后再补充状态字段，不修改引擎返回（可能被引擎缓存复用）的字典
+                result = dict(result)
             if "status" not in result:
                 result["status"] = "success"
         except Exception as e:
@@ -177,6 +180,28 @@ class ServiceProxy:
         self.logger.info(f"引擎返回结果: {engine_id}, 动作: {action}, 状态: {result.get('status')}")
         return result
     
+    def call_engine(self, engine_id: str, action: str, data: Dict[str, Any], request_method: str = "POST") -> Dict[str, Any]:
+        """
+        经过与代理接口相同的校验后调用引擎，供批量调用等网关内部接口复用
+        
+        Args:
+            engine_id: 引擎ID
+            action: 请求动作
+            data: 请求数据，不会被修改
+            request_method: 记录到请求数据中的HTTP方法
+            
+        Returns:
+            Dict[str, Any]: 处理结果
+            
+        Raises:
+            HTTPException: action为空、引擎不存在或不健康时抛出
+        """
+        self._validate_action(action)
+        self._validate_engine_health(engine_id)
+        data = dict(data or {})
+        data["request_method"] = request_method
+        return self._call_engine(engine_id, action, data)
+    
     def _handle_proxy_error(self, error: Exception, engine_id: str) -> HTTPException:
         """
         处理代理错误
@@ -159,4 +159,7 @@ class PerformanceMonitorPlugin(Plugin):
             threshold: 阈值（秒）
         """
         self.slow_query_threshold = threshold
-        self.logger.info(f"慢查询阈值已设置为 {threshold}s")
\ No newline at end of file
+        self.logger.info(f"慢查询阈值已设置为 {threshold}s")
+
+
+PLUGIN_CLASS = PerformanceMonitorPlugin
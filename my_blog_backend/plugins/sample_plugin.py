@@ -28,4 +28,7 @@ class SamplePlugin(Plugin):
             bool: 关闭成功返回True，失败返回False
         """
         self.logger.info("SamplePlugin 关闭")
-        return True
\ No newline at end of file
+        return True
+
+
+PLUGIN_CLASS = SamplePlugin
@@ -151,4 +151,7 @@ class TrafficMonitorPlugin(Plugin):
                 "rate_limit": self.rate_limit,
                 "rate_window": self.rate_window
             }
-        }
\ No newline at end of file
+        }
+
+
+PLUGIN_CLASS = TrafficMonitorPlugin
@@ -0,0 +1,29 @@
+import unittest
+from unittest.mock import Mock
+from LinkGateway.dependency_injector import DependencyInjector
+
+class TestDependencyInjector(unittest.TestCase):
+    """测试依赖注入器"""
+
+    def setUp(self):
+        """设置测试环境"""
+        self.gateway = Mock()
+        self.injector = DependencyInjector(self.gateway)
+
+    def test_core_bundle_matches_getters(self):
+        """测试核心组件集合与单独获取的组件一致"""
+        bundle = self.injector.get_core_bundle()
+        self.assertIs(bundle.registry, self.injector.get_registry())
+        self.assertIs(bundle.path_manager, self.injector.get_path_manager())
+        self.assertIs(bundle.logger, self.injector.get_logger())
+
+    def test_core_bundle_cached_until_register(self):
+        """测试核心组件集合被缓存，注册服务后重新创建"""
+        bundle = self.injector.get_core_bundle()
+        self.assertIs(self.injector.get_core_bundle(), bundle)
+        new_registry = Mock()
+        self.injector.register('registry', new_registry)
+        self.assertIs(self.injector.get_core_bundle().registry, new_registry)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,13 @@
+import os
+import time
+import signal
+import threading
 import unittest
 from unittest.mock import Mock, patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
 from LinkGateway.gateway import LinkGateway
+from LinkGateway.service_proxy import ServiceProxy
 
 class TestGateway(unittest.TestCase):
     """测试Gateway核心组件"""
@@ -81,6 +88,120 @@ class TestGateway(unittest.TestCase):
         # 而是测试类是否存在且可访问
         self.assertTrue(LinkGateway is not None)
         self.assertTrue(callable(LinkGateway))
+    
+    def test_services_json_rebuilt_after_registry_change(self):
+        """测试注册中心服务版本号变化后重建服务列表JSON"""
+        gateway = LinkGateway.__new__(LinkGateway)
+        gateway._services_json = None
+        gateway._service_json_by_id = {}
+        gateway._services_json_version = None
+        gateway.registry = Mock()
+        gateway.registry.services_version = 1
+        gateway.registry.services = {"demo": {"status": "valid"}}
+        gateway.registry.list_services.return_value = [{"service_id": "demo", "status": "valid"}]
+        
+        gateway._ensure_services_json()
+        gateway._ensure_services_json()
+        self.assertEqual(gateway.registry.list_services.call_count, 1)
+        
+        # 健康状态更新等操作递增版本号后，缓存的JSON失效
+        gateway.registry.services = {"demo": {"status": "invalid"}}
+        gateway.registry.services_version = 2
+        gateway._ensure_services_json()
+        self.assertEqual(gateway.registry.list_services.call_count, 2)
+        self.assertIn(b"invalid", gateway._service_json_by_id["demo"])
+
+    
+    def _batch_client(self):
+        """创建只注册默认路由的网关测试客户端，引擎 ok 健康，引擎 down 不健康"""
+        engine = Mock()
+        self.engine_result = {"value": 1}
+        engine.handle_request.return_value = self.engine_result
+        registry = Mock()
+        registry.get_engine.side_effect = lambda engine_id: engine if engine_id in ("ok", "down") else None
+        registry.check_service_health.side_effect = lambda engine_id: engine_id == "ok"
+        gateway = LinkGateway.__new__(LinkGateway)
+        gateway.app = FastAPI()
+        gateway.service_proxy = ServiceProxy(registry)
+        gateway._register_default_routes()
+        return TestClient(gateway.app), engine
+    
+    def test_batch_mixed_success_and_failure(self):
+        """测试批量调用经服务代理校验，成功与失败的调用各自返回结果"""
+        client, engine = self._batch_client()
+        response = client.post("/batch", json=[
+            {"engine_id": "ok", "action": "get", "data": {"id": 1}},
+            {"engine_id": "missing", "action": "get"},
+            {"engine_id": "down", "action": "get"},
+            {"engine_id": "ok", "action": ""},
+        ])
+        self.assertEqual(response.status_code, 200)
+        results = response.json()
+        self.assertEqual(results[0], {"value": 1, "status": "success"})
+        self.assertEqual([r.get("status_code") for r in results[1:]], [404, 503, 400])
+        self.assertTrue(all(r["status"] == "error" for r in results[1:]))
+        # 引擎只被健康且带 action 的调用触达，请求方法被记录，引擎返回的字典不被修改
+        engine.handle_request.assert_called_once_with("get", {"id": 1, "request_method": "POST"})
+        self.assertEqual(self.engine_result, {"value": 1})
+    
+    def test_batch_size_limited(self):
+        """测试批量调用数量超过上限时拒绝整个请求"""
+        client, engine = self._batch_client()
+        items = [{"engine_id": "ok", "action": "get"}] * (LinkGateway.BATCH_MAX_ITEMS + 1)
+        response = client.post("/batch", json=items)
+        self.assertEqual(response.status_code, 413)
+        engine.handle_request.assert_not_called()
+
+    
+    def _forking_gateway(self):
+        """创建只包含预加载模式所需组件的网关"""
+        gateway = LinkGateway.__new__(LinkGateway)
+        gateway.logger = Mock()
+        gateway.db_link = Mock()
+        gateway.registry = Mock()
+        gateway.plugin_manager = Mock()
+        gateway.plugin_manager.watcher.is_running = True
+        config = Mock()
+        config.bind_socket.return_value = Mock()
+        return gateway, config
+    
+    def _assert_no_children(self):
+        with self.assertRaises(ChildProcessError):
+            os.waitpid(-1, os.WNOHANG)
+    
+    @unittest.skipUnless(hasattr(os, "fork"), "需要 os.fork")
+    def test_forked_workers_forward_sigterm_and_reap(self):
+        """测试父进程收到 SIGTERM 后转发给工作进程并回收全部工作进程"""
+        gateway, config = self._forking_gateway()
+        server = Mock()
+        server.return_value.run.side_effect = lambda sockets: time.sleep(30)
+        previous = signal.getsignal(signal.SIGTERM)
+        timer = threading.Timer(0.5, os.kill, (os.getpid(), signal.SIGTERM))
+        timer.start()
+        started = time.monotonic()
+        try:
+            with patch("LinkGateway.gateway.uvicorn.Server", server):
+                gateway._serve_forked_workers(config, 2, "test")
+        finally:
+            timer.cancel()
+        self.assertLess(time.monotonic() - started, 10)
+        self._assert_no_children()
+        self.assertIs(signal.getsignal(signal.SIGTERM), previous)
+        gateway.plugin_manager.stop_watching.assert_called_once()
+        config.bind_socket.return_value.close.assert_called_once()
+    
+    @unittest.skipUnless(hasattr(os, "fork"), "需要 os.fork")
+    def test_forked_workers_restarted_until_limit(self):
+        """测试工作进程意外退出时重新启动，重启过于频繁时停止服务"""
+        gateway, config = self._forking_gateway()
+        server = Mock()
+        server.return_value.run.return_value = None
+        with patch("LinkGateway.gateway.uvicorn.Server", server), \
+                patch.object(LinkGateway, "WORKER_RESTART_LIMIT", 3):
+            gateway._serve_forked_workers(config, 1, "test")
+        self._assert_no_children()
+        self.assertEqual(gateway.logger.warning.call_count, 3)
+        gateway.logger.error.assert_called_once()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import Mock
+from LinkGateway.inner_comm import InnerCommunicator
+
+class TestInnerCommunicator(unittest.TestCase):
+    """测试内环通信器"""
+
+    def setUp(self):
+        """设置测试环境"""
+        self.inner_comm = InnerCommunicator()
+        self.engine = Mock()
+        self.engine.handle_request.return_value = {"result": "ok"}
+        self.inner_comm.register_engine("test-engine", self.engine)
+
+    def test_call_returns_raw_result(self):
+        """测试快速路径直接返回引擎结果"""
+        result = self.inner_comm.call("test-engine", "ping", {"a": 1})
+        self.assertEqual(result, {"result": "ok"})
+        self.engine.handle_request.assert_called_once_with("ping", {"a": 1})
+
+    def test_call_missing_engine(self):
+        """测试快速路径调用不存在的引擎"""
+        with self.assertRaises(ValueError):
+            self.inner_comm.call("missing-engine", "ping")
+
+    def test_send_request_success(self):
+        """测试发送请求成功时返回响应字典"""
+        result = self.inner_comm.send_request("test-engine", "ping")
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["code"], 200)
+        self.assertEqual(result["data"], {"result": "ok"})
+
+    def test_send_request_error(self):
+        """测试引擎抛出异常时返回错误响应字典"""
+        self.engine.handle_request.side_effect = RuntimeError("boom")
+        result = self.inner_comm.send_request("test-engine", "ping")
+        self.assertEqual(result["status"], "error")
+        self.assertEqual(result["code"], 500)
+        self.assertEqual(result["error"], "boom")
+        self.assertIn("request_id", result)
+
+    def test_send_request_missing_engine(self):
+        """测试发送请求到不存在的引擎返回None"""
+        self.assertIsNone(self.inner_comm.send_request("missing-engine", "ping"))
+
+    def test_list_engines_follows_registration(self):
+        """测试注册与注销后引擎列表同步更新"""
+        self.inner_comm.register_engine("other-engine", Mock())
+        self.assertEqual(self.inner_comm.list_engines(), ["test-engine", "other-engine"])
+        self.inner_comm.unregister_engine("test-engine")
+        self.assertEqual(self.inner_comm.list_engines(), ["other-engine"])
+
+    def test_broadcast_tolerates_registration_during_iteration(self):
+        """测试广播过程中注册新引擎不会导致遍历异常"""
+        def register_other(action, data):
+            self.inner_comm.register_engine("late-engine", Mock())
+            return {}
+        self.engine.handle_request.side_effect = register_other
+        results = self.inner_comm.broadcast("ping")
+        self.assertEqual(list(results.keys()), ["test-engine"])
+        self.assertIn("late-engine", self.inner_comm.list_engines())
+
+    def test_message_queue_reuses_pooled_requests(self):
+        """测试异步请求处理后请求对象被复用，归还时清空全部字段"""
+        first_id = self.inner_comm.send_async_request("test-engine", "ping")
+        first = self.inner_comm.process_message_queue()
+        second_id = self.inner_comm.send_async_request("missing-engine", "ping")
+        second = self.inner_comm.process_message_queue()
+        self.assertNotEqual(first_id, second_id)
+        self.assertEqual(first[0]["response"]["data"], {"result": "ok"})
+        self.assertEqual(first[0]["response"]["status"], "success")
+        self.assertEqual(second[0]["response"]["code"], 404)
+        self.assertEqual(second[0]["response"]["data"], {})
+        self.assertEqual(len(self.inner_comm._request_pool), 1)
+        pooled = self.inner_comm._request_pool[0]
+        self.assertIsNone(pooled.request_id)
+        self.assertIsNone(pooled.service_id)
+        self.assertIsNone(pooled.action)
+        self.assertIsNone(pooled.timestamp)
+        self.assertEqual(pooled.data, {})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import os
+import csv
+import logging
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+import queue
+from LinkGateway.logs import CSVLogHandler, QueueDispatchHandler, BatchedRotatingFileHandler, LeveledRotatingHandler, LogManager, Logger
+
+class TestCSVLogHandler(unittest.TestCase):
+    """测试CSV日志处理器"""
+
+    def setUp(self):
+        """设置测试环境"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_file = os.path.join(self.temp_dir.name, "log", "logs.csv")
+        self.handler = CSVLogHandler(self.csv_file)
+
+    def tearDown(self):
+        """清理测试环境"""
+        self.handler.close()
+        self.temp_dir.cleanup()
+
+    def _make_record(self, message, **extra):
+        record = logging.LogRecord("test", logging.INFO, __file__, 0, message, None, None)
+        record.__dict__.update(extra)
+        return record
+
+    def _read_rows(self):
+        with open(self.csv_file, encoding="utf-8", newline="") as f:
+            return list(csv.reader(f))
+
+    def test_writes_header_and_rows(self):
+        """测试写入表头与日志行"""
+        self.handler.handle(self._make_record("第一条", service_id="svc", request_id="abcd1234"))
+        self.handler.handle(self._make_record("第二条"))
+        self.handler.flush()
+        rows = self._read_rows()
+        self.assertEqual(rows[0], ['时间戳', '日志级别', '服务ID', '请求ID', '模块名', '消息'])
+        self.assertEqual(rows[1][1:], ["INFO", "svc", "abcd1234", "test", "第一条"])
+        self.assertEqual(rows[2][2], "unknown")
+        self.assertEqual(len(rows[2][3]), 8)
+
+    def test_close_releases_file(self):
+        """测试关闭处理器后释放文件句柄"""
+        self.handler.handle(self._make_record("消息"))
+        self.handler.close()
+        self.assertTrue(self.handler._fh.closed)
+        self.assertEqual(len(self._read_rows()), 2)
+
+    def test_rows_buffered_until_flush(self):
+        """测试日志行先写入缓冲区，刷新后才写入文件"""
+        self.handler.handle(self._make_record("缓冲"))
+        self.assertEqual(len(self._read_rows()), 1)
+        self.handler.flush()
+        self.assertEqual(len(self._read_rows()), 2)
+
+    def test_large_buffer_flushes_immediately(self):
+        """测试缓冲区超过阈值时立即写入文件"""
+        self.handler.handle(self._make_record("x" * (CSVLogHandler.FLUSH_SIZE + 1)))
+        self.assertEqual(len(self._read_rows()), 2)
+
+class TestLeveledRotatingHandler(unittest.TestCase):
+    """测试分级别的滚动文件处理器"""
+
+    def test_routes_records_by_level(self):
+        """测试按级别写入对应文件"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base = os.path.join(temp_dir, "app.log")
+            handler = LeveledRotatingHandler(base, logging.Formatter("%(levelname)s %(message)s"))
+            for level in (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL):
+                handler.handle(logging.LogRecord("a", level, __file__, 0, "msg", None, None))
+            handler.close()
+            contents = {}
+            for suffix in ("debug_info", "warning", "error"):
+                with open(f"{base}.{suffix}", encoding="utf-8") as f:
+                    contents[suffix] = f.read().split()[::2]
+            self.assertEqual(contents["debug_info"], ["DEBUG", "INFO"])
+            self.assertEqual(contents["warning"], ["WARNING"])
+            self.assertEqual(contents["error"], ["ERROR", "CRITICAL"])
+
+class TestQueueDispatchHandler(unittest.TestCase):
+    """测试队列分发处理器"""
+
+    def test_dispatch_by_name_and_level(self):
+        """测试按logger名称分发并遵循处理器级别"""
+        info_handler = Mock(level=logging.INFO)
+        error_handler = Mock(level=logging.ERROR)
+        other_handler = Mock(level=logging.DEBUG)
+        dispatcher = QueueDispatchHandler({"a": [info_handler, error_handler], "b": [other_handler]})
+        record = logging.LogRecord("a", logging.WARNING, __file__, 0, "msg", None, None)
+        dispatcher.handle(record)
+        info_handler.handle.assert_called_once_with(record)
+        error_handler.handle.assert_not_called()
+        other_handler.handle.assert_not_called()
+
+    def test_deferred_handlers_flush_when_queue_drained(self):
+        """测试延迟刷新的处理器在队列清空后才写入文件"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, "app.log")
+            handler = BatchedRotatingFileHandler(log_file, when="H", encoding="utf-8")
+            log_queue = queue.Queue()
+            dispatcher = QueueDispatchHandler({"a": [handler]}, log_queue)
+            log_queue.put("待处理")
+            dispatcher.handle(logging.LogRecord("a", logging.INFO, __file__, 0, "第一条", None, None))
+            self.assertEqual(os.path.getsize(log_file), 0)
+            log_queue.get()
+            dispatcher.handle(logging.LogRecord("a", logging.INFO, __file__, 0, "第二条", None, None))
+            with open(log_file, encoding="utf-8") as f:
+                self.assertEqual(f.read().splitlines(), ["第一条", "第二条"])
+            handler.close()
+
+class TestLogManagerFork(unittest.TestCase):
+    """测试日志管理器在 fork 前后的处理"""
+
+    def test_fork_hooks_flush_and_reopen(self):
+        """测试 fork 前写出缓冲日志，子进程重新打开文件后继续写入"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = os.path.join(temp_dir, "app.log")
+            handler = BatchedRotatingFileHandler(log_file, when="H", encoding="utf-8", delay=True)
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            manager = LogManager()
+            queue_handler = manager.get_queue_handler("fork", [handler])
+            queue_handler.handle(logging.LogRecord("fork", logging.INFO, __file__, 0, "第一条", None, None))
+            manager.before_fork()
+            self.assertIsNone(manager.queue_listener)
+            with open(log_file, encoding="utf-8") as f:
+                self.assertEqual(f.read().splitlines(), ["第一条"])
+            first_stream = handler.stream
+            manager.after_fork(in_child=True)
+            self.assertTrue(first_stream.closed)
+            queue_handler.handle(logging.LogRecord("fork", logging.INFO, __file__, 0, "第二条", None, None))
+            manager.stop_queue_listener()
+            with open(log_file, encoding="utf-8") as f:
+                self.assertEqual(f.read().splitlines(), ["第一条", "第二条"])
+            handler.close()
+
+class TestLoggerLazyFormat(unittest.TestCase):
+    """测试调试日志的延迟格式化"""
+
+    def test_debug_formats_only_when_enabled(self):
+        """测试调试级别被屏蔽时不格式化参数，启用时按 % 格式化消息"""
+        logger = Logger("LazyFormatTest")
+        argument = Mock()
+        argument.__str__ = Mock(return_value="参数")
+        with patch.object(logger.logger, "handle") as handle:
+            logger.set_level("INFO")
+            logger.debug("值：%s", argument)
+            argument.__str__.assert_not_called()
+            handle.assert_not_called()
+
+            logger.set_level("DEBUG")
+            logger.debug("值：%s", argument)
+            self.assertEqual(handle.call_args[0][0].getMessage(), "值：参数")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import json
+import unittest
+import httpx
+from LinkGateway.outer_comm import OuterCommunicator
+
+class TestOuterCommunicator(unittest.IsolatedAsyncioTestCase):
+    """测试外环通信器"""
+
+    async def asyncSetUp(self):
+        """设置测试环境"""
+        def handler(request):
+            if request.url.host == "down":
+                raise httpx.ConnectError("connection refused", request=request)
+            if request.url.path == "/api/fail":
+                return httpx.Response(503, text="unavailable")
+            if request.url.path == "/api/accept":
+                return httpx.Response(204)
+            return httpx.Response(200, json={"echo": json.loads(request.content)["data"]})
+
+        self.outer_comm = OuterCommunicator()
+        await self.outer_comm.client.aclose()
+        self.outer_comm.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.outer_comm.register_network_engine("engine-a", {"base_url": "http://a"})
+        self.outer_comm.register_network_engine("engine-down", {"base_url": "http://down"})
+
+    async def asyncTearDown(self):
+        """清理测试环境"""
+        await self.outer_comm.close()
+
+    async def test_send_request(self):
+        """测试发送单个请求"""
+        result = await self.outer_comm.send_request("engine-a", "ping", {"x": 1})
+        self.assertEqual(result, {"echo": {"x": 1}})
+        self.assertIsNone(await self.outer_comm.send_request("missing", "ping"))
+
+    async def test_send_request_accepts_2xx_without_body(self):
+        """测试2xx无响应体时返回空字典而不是错误响应"""
+        self.assertEqual(await self.outer_comm.send_request("engine-a", "accept"), {})
+
+    async def test_send_requests_batch_keeps_order(self):
+        """测试批量请求按调用顺序返回结果"""
+        results = await self.outer_comm.send_requests_batch([
+            ("engine-a", "ping", {"n": 1}),
+            ("missing", "ping", {}),
+            ("engine-a", "fail", {}),
+            ("engine-down", "ping", {}),
+            ("engine-a", "ping", {"n": 2}),
+        ])
+        self.assertEqual(results[0], {"echo": {"n": 1}})
+        self.assertIsNone(results[1])
+        self.assertEqual(results[2]["code"], 503)
+        self.assertEqual(results[3]["code"], 500)
+        self.assertEqual(results[4], {"echo": {"n": 2}})
+
+if __name__ == "__main__":
+    unittest.main()
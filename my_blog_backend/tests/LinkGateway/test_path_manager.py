@@ -0,0 +1,148 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from LinkGateway.path_manager import PathManager
+
+class TestPathManager(unittest.TestCase):
+    """测试路径管理器"""
+
+    def setUp(self):
+        """设置测试环境"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_path = self.temp_dir.name
+        self.path_manager = PathManager(self.base_path)
+
+    def tearDown(self):
+        """清理测试环境"""
+        self.temp_dir.cleanup()
+
+    def test_data_dirs_created_once(self):
+        """测试数据目录只在首次获取时创建"""
+        service_dir = self.path_manager.get_service_data_dir("svc")
+        self.assertTrue(os.path.isdir(service_dir))
+        with patch("LinkGateway.path_manager.os.makedirs") as makedirs:
+            self.assertEqual(self.path_manager.get_service_data_dir("svc"), service_dir)
+            self.path_manager.get_service_db_path("svc")
+            makedirs.assert_not_called()
+
+
+    def test_path_getters_cached_per_arguments(self):
+        """测试路径获取结果按参数缓存"""
+        first = self.path_manager.get_engine_db_path("eng")
+        self.assertIs(self.path_manager.get_engine_db_path("eng"), first)
+        self.assertEqual(self.path_manager.get_engine_db_path("eng", "other"),
+                         os.path.join(self.base_path, "data", "engine", "eng", "other.db"))
+
+    def test_validate_path(self):
+        """测试路径校验拒绝数据目录之外及同前缀的目录"""
+        data_dir = os.path.join(self.base_path, "data")
+        self.assertTrue(self.path_manager.validate_path(data_dir))
+        self.assertTrue(self.path_manager.validate_path(os.path.join(data_dir, "a", "b.db")))
+        self.assertTrue(self.path_manager.validate_path(os.path.join("data", "a.db")))
+        self.assertFalse(self.path_manager.validate_path(os.path.join(data_dir, "..", "secret")))
+        self.assertFalse(self.path_manager.validate_path(data_dir + "_evil"))
+
+    def test_load_json_file_cached_until_saved(self):
+        """测试JSON文件未变化时复用解析结果，保存后重新加载"""
+        file_path = os.path.join(self.base_path, "conf", "a.json")
+        self.assertEqual(self.path_manager.load_json_file(file_path), {})
+        self.assertTrue(self.path_manager.save_json_file(file_path, {"v": 1}))
+        first = self.path_manager.load_json_file(file_path)
+        self.assertEqual(first, {"v": 1})
+        self.assertIs(self.path_manager.load_json_file(file_path), first)
+        self.path_manager.save_json_file(file_path, {"v": 2})
+        self.assertEqual(self.path_manager.load_json_file(file_path), {"v": 2})
+
+    def test_load_json_file_detects_nanosecond_mtime_change(self):
+        """测试同样大小的改写只在纳秒级修改时间上不同时也能重新加载"""
+        file_path = os.path.join(self.base_path, "conf", "ns.json")
+        self.path_manager.save_json_file(file_path, {"v": 1})
+        mtime_ns = 1_700_000_000_000_000_000
+        os.utime(file_path, ns=(mtime_ns, mtime_ns))
+        self.assertEqual(self.path_manager.load_json_file(file_path), {"v": 1})
+        with open(file_path, "r+", encoding="utf-8") as f:
+            content = f.read().replace("1", "2")
+            f.seek(0)
+            f.write(content)
+        os.utime(file_path, ns=(mtime_ns, mtime_ns + 1))
+        if os.stat(file_path).st_mtime_ns != mtime_ns + 1:
+            self.skipTest("文件系统不支持纳秒级修改时间")
+        self.assertEqual(self.path_manager.load_json_file(file_path), {"v": 2})
+
+    def test_concurrent_saves_use_separate_temp_files(self):
+        """测试多个线程同时保存同一文件时都能成功且不残留临时文件"""
+        file_path = os.path.join(self.base_path, "conf", "shared.json")
+        results = []
+        threads = [
+            threading.Thread(target=lambda i=i: results.append(self.path_manager.save_json_file(file_path, {"v": i})))
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [True] * 8)
+        self.assertIn(self.path_manager.load_json_file(file_path)["v"], range(8))
+        self.assertEqual(os.listdir(os.path.dirname(file_path)), ["shared.json"])
+
+    def test_get_engine_json_path(self):
+        """测试引擎配置文件路径的查找顺序"""
+        engine_dir = os.path.join(self.base_path, "engines", "Demo")
+        os.makedirs(engine_dir)
+        engine_file = os.path.join(engine_dir, "demo.py")
+        open(engine_file, "w").close()
+        self.assertEqual(self.path_manager.get_engine_json_path(engine_dir), os.path.join(engine_dir, "Demo.json"))
+        self.assertEqual(self.path_manager.get_engine_json_path(engine_file), os.path.join(engine_dir, "demo.json"))
+        open(os.path.join(engine_dir, "engine.json"), "w").close()
+        self.assertEqual(self.path_manager.get_engine_json_path(engine_dir), os.path.join(engine_dir, "engine.json"))
+        self.assertEqual(self.path_manager.get_engine_json_path(engine_file), os.path.join(engine_dir, "engine.json"))
+
+    def test_missing_json_file_cached(self):
+        """测试不存在的JSON文件被缓存，保存后立即可读"""
+        file_path = os.path.join(self.base_path, "missing.json")
+        self.assertEqual(self.path_manager.load_json_file(file_path), {})
+        with patch("LinkGateway.path_manager.os.stat") as stat:
+            self.assertEqual(self.path_manager.load_json_file(file_path), {})
+            stat.assert_not_called()
+        self.path_manager.save_json_file(file_path, {"v": 1})
+        self.assertEqual(self.path_manager.load_json_file(file_path), {"v": 1})
+
+    def test_missing_json_file_rechecked(self):
+        """测试不存在的JSON文件在检查间隔过后或清除记录后重新检查"""
+        file_path = os.path.join(self.base_path, "later.json")
+        self.assertEqual(self.path_manager.load_json_file(file_path), {})
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write('{"v": 1}')
+        self.assertEqual(self.path_manager.load_json_file(file_path), {})
+        self.path_manager.forget_missing_json_files()
+        self.assertEqual(self.path_manager.load_json_file(file_path), {"v": 1})
+
+        other_path = os.path.join(self.base_path, "other.json")
+        self.assertEqual(self.path_manager.load_json_file(other_path), {})
+        with open(other_path, "w", encoding="utf-8") as f:
+            f.write('{"v": 2}')
+        with patch("LinkGateway.path_manager.time.monotonic", return_value=time.monotonic() + 60):
+            self.assertEqual(self.path_manager.load_json_file(other_path), {"v": 2})
+
+    def test_clean_path_keeps_paths_inside_data_dir(self):
+        """测试清理路径时同前缀目录与上级目录跳转不会逃出数据目录"""
+        data_dir = os.path.join(self.base_path, "data")
+        inside = os.path.join(data_dir, "a", "b.db")
+        self.assertEqual(self.path_manager.clean_path(inside), inside)
+        self.assertEqual(self.path_manager.clean_path(data_dir + "_evil"), os.path.join(data_dir, "data_evil"))
+        self.assertEqual(self.path_manager.clean_path(os.path.join(data_dir, "..", "secret")), os.path.join(data_dir, "secret"))
+
+    def test_warmup_creates_dirs(self):
+        """测试预热时批量创建数据与日志目录"""
+        self.path_manager.warmup(service_ids=["svc"], engine_names=["eng"])
+        for path in ("data/linkgateway", "log/linkgateway", "data/services/svc", "data/engine/eng"):
+            self.assertTrue(os.path.isdir(os.path.join(self.base_path, path)))
+        with patch("LinkGateway.path_manager.os.mkdir") as mkdir:
+            self.path_manager.get_engine_data_dir("eng")
+            mkdir.assert_not_called()
+
+if __name__ == "__main__":
+    unittest.main()
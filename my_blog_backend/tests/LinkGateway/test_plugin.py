@@ -0,0 +1,309 @@
+import os
+import time
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+from LinkGateway.plugin import PluginManager, PluginWatcher
+
+PLUGIN_SOURCE = '''from LinkGateway.plugin import Plugin
+
+class {name}(Plugin):
+    VERSION = {version}
+'''
+
+class TestPluginManager(unittest.TestCase):
+    """测试插件管理器"""
+
+    def setUp(self):
+        """设置测试环境"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.gateway = Mock()
+        self.gateway.base_path = self.temp_dir.name
+        self.gateway.path_manager.get_linkgateway_log_path.return_value = os.path.join(self.temp_dir.name, "linkgateway")
+        self.manager = PluginManager(self.gateway)
+        self.gateway.plugin_manager = self.manager
+
+    def tearDown(self):
+        """清理测试环境"""
+        self.manager.stop_watching()
+        self.temp_dir.cleanup()
+
+    def _write_plugin(self, file_name, class_name, version, mtime=None):
+        path = os.path.join(self.manager.plugins_dir, file_name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(PLUGIN_SOURCE.format(name=class_name, version=version))
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return path
+
+    def test_file_change_loads_and_reloads_plugin(self):
+        """测试文件新增与修改时加载对应插件"""
+        path = self._write_plugin("demo.py", "DemoPlugin", 1, mtime=1000)
+        self.manager.apply_file_change(path, "modified")
+        self.assertEqual(self.manager.get_plugin("DemoPlugin").VERSION, 1)
+
+        self._write_plugin("demo.py", "DemoPlugin", 2, mtime=2000)
+        self.manager.apply_file_change(path, "modified")
+        self.assertEqual(self.manager.get_plugin("DemoPlugin").VERSION, 2)
+
+    def test_unchanged_file_is_ignored(self):
+        """测试修改时间未变化时不重复加载"""
+        path = self._write_plugin("demo.py", "DemoPlugin", 1, mtime=1000)
+        self.manager.apply_file_change(path, "modified")
+        plugin = self.manager.get_plugin("DemoPlugin")
+        self.manager.apply_file_change(path, "modified")
+        self.assertIs(self.manager.get_plugin("DemoPlugin"), plugin)
+
+    def test_unchanged_file_reuses_cached_class(self):
+        """测试文件未变化时重新加载复用已导入的插件类"""
+        self._write_plugin("demo.py", "DemoPlugin", 1, mtime=1000)
+        self.manager.load_plugins()
+        first_cls = type(self.manager.get_plugin("DemoPlugin"))
+        self.manager.reload_plugins()
+        self.assertIs(type(self.manager.get_plugin("DemoPlugin")), first_cls)
+        self._write_plugin("demo.py", "DemoPlugin", 2, mtime=2000)
+        self.manager.reload_plugins()
+        self.assertIsNot(type(self.manager.get_plugin("DemoPlugin")), first_cls)
+
+    def test_hot_reload_only_changed_files(self):
+        """测试热重载只加载新增或修改过的插件文件"""
+        self._write_plugin("demo.py", "DemoPlugin", 1, mtime=1000)
+        self.assertEqual(self.manager.hot_reload_plugins()["success"], ["demo"])
+        self.assertEqual(self.manager.hot_reload_plugins()["success"], [])
+        self._write_plugin("demo.py", "DemoPlugin", 2, mtime=2000)
+        self.assertEqual(self.manager.hot_reload_plugins()["success"], ["demo"])
+        self.assertEqual(self.manager.get_plugin("DemoPlugin").VERSION, 2)
+        self.assertEqual(self.manager.plugin_mod_times[os.path.join(self.manager.plugins_dir, "demo.py")], 2000 * 10**9)
+
+    def test_deleted_file_unloads_plugin(self):
+        """测试文件删除后卸载对应插件"""
+        path = self._write_plugin("demo.py", "DemoPlugin", 1)
+        self.manager.apply_file_change(path, "modified")
+        plugin = self.manager.get_plugin("DemoPlugin")
+        os.remove(path)
+        self.manager.apply_file_change(path, "deleted")
+        self.assertNotIn("DemoPlugin", self.manager.list_plugins())
+        self.assertEqual(plugin.get_status(), plugin.Status.STOPPED)
+        self.assertNotIn(path, self.manager.plugin_mod_times)
+
+    def test_hooks_only_dispatch_to_overriding_plugins(self):
+        """测试钩子只分发给重写了该方法的插件"""
+        path = os.path.join(self.manager.plugins_dir, "hooked.py")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(
+                "from LinkGateway.plugin import Plugin\n\n"
+                "class HookedPlugin(Plugin):\n"
+                "    def on_route_matching(self, path, method):\n"
+                "        return {'path': path}\n"
+            )
+        self.manager.apply_file_change(path, "modified")
+        self.manager.apply_file_change(self._write_plugin("demo.py", "DemoPlugin", 1), "modified")
+        self.assertEqual([p.get_name() for p in self.manager._hooks["on_route_matching"]], ["HookedPlugin"])
+        self.assertEqual(self.manager._hooks["on_request_incoming"], [])
+        self.assertEqual(self.manager.notify_route_matching("/a", "GET"), {"path": "/a"})
+        self.manager.shutdown_plugins()
+        self.assertIsNone(self.manager.notify_route_matching("/a", "GET"))
+
+    def _write_dependent_plugin(self, file_name, class_name, dependencies):
+        path = os.path.join(self.manager.plugins_dir, file_name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(
+                "from LinkGateway.plugin import Plugin\n\n"
+                f"class {class_name}(Plugin):\n"
+                "    def __init__(self, gateway):\n"
+                "        super().__init__(gateway)\n"
+                f"        self.dependencies = {dependencies!r}\n"
+            )
+
+    def test_load_plugins_initializes_dependencies_first(self):
+        """测试按依赖关系初始化插件，与文件顺序无关"""
+        self._write_dependent_plugin("a_plugin.py", "APlugin", ["BPlugin"])
+        self._write_dependent_plugin("b_plugin.py", "BPlugin", [])
+        result = self.manager.load_plugins()
+        self.assertEqual(result["success"], ["b_plugin", "a_plugin"])
+        self.assertEqual(result["failed"], [])
+        self.assertTrue(self.manager.get_plugin("APlugin")._dependencies_verified)
+        info = self.manager.registered_plugins["APlugin"]
+        self.assertEqual(info.path, os.path.join(self.manager.plugins_dir, "a_plugin.py"))
+        self.assertEqual(info.status, "running")
+
+    def test_dependency_check_reset_when_dependency_unloaded(self):
+        """测试被依赖的插件卸载或全部关闭后重新检查依赖"""
+        self._write_dependent_plugin("a_plugin.py", "APlugin", ["BPlugin"])
+        b_path = os.path.join(self.manager.plugins_dir, "b_plugin.py")
+        self._write_dependent_plugin("b_plugin.py", "BPlugin", [])
+        self.manager.load_plugins()
+        a_plugin = self.manager.get_plugin("APlugin")
+        self.assertTrue(a_plugin._dependencies_verified)
+        os.remove(b_path)
+        self.manager.apply_file_change(b_path, "deleted")
+        self.assertFalse(a_plugin._dependencies_verified)
+        self.assertFalse(a_plugin._check_dependencies())
+
+        a_plugin._dependencies_verified = True
+        self.manager.shutdown_plugins()
+        self.assertFalse(a_plugin._dependencies_verified)
+
+    def test_load_plugins_rechecks_unsatisfied_dependencies(self):
+        """测试依赖不在本批中时初始化仍检查依赖"""
+        self._write_dependent_plugin("a_plugin.py", "APlugin", ["MissingPlugin"])
+        result = self.manager.load_plugins()
+        self.assertEqual(result["failed"], ["a_plugin"])
+
+    def test_load_plugins_skips_dependency_cycle(self):
+        """测试循环依赖的插件被跳过"""
+        self._write_dependent_plugin("a_plugin.py", "APlugin", ["BPlugin"])
+        self._write_dependent_plugin("b_plugin.py", "BPlugin", ["APlugin"])
+        self._write_dependent_plugin("c_plugin.py", "CPlugin", [])
+        result = self.manager.load_plugins()
+        self.assertEqual(result["success"], ["c_plugin"])
+        self.assertEqual(sorted(result["failed"]), ["a_plugin", "b_plugin"])
+
+    def test_load_plugins_reports_duplicate_class_names(self):
+        """测试不同文件中的同名插件类被报告为加载失败"""
+        self._write_plugin("a_demo.py", "DemoPlugin", 1)
+        self._write_plugin("b_demo.py", "DemoPlugin", 2)
+        result = self.manager.load_plugins()
+        self.assertEqual(result["success"], ["a_demo"])
+        self.assertEqual(result["failed"], ["b_demo"])
+        self.assertEqual(self.manager.get_plugin("DemoPlugin").VERSION, 1)
+
+    def test_sort_by_dependencies(self):
+        """测试拓扑排序按名称打破平局并忽略外部依赖"""
+        order, cyclic = PluginManager._sort_by_dependencies({
+            "C": ["A"], "B": [], "A": ["External"], "D": ["C", "B"]
+        })
+        self.assertEqual(order, ["A", "B", "C", "D"])
+        self.assertEqual(cyclic, [])
+
+    def test_core_components_resolved_lazily(self):
+        """测试核心组件在首次访问时才从依赖注入器获取"""
+        path = self._write_plugin("demo.py", "DemoPlugin", 1)
+        self.manager.apply_file_change(path, "modified")
+        plugin = self.manager.get_plugin("DemoPlugin")
+        injector = self.gateway.dependency_injector
+        injector.get_core_bundle.reset_mock()
+        self.assertIs(plugin.db_link, injector.get_core_bundle.return_value.db_link)
+        self.assertIs(plugin.db_link, injector.get_core_bundle.return_value.db_link)
+        injector.get_core_bundle.assert_called_once_with()
+        with self.assertRaises(AttributeError):
+            plugin.missing_component
+
+    def test_scan_plugin_files_recurses(self):
+        """测试递归扫描插件目录并过滤非插件文件"""
+        nested = os.path.join(self.manager.plugins_dir, "nested")
+        os.makedirs(nested)
+        for path in ("top.py", "_private.py", "notes.txt", os.path.join("nested", "inner.py")):
+            open(os.path.join(self.manager.plugins_dir, path), "w").close()
+        found = sorted(os.path.relpath(entry.path, self.manager.plugins_dir) for entry in self.manager._scan_plugin_files(self.manager.plugins_dir))
+        self.assertEqual(found, [os.path.join("nested", "inner.py"), "top.py"])
+        self.assertEqual(list(self.manager._scan_plugin_files(os.path.join(self.temp_dir.name, "missing"))), [])
+
+    def test_plugin_class_declaration_preferred(self):
+        """测试优先使用模块声明的 PLUGIN_CLASS"""
+        path = os.path.join(self.manager.plugins_dir, "declared.py")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(
+                "from LinkGateway.plugin import Plugin\n\n"
+                "class HelperPlugin(Plugin):\n"
+                "    pass\n\n"
+                "class DeclaredPlugin(Plugin):\n"
+                "    pass\n\n"
+                "PLUGIN_CLASS = DeclaredPlugin\n"
+            )
+        self.manager.apply_file_change(path, "modified")
+        self.assertEqual(self.manager.list_plugins(), ["DeclaredPlugin"])
+
+    def test_watcher_debounces_events_per_file(self):
+        """测试同一文件的连续事件在静默后只处理一次"""
+        manager = Mock()
+        watcher = PluginWatcher(manager)
+        watcher._running = True
+        watcher._worker = threading.Thread(target=watcher._process_events, daemon=True)
+        watcher._worker.start()
+        for kind in ("deleted", "modified", "modified"):
+            watcher.events.put(("/plugins/demo.py", kind))
+        watcher.events.put(("/plugins/other.py", "deleted"))
+        time.sleep(watcher.DEBOUNCE_INTERVAL * 3)
+        watcher.stop()
+        self.assertCountEqual(
+            [c.args for c in manager.apply_file_change.call_args_list],
+            [("/plugins/demo.py", "modified"), ("/plugins/other.py", "deleted")]
+        )
+
+    def test_watcher_survives_failed_file_change(self):
+        """测试单个文件处理失败时监听线程继续处理后续事件"""
+        manager = Mock()
+        manager.apply_file_change.side_effect = [PermissionError("denied"), None]
+        watcher = PluginWatcher(manager)
+        watcher._running = True
+        watcher._worker = threading.Thread(target=watcher._process_events, daemon=True)
+        watcher._worker.start()
+        watcher.events.put(("/plugins/demo.py", "modified"))
+        time.sleep(watcher.DEBOUNCE_INTERVAL * 3)
+        watcher.events.put(("/plugins/other.py", "modified"))
+        time.sleep(watcher.DEBOUNCE_INTERVAL * 3)
+        self.assertTrue(watcher._worker.is_alive())
+        watcher.stop()
+        self.assertEqual(manager.apply_file_change.call_count, 2)
+        manager.logger.error.assert_called_once()
+
+    def test_deleted_file_unloads_plugin_when_shutdown_fails(self):
+        """测试插件关闭失败时仍完成卸载"""
+        path = self._write_plugin("demo.py", "DemoPlugin", 1)
+        self.manager.apply_file_change(path, "modified")
+        plugin = self.manager.get_plugin("DemoPlugin")
+        plugin.shutdown = Mock(side_effect=RuntimeError("boom"))
+        os.remove(path)
+        self.manager.apply_file_change(path, "deleted")
+        self.assertNotIn("DemoPlugin", self.manager.list_plugins())
+        self.assertNotIn(path, self.manager.plugin_files)
+
+    def test_missing_file_on_modified_unloads_plugin(self):
+        """测试去抖结束时文件已不存在则卸载插件"""
+        path = self._write_plugin("demo.py", "DemoPlugin", 1)
+        self.manager.apply_file_change(path, "modified")
+        os.remove(path)
+        self.manager.apply_file_change(path, "modified")
+        self.assertNotIn("DemoPlugin", self.manager.list_plugins())
+
+    def test_load_plugin_classes_in_parallel_keeps_file_order(self):
+        """测试并行导入插件类时结果与文件顺序一致"""
+        paths = [self._write_plugin(f"p{i}.py", f"P{i}Plugin", i) for i in range(6)]
+        with patch("LinkGateway.plugin.os.cpu_count", return_value=4):
+            results = self.manager._load_plugin_classes(paths)
+        self.assertEqual([cls.__name__ for cls, _ in results], [f"P{i}Plugin" for i in range(6)])
+        self.assertTrue(all(error is None for _, error in results))
+
+    def test_load_plugins_without_running_threads(self):
+        """测试工作线程未运行时由调用线程完成全部导入"""
+        for i in range(6):
+            self._write_plugin(f"p{i}.py", f"P{i}Plugin", i)
+        with patch("LinkGateway.plugin.os.cpu_count", return_value=4), \
+                patch("LinkGateway.plugin.threading.Thread") as thread_cls:
+            result = self.manager.load_plugins()
+        self.assertTrue(thread_cls.called)
+        self.assertEqual(sorted(result["success"]), [f"p{i}" for i in range(6)])
+        self.assertEqual(result["failed"], [])
+
+    def test_file_change_waits_for_running_operation(self):
+        """测试文件变更处理与其他插件操作互斥执行"""
+        path = self._write_plugin("demo.py", "DemoPlugin", 1)
+        done = threading.Event()
+        with self.manager._lock:
+            worker = threading.Thread(target=lambda: (self.manager.apply_file_change(path, "modified"), done.set()))
+            worker.start()
+            self.assertFalse(done.wait(0.2))
+        worker.join(5)
+        self.assertTrue(done.is_set())
+        self.assertIn("DemoPlugin", self.manager.list_plugins())
+
+    def test_is_plugin_file(self):
+        """测试插件文件判断"""
+        self.assertTrue(PluginManager._is_plugin_file("/a/demo.py"))
+        self.assertFalse(PluginManager._is_plugin_file("/a/_private.py"))
+        self.assertFalse(PluginManager._is_plugin_file("/a/demo.txt"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import json
+import uuid
+import unittest
+from datetime import datetime
+from LinkGateway.protocol import Request, Response, new_request_id
+
+class TestProtocol(unittest.TestCase):
+    """测试统一请求与响应格式"""
+
+    def test_success_response_serializes(self):
+        """测试成功响应可直接序列化为JSON"""
+        payload = json.loads(Response.success("req-1", {"a": 1}).model_dump_json())
+        self.assertEqual(payload["status"], "success")
+        self.assertEqual(payload["code"], 200)
+        self.assertEqual(payload["data"], {"a": 1})
+        self.assertIsNone(payload["error"])
+        self.assertEqual(datetime.fromisoformat(payload["timestamp"]).utcoffset().total_seconds(), 0)
+
+    def test_failure_response_serializes(self):
+        """测试错误响应工厂方法可调用，且不与error字段冲突"""
+        response = Response.failure("req-2", 502, "bad gateway")
+        self.assertEqual(response.error, "bad gateway")
+        payload = json.loads(response.model_dump_json())
+        self.assertEqual(payload["status"], "error")
+        self.assertEqual(payload["code"], 502)
+        self.assertEqual(payload["data"], {})
+        self.assertEqual(datetime.fromisoformat(payload["timestamp"]).utcoffset().total_seconds(), 0)
+
+    def test_timestamp_kept_as_datetime_outside_json(self):
+        """测试非JSON导出时时间字段仍为datetime"""
+        request = Request(action="ping")
+        self.assertIsInstance(request.model_dump()["timestamp"], datetime)
+        self.assertEqual(json.loads(request.model_dump_json())["timestamp"], request.timestamp.isoformat())
+
+    def test_request_ids_are_unique_uuid4(self):
+        """测试批量生成的请求ID为唯一的UUID4字符串"""
+        ids = [new_request_id() for _ in range(3000)]
+        self.assertEqual(len(set(ids)), len(ids))
+        parsed = uuid.UUID(ids[0])
+        self.assertEqual(parsed.version, 4)
+        self.assertEqual(str(parsed), ids[0])
+        self.assertNotEqual(Request(action="a").request_id, Request(action="a").request_id)
+
+if __name__ == "__main__":
+    unittest.main()
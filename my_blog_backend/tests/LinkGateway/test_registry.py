@@ -0,0 +1,423 @@
+import os
+import sys
+import json
+import time
+import tempfile
+import unittest
+from unittest import mock
+from LinkGateway.registry import ServiceRegistry
+from LinkGateway.db import ServiceType, ServiceStatus
+
+SERVICE_JSON = {
+    "service_id": "demo-service",
+    "service_name": "演示服务",
+    "version": "1.0.0",
+    "description": "演示",
+    "database": {"type": "sqlite", "name": "demo"},
+    "apis": []
+}
+
+class TestServiceRegistry(unittest.TestCase):
+    """测试服务注册中心"""
+
+    def setUp(self):
+        """设置测试环境"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_path = self.temp_dir.name
+        self.registry = ServiceRegistry(self.base_path)
+
+    def tearDown(self):
+        """清理测试环境"""
+        self.registry.db_manager.engine.dispose()
+        self.temp_dir.cleanup()
+
+    def _write_service(self, dir_name, service_json):
+        service_dir = os.path.join(self.base_path, "services", dir_name)
+        os.makedirs(service_dir, exist_ok=True)
+        with open(os.path.join(service_dir, "service.json"), "w", encoding="utf-8") as f:
+            json.dump(service_json, f, ensure_ascii=False)
+        return service_dir
+
+    def test_bulk_upsert_services_inserts_and_updates(self):
+        """测试批量写入时新增不存在的服务并只更新提供的字段"""
+        db_manager = self.registry.db_manager
+        rows = [
+            {"service_id": sid, "service_name": sid, "service_type": ServiceType.BUSINESS,
+             "version": "1.0.0", "status": ServiceStatus.VALID}
+            for sid in ("a", "b")
+        ]
+        self.assertTrue(db_manager.bulk_upsert_services(rows))
+        db_manager.update_service_status("a", ServiceStatus.INVALID, "broken")
+        self.assertTrue(db_manager.bulk_upsert_services([
+            {"service_id": "a", "service_name": "A", "service_type": ServiceType.BUSINESS,
+             "version": "2.0.0", "status": ServiceStatus.VALID}
+        ]))
+        service = db_manager.get_service("a")
+        self.assertEqual((service.service_name, service.version, service.status), ("A", "2.0.0", ServiceStatus.VALID))
+        self.assertEqual(service.reason, "broken")
+        self.assertEqual(len(db_manager.list_services()), 2)
+
+    def test_bulk_update_status_updates_existing_services(self):
+        """测试批量更新状态只更新已存在的服务并记录检查时间"""
+        db_manager = self.registry.db_manager
+        db_manager.bulk_upsert_services([
+            {"service_id": "a", "service_name": "a", "service_type": ServiceType.BUSINESS,
+             "version": "1.0.0", "status": ServiceStatus.VALID}
+        ])
+        self.assertTrue(db_manager.bulk_update_status([
+            ("a", ServiceStatus.INVALID, "broken"),
+            ("missing", ServiceStatus.INVALID, "broken")
+        ]))
+        service = db_manager.get_service("a")
+        self.assertEqual((service.status, service.reason), (ServiceStatus.INVALID, "broken"))
+        self.assertIsNotNone(service.last_check_at)
+        self.assertIsNone(db_manager.get_service("missing"))
+
+    def test_discover_batches_invalid_status_updates(self):
+        """测试服务发现期间的无效状态在结束后批量写入数据库"""
+        self._write_service("demo", SERVICE_JSON)
+        self.registry.discover_services()
+        self._write_service("demo", dict(SERVICE_JSON, database={}))
+        with mock.patch.object(self.registry.db_manager, "update_service_status") as update_status:
+            result = self.registry.discover_services()
+        update_status.assert_not_called()
+        self.assertEqual(result["summary"]["businesses"]["invalid"], 1)
+        self.assertEqual(self.registry._pending_status_updates, [])
+        service = self.registry.db_manager.get_service("demo-service")
+        self.assertEqual(service.status, ServiceStatus.INVALID)
+        self.assertEqual(service.reason, result["businesses"][0]["reason"])
+
+    def test_discover_writes_services_in_one_batch(self):
+        """测试服务发现结束后一次性写入数据库，重复发现时更新已有记录"""
+        self._write_service("demo", SERVICE_JSON)
+        result = self.registry.discover_services()
+        self.assertEqual(result["summary"]["businesses"]["valid"], 1)
+        self.assertEqual(self.registry._pending_db_writes, [])
+        service = self.registry.db_manager.get_service("demo-service")
+        self.assertEqual(service.status, ServiceStatus.VALID)
+        self.assertEqual(json.loads(service.database_config), SERVICE_JSON["database"])
+
+        self._write_service("demo", dict(SERVICE_JSON, version="1.1.0"))
+        self.registry.discover_services()
+        self.assertEqual(self.registry.db_manager.get_service("demo-service").version, "1.1.0")
+        self.assertEqual(len(self.registry.db_manager.list_services()), 1)
+
+    def test_services_loaded_from_database_rows(self):
+        """测试新建注册中心时从数据库元组记录恢复服务信息"""
+        service_dir = self._write_service("demo", SERVICE_JSON)
+        self.registry.discover_services()
+        self.registry.db_manager.engine.dispose()
+
+        registry = ServiceRegistry(self.base_path)
+        try:
+            service = registry.get_service("demo-service")
+            self.assertEqual(service["type"], "business")
+            info = service["info"]
+            self.assertEqual(info["status"], "valid")
+            self.assertEqual(info["database"], SERVICE_JSON["database"])
+            self.assertEqual(info["apis"], [])
+            self.assertEqual(info["business_path"], service_dir)
+            self.assertIs(registry.get_business("demo-service"), info)
+            # 从数据库读取的服务ID与版本号已驻留
+            self.assertIs(info["service_id"], sys.intern("demo-service"))
+            self.assertIs(info["version"], sys.intern("1.0.0"))
+        finally:
+            registry.db_manager.engine.dispose()
+
+    def test_iter_dirs_matches_os_walk(self):
+        """测试目录遍历与 os.walk 的顺序和文件列表一致"""
+        self._write_service("a", SERVICE_JSON)
+        nested = os.path.join(self.base_path, "services", "b", "c")
+        os.makedirs(nested)
+        open(os.path.join(nested, "x.py"), "w").close()
+        services_dir = os.path.join(self.base_path, "services")
+        expected = [(root, sorted(files)) for root, _, files in os.walk(services_dir)]
+        actual = [(root, sorted(files)) for root, files in ServiceRegistry._iter_dirs(services_dir)]
+        self.assertEqual(sorted(actual), sorted(expected))
+
+    def test_iter_dirs_prunes_service_and_skipped_dirs(self):
+        """测试遍历时不进入服务目录内部、隐藏目录和缓存目录"""
+        service_dir = self._write_service("group/a", SERVICE_JSON)
+        self._write_service("group/a/inner", SERVICE_JSON)
+        for name in (".git", "__pycache__", "node_modules"):
+            os.makedirs(os.path.join(self.base_path, "services", name))
+        services_dir = os.path.join(self.base_path, "services")
+        visited = [root for root, _ in ServiceRegistry._iter_dirs(services_dir, stop_at="service.json")]
+        self.assertEqual(visited, [services_dir, os.path.join(services_dir, "group"), service_dir])
+
+    def test_is_engine_file_cached_by_mtime(self):
+        """测试引擎文件识别结果按修改时间缓存，文件修改后重新识别"""
+        file_path = os.path.join(self.base_path, "demo_engine.py")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("from BaseEngine.base import BaseEngine\n\nclass Demo(BaseEngine):\n    pass\n")
+        self.assertTrue(self.registry._is_engine_file(file_path))
+
+        with mock.patch("builtins.open", side_effect=AssertionError("不应重新读取文件")):
+            self.assertTrue(self.registry._is_engine_file(file_path))
+
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("x = 1\n")
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertFalse(self.registry._is_engine_file(file_path))
+
+    def test_is_engine_file_reads_only_prefix(self):
+        """测试只在文件开头查找引擎类定义"""
+        file_path = os.path.join(self.base_path, "late_engine.py")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("#" * ServiceRegistry.ENGINE_SNIFF_BYTES + "\nclass Demo(BaseEngine):\n    pass\n")
+        self.assertFalse(self.registry._is_engine_file(file_path))
+
+    def test_engine_module_cached_by_mtime(self):
+        """测试引擎文件未修改时复用已执行的模块，修改后重新执行"""
+        file_path = os.path.join(self.base_path, "cached_engine.py")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("VALUE = 1\n")
+        self.addCleanup(sys.modules.pop, "cached-engine-test", None)
+
+        module = self.registry._load_engine_module("cached-engine-test", file_path)
+        self.assertEqual(module.VALUE, 1)
+        self.assertIs(sys.modules["cached-engine-test"], module)
+        self.assertIs(self.registry._load_engine_module("cached-engine-test", file_path), module)
+
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("VALUE = 2\n")
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        reloaded = self.registry._load_engine_module("cached-engine-test", file_path)
+        self.assertIsNot(reloaded, module)
+        self.assertEqual(reloaded.VALUE, 2)
+        self.assertIs(sys.modules["cached-engine-test"], reloaded)
+
+    def test_engine_module_failure_not_registered(self):
+        """测试模块执行失败时不留在 sys.modules 中"""
+        file_path = os.path.join(self.base_path, "broken_engine.py")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write("raise RuntimeError('boom')\n")
+        with self.assertRaises(RuntimeError):
+            self.registry._load_engine_module("broken-engine-test", file_path)
+        self.assertNotIn("broken-engine-test", sys.modules)
+        self.assertNotIn(file_path, self.registry._module_cache)
+
+    def test_engine_class_found_from_new_subclasses(self):
+        """测试引擎类取自模块执行时新定义的 BaseEngine 子类"""
+        file_path = os.path.join(self.base_path, "subclass_engine.py")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(
+                "from BaseEngine.base import BaseEngine\n"
+                "class Other(BaseEngine):\n    pass\n"
+                "class Demo(Other):\n    pass\n"
+            )
+        self.addCleanup(sys.modules.pop, "subclass-engine-test", None)
+        module = self.registry._load_engine_module("subclass-engine-test", file_path)
+        candidates = self.registry._engine_class_candidates[file_path]
+        self.assertEqual(candidates, [module.Other])
+        self.assertIs(self.registry._find_engine_class(module, "subclass-engine-test", candidates), module.Other)
+        # 没有候选类时退回扫描模块属性
+        self.assertIs(self.registry._find_engine_class(module, "subclass-engine-test"), module.Other)
+
+    def test_process_engines_keeps_order_when_threads_do_not_run(self):
+        """测试并行处理引擎时结果与任务顺序一致，工作线程未运行时由调用线程处理全部引擎"""
+        tasks = [(f"engine{i}", f"/engines/engine{i}.py", f"/engines/engine{i}.json") for i in range(5)]
+        processed = []
+
+        def fake_process(engine_name, engine_file, engine_json_path):
+            processed.append(engine_name)
+            return {"service_id": engine_name}
+
+        with mock.patch.object(self.registry, "_process_engine", side_effect=fake_process):
+            results = self.registry._process_engines(tasks)
+            self.assertEqual([r["service_id"] for r in results], [t[0] for t in tasks])
+            with mock.patch("LinkGateway.registry.threading.Thread"):
+                processed.clear()
+                results = self.registry._process_engines(tasks)
+        self.assertEqual(sorted(processed), [t[0] for t in tasks])
+        self.assertEqual([r["service_id"] for r in results], [t[0] for t in tasks])
+
+    def test_find_config_file_respects_pattern_priority(self):
+        """测试查找配置文件时按模式优先级匹配，没有匹配时退回任意JSON文件"""
+        patterns = ["{name}.json", "engine.json"]
+        find = self.registry._find_config_file
+        self.assertEqual(find("/d", "demo", patterns, ["a.json", "engine.json", "demo.json"]), os.path.join("/d", "demo.json"))
+        self.assertEqual(find("/d", "demo", patterns, ["a.json", "engine.json"]), os.path.join("/d", "engine.json"))
+        self.assertEqual(find("/d", "demo", patterns, ["a.py", "b.json"]), os.path.join("/d", "b.json"))
+        self.assertIsNone(find("/d", "demo", patterns, ["a.py"]))
+
+        engine_dir = os.path.join(self.base_path, "demo")
+        os.makedirs(os.path.join(engine_dir, "sub.json"))
+        open(os.path.join(engine_dir, "engine.json"), "w").close()
+        self.assertEqual(find(engine_dir, "demo", patterns), os.path.join(engine_dir, "engine.json"))
+
+    def test_service_validation_cached_by_content(self):
+        """测试 service.json 内容未变化时不重复验证，内容变化后重新验证"""
+        self._write_service("demo", SERVICE_JSON)
+        with mock.patch("LinkGateway.registry.ServiceStandard.validate_service_json",
+                        return_value={"valid": True}) as validate:
+            self.registry.discover_services()
+            self.registry.discover_services()
+            self.assertEqual(validate.call_count, 1)
+
+            self._write_service("demo", dict(SERVICE_JSON, version="1.1.0"))
+            self.registry.discover_services()
+            self.assertEqual(validate.call_count, 2)
+
+    def test_list_services_includes_database_info(self):
+        """测试列出服务时附带数据库中的状态与路径信息"""
+        service_dir = self._write_service("demo", SERVICE_JSON)
+        self.registry.discover_services()
+        services = self.registry.list_services("business")
+        self.assertEqual(len(services), 1)
+        database_info = services[0]["database_info"]
+        self.assertEqual(database_info["status"], "valid")
+        self.assertEqual(database_info["business_path"], service_dir)
+        self.assertIsNone(database_info["last_check_at"])
+        self.assertEqual(services[0]["info"]["business_path"], service_dir)
+        self.assertEqual(self.registry.list_services("engine"), [])
+
+    def test_health_and_listing_query_database_once(self):
+        """测试列出服务与健康检查各只查询一次数据库"""
+        self._write_service("demo", SERVICE_JSON)
+        self.registry.discover_services()
+        self.registry.db_manager.bulk_upsert_services([
+            {"service_id": "orphan", "service_name": "orphan", "service_type": ServiceType.BUSINESS,
+             "version": "1.0.0", "status": ServiceStatus.INVALID, "reason": "gone"}
+        ])
+        self.registry.businesses["demo-service"]["status"] = "invalid"
+        db_manager = self.registry.db_manager
+        with mock.patch.object(db_manager, "get_service", side_effect=AssertionError("不应逐个查询")), \
+                mock.patch.object(db_manager, "list_services", wraps=db_manager.list_services) as list_services:
+            health = self.registry.check_all_services_health()
+            self.assertEqual(list_services.call_count, 1)
+            self.assertEqual(len(self.registry.list_services()), 1)
+            self.assertEqual(list_services.call_count, 2)
+        self.assertEqual(health["healthy"], ["demo-service"])
+        self.assertEqual(health["unhealthy"], [{"service_id": "orphan", "reason": "gone"}])
+
+    def test_prewarm_engine_bytecode_compiles_engines_dir(self):
+        """测试在后台线程中预编译引擎目录"""
+        self.assertIsNone(self.registry._prewarm_engine_bytecode())
+        engine_dir = os.path.join(self.registry.engines_dir, "demo")
+        os.makedirs(engine_dir)
+        with open(os.path.join(engine_dir, "demo.py"), "w", encoding="utf-8") as f:
+            f.write("VALUE = 1\n")
+        with mock.patch.object(sys, "dont_write_bytecode", False):
+            thread = self.registry._prewarm_engine_bytecode()
+        thread.join(timeout=10)
+        self.assertTrue(os.path.isdir(os.path.join(engine_dir, "__pycache__")))
+
+    def test_defines_engine_class_checks_class_bases(self):
+        """测试按类的基类判断引擎文件，注释和文档字符串中的 BaseEngine 不算"""
+        check = ServiceRegistry._defines_engine_class
+        self.assertTrue(check(b"from BaseEngine import BaseEngine\nclass A(BaseEngine):\n    pass\n", False))
+        self.assertTrue(check(b"import BaseEngine.base as base\nclass A( base.BaseEngine ):\n    pass\n", False))
+        self.assertFalse(check(b'"""Uses BaseEngine."""\n# class BaseEngine\nclass A(object):\n    pass\n', False))
+        # 截断的源码只保留最后一个类定义的头部
+        self.assertTrue(check(b"import os\nclass A(BaseEngine):\n    def run(self):\n        return (1,", True))
+        self.assertFalse(check(b"import os\nclass A(object):\n    x = 'BaseEngine'\n    y = (", True))
+
+    def _age_tree(self, seconds=10):
+        """将服务和引擎目录下所有文件与目录的修改时间提前"""
+        for root in (self.registry.services_dir, self.registry.engines_dir):
+            for path, dirs, files in os.walk(root):
+                for name in dirs + files + [""]:
+                    target = os.path.join(path, name) if name else path
+                    stat = os.stat(target)
+                    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+    def test_discover_reuses_result_when_nothing_changed(self):
+        """测试目录与服务均未变化时复用上次的发现结果，变化后重新发现"""
+        self._write_service("demo", SERVICE_JSON)
+        os.makedirs(self.registry.engines_dir)
+        self._age_tree()
+        first = self.registry.discover_services()
+        with mock.patch.object(self.registry, "discover_businesses") as discover_businesses:
+            reused = self.registry.discover_services()
+            self.assertEqual(reused, first)
+            discover_businesses.assert_not_called()
+            # 修改返回的结果不影响下次复用
+            reused["businesses"].clear()
+            first["businesses"][0]["status"] = "invalid"
+            self.assertEqual(self.registry.discover_services()["businesses"][0]["status"], "valid")
+
+            # 服务状态变化后重新发现
+            self.registry.update_service_health("demo-service", False, "down")
+            discover_businesses.return_value = []
+            self.assertIsNot(self.registry.discover_services(), first)
+            self.assertEqual(discover_businesses.call_count, 1)
+
+        second = self.registry.discover_services()
+        with mock.patch.object(self.registry, "discover_businesses") as discover_businesses:
+            self.assertEqual(self.registry.discover_services(), second)
+            discover_businesses.assert_not_called()
+        with mock.patch.object(self.registry, "discover_businesses", return_value=[]) as discover_businesses:
+            self.registry.discover_services(force=True)
+            discover_businesses.assert_called_once()
+
+        # 目录内容变化后重新发现；刚修改的文件不计算指纹
+        self._write_service("demo", dict(SERVICE_JSON, version="1.1.0"))
+        self.assertIsNone(self.registry._discovery_fingerprint())
+        self.registry.discover_services()
+        self.assertEqual(self.registry.get_business("demo-service")["version"], "1.1.0")
+
+    def test_discover_reuses_result_after_bytecode_written(self):
+        """测试引擎目录下生成 __pycache__ 不影响复用，新增文件后重新发现"""
+        engine_dir = os.path.join(self.registry.engines_dir, "DemoEngine")
+        os.makedirs(engine_dir)
+        self._age_tree()
+        self.registry.discover_services()
+        # 模拟导入或预编译引擎时写入字节码缓存，引擎目录自身的修改时间随之变化
+        os.makedirs(os.path.join(engine_dir, "__pycache__"))
+        with mock.patch.object(self.registry, "discover_engines") as discover_engines:
+            self.registry.discover_services()
+            discover_engines.assert_not_called()
+
+        with open(os.path.join(engine_dir, "README.md"), "w", encoding="utf-8") as f:
+            f.write("demo")
+        self._age_tree()
+        with mock.patch.object(self.registry, "discover_engines", return_value=[]) as discover_engines:
+            self.registry.discover_services()
+            discover_engines.assert_called_once()
+
+    def test_is_service_allowed_caches_service_types(self):
+        """测试服务间调用鉴权缓存服务类型，过期或注销后重新查询"""
+        self.registry.db_manager.bulk_upsert_services([
+            {"service_id": sid, "service_name": sid, "service_type": service_type,
+             "version": "1.0.0", "status": ServiceStatus.VALID}
+            for sid, service_type in (("biz", ServiceType.BUSINESS), ("e1", ServiceType.ENGINE), ("e2", ServiceType.ENGINE))
+        ])
+        db_manager = self.registry.db_manager
+        with mock.patch.object(db_manager, "get_service", wraps=db_manager.get_service) as get_service:
+            self.assertTrue(self.registry.is_service_allowed("biz", "e1"))
+            self.assertFalse(self.registry.is_service_allowed("e1", "e2"))
+            self.assertTrue(self.registry.is_service_allowed("biz", "e1"))
+            self.assertEqual(get_service.call_count, 3)
+
+            self.assertFalse(self.registry.is_service_allowed("biz", "missing"))
+            self.assertFalse(self.registry.is_service_allowed("biz", "missing"))
+            self.assertEqual(get_service.call_count, 5)
+
+            self.registry.unregister_service("e1")
+            self.assertFalse(self.registry.is_service_allowed("biz", "e1"))
+            self.assertEqual(get_service.call_count, 6)
+
+            with mock.patch("LinkGateway.registry.time.monotonic", return_value=time.monotonic() + ServiceRegistry.SERVICE_TYPE_TTL + 1):
+                self.assertTrue(self.registry.is_service_allowed("biz", "e2"))
+            self.assertEqual(get_service.call_count, 8)
+
+    def test_list_services_iterates_snapshot(self):
+        """测试列出服务时注销其他服务不会中断遍历"""
+        for sid in ("a", "b", "c"):
+            self.registry.services[sid] = {"type": "business", "info": {"service_id": sid}}
+
+        class RemovingLookup(dict):
+            def get(inner, service_id, default=None):
+                self.registry.unregister_service("c" if service_id == "a" else "a")
+                return default
+
+        with mock.patch.object(self.registry, "_get_db_services_by_id", return_value=RemovingLookup()):
+            services = self.registry.list_services()
+        self.assertEqual([service["service_id"] for service in services], ["a", "b", "c"])
+        self.assertEqual(list(self.registry.services), ["b"])
+
+if __name__ == "__main__":
+    unittest.main()